@@ -1 +1,12 @@
-from .base_watcher import BaseWatcher
\ No newline at end of file
+from .base_watcher import BaseWatcher
+
+
+def __getattr__(name):
+    # The asyncio-based classes load on first use, so plain watchers skip asyncio
+    if name == 'AsyncBaseWatcher':
+        from .async_base_watcher import AsyncBaseWatcher
+        return AsyncBaseWatcher
+    if name == 'WatcherScheduler':
+        from .scheduler import WatcherScheduler
+        return WatcherScheduler
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
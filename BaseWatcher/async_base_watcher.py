@@ -0,0 +1,161 @@
+"""
+Async Base Watcher for Digital FTE
+
+Asyncio-native variant of BaseWatcher. Subclasses implement coroutine
+hooks so that several watchers can share one event loop (see
+WatcherScheduler) instead of each needing its own interpreter.
+
+Usage:
+    class MyWatcher(AsyncBaseWatcher):
+        async def check_for_updates(self) -> list:
+            # Return list of new items to process
+            pass
+
+        async def create_action_file(self, item) -> Path:
+            # Create .md file in Needs_Action folder
+            pass
+"""
+
+import asyncio
+import time
+from abc import abstractmethod
+from pathlib import Path
+from typing import Any, List, Optional
+
+from .base_watcher import BaseWatcher
+
+
+class AsyncBaseWatcher(BaseWatcher):
+    """
+    Abstract base class for watchers with asynchronous sources.
+
+    Items found in one cycle are written concurrently, so a slow
+    create_action_file for one item does not hold up the others.
+    """
+
+    @abstractmethod
+    async def check_for_updates(self) -> List[Any]:
+        """
+        Check for new items to process.
+
+        Returns:
+            List of new items (emails, messages, files, etc.)
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__}.check_for_updates() must be implemented"
+        )
+
+    @abstractmethod
+    async def create_action_file(self, item: Any) -> Optional[Path]:
+        """
+        Create a markdown action file for an item.
+
+        Args:
+            item: The item to create an action file for
+
+        Returns:
+            Path to the created file, or None if creation failed
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__}.create_action_file() must be implemented"
+        )
+
+    async def setup_async(self) -> None:
+        """Prepare the watcher before its first check cycle."""
+
+    async def teardown_async(self) -> None:
+        """Release resources acquired in setup_async()."""
+
+    async def _process_item(self, item: Any) -> None:
+        """
+        Create the action file for a single item, logging any failure.
+
+        Args:
+            item: The item to process
+        """
+        if self.dry_run:
+            self.logger.info(f"[DRY RUN] Would process item")
+            return
+
+        started = time.perf_counter()
+        try:
+            filepath = await self.create_action_file(item)
+            if filepath:
+                self.metrics.inc('items_written')
+                self.logger.info(f"Created action file: {filepath}")
+        except Exception as e:
+            self.metrics.inc('errors')
+            self.logger.error(f"Error creating action file: {e}", exc_info=True)
+        finally:
+            self.metrics.observe('write_duration_seconds', time.perf_counter() - started)
+
+    async def run_once_async(self) -> int:
+        """
+        Run a single check cycle on the current event loop.
+
+        Returns:
+            Number of new items found in this cycle
+        """
+        started = time.perf_counter()
+        try:
+            items = await self.check_for_updates()
+            self.metrics.observe('check_duration_seconds', time.perf_counter() - started)
+            self.metrics.inc('items_found', len(items) if items else 0)
+            items = list(self._apply_backpressure(items or []))
+
+            if not items:
+                self.logger.debug("No new items found")
+                return 0
+
+            self.logger.info(f"Found {len(items)} new item(s)")
+            await asyncio.gather(*(self._process_item(item) for item in items))
+
+            return len(items)
+        except Exception:
+            self.metrics.inc('errors')
+            raise
+        finally:
+            self._record_cycle(started)
+
+    def run_once(self) -> int:
+        """
+        Run a single check cycle from synchronous code.
+
+        Returns:
+            Number of new items found in this cycle
+        """
+        return asyncio.run(self.run_once_async())
+
+    async def run_async(self) -> None:
+        """
+        Main run loop for the watcher as a coroutine.
+
+        Runs until cancelled.
+        """
+        self.logger.info(f"Starting {self.__class__.__name__}")
+        self.logger.info(f"Vault path: {self.vault_path}")
+        self.logger.info(f"Check interval: {self.poll_schedule.describe()}")
+        self.logger.info(f"Dry run mode: {self.dry_run}")
+
+        await self.setup_async()
+        try:
+            while True:
+                found = 0
+                try:
+                    found = await self.run_once_async()
+                except Exception as e:
+                    self.logger.error(f"Error processing items: {e}", exc_info=True)
+
+                # Wait before next check
+                await asyncio.sleep(self.poll_schedule.next_delay(found))
+        finally:
+            await self.teardown_async()
+
+    def run(self) -> None:
+        """
+        Run the watcher on its own event loop until interrupted (Ctrl+C).
+        """
+        try:
+            asyncio.run(self.run_async())
+        except KeyboardInterrupt:
+            self.logger.info(f"{self.__class__.__name__} stopped by user")
@@ -0,0 +1,251 @@
+"""
+Non-blocking daily log files for Digital FTE watchers.
+
+Log records are handed to a QueueHandler on the hot path and written by a
+background QueueListener thread. The writer batches records and flushes
+whenever the queue drains (or every FLUSH_EVERY records under sustained
+load). It switches files when the record's local date changes and
+optionally gzips the finished day.
+
+Used for both the human-readable watcher_YYYY-MM-DD.log and the
+machine-readable audit-YYYY-MM-DD.jsonl trail required by
+Company_Handbook.md ("Every action must be logged with timestamp,
+actor, and outcome").
+"""
+
+import atexit
+import gzip
+import hashlib
+import json
+import logging
+import os
+import queue
+import shutil
+import threading
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+from typing import Dict, IO, Optional, Tuple
+
+
+def compress_file(path: Path) -> Optional[Path]:
+    """
+    Gzip a finished log file in place (``x.jsonl`` -> ``x.jsonl.gz``).
+
+    Args:
+        path: File to compress
+
+    Returns:
+        Path to the compressed file, or None if there was nothing to do
+    """
+    if not path.exists():
+        return None
+
+    gz_path = path.with_name(path.name + '.gz')
+    tmp_path = gz_path.with_name(gz_path.name + '.tmp')
+    with open(path, 'rb') as src, gzip.open(tmp_path, 'wb') as dst:
+        shutil.copyfileobj(src, dst)
+    os.replace(tmp_path, gz_path)
+    path.unlink()
+    return gz_path
+
+
+class DailyFileHandler(logging.Handler):
+    """
+    Buffered handler writing to one file per local calendar day.
+
+    Attributes:
+        directory: Folder the daily files live in
+        pattern: File name pattern containing '{date}' (YYYY-MM-DD)
+        compress: Gzip a day's file once the date rolls over
+    """
+
+    # Flush at least this often under sustained load
+    FLUSH_EVERY = 100
+
+    def __init__(self, directory: Path, pattern: str, compress: bool = False):
+        """
+        Initialize the handler.
+
+        Args:
+            directory: Folder for the daily files
+            pattern: File name pattern, e.g. 'audit-{date}.jsonl'
+            compress: Gzip previous days' files
+        """
+        super().__init__()
+        self.directory = Path(directory)
+        self.pattern = pattern
+        self.compress = compress
+
+        self._date: Optional[str] = None
+        self._stream: Optional[IO[str]] = None
+        self._pending = 0
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        if self.compress:
+            self._compress_stale()
+
+    def _path_for(self, date: str) -> Path:
+        return self.directory / self.pattern.format(date=date)
+
+    def _compress_stale(self) -> None:
+        """Compress files left over from earlier days (e.g. after downtime)."""
+        today = self._path_for(datetime.now().strftime('%Y-%m-%d'))
+        prefix, _, suffix = self.pattern.partition('{date}')
+        for path in self.directory.glob(f'{prefix}*{suffix}'):
+            if path != today:
+                try:
+                    compress_file(path)
+                except OSError:
+                    pass
+
+    def _rollover(self, date: str) -> None:
+        """Close the current day's file and open the file for date."""
+        previous = self._path_for(self._date) if self._date else None
+        if self._stream:
+            self._stream.close()
+
+        self._date = date
+        self._stream = open(self._path_for(date), 'a', encoding='utf-8', buffering=64 * 1024)
+        self._pending = 0
+
+        if self.compress and previous is not None:
+            try:
+                compress_file(previous)
+            except OSError:
+                # Retried by _compress_stale() on the next start
+                pass
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            date = datetime.fromtimestamp(record.created).strftime('%Y-%m-%d')
+            if date != self._date:
+                self._rollover(date)
+
+            self._stream.write(self.format(record) + '\n')
+            self._pending += 1
+            if self._pending >= self.FLUSH_EVERY:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        with self.lock:
+            if self._stream and self._pending:
+                self._stream.flush()
+                self._pending = 0
+
+    def close(self) -> None:
+        with self.lock:
+            if self._stream:
+                self._stream.flush()
+                self._stream.close()
+                self._stream = None
+        super().close()
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Formats the record's ``audit`` dict (passed via ``extra``) as one JSON line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = getattr(record, 'audit', None)
+        if entry is None:
+            entry = {
+                'timestamp': datetime.fromtimestamp(record.created).isoformat(),
+                'message': record.getMessage(),
+            }
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class BatchingQueueListener(QueueListener):
+    """
+    QueueListener that flushes its handlers each time the queue drains.
+
+    Bursts are written with one flush at the end instead of one per
+    record, and nothing sits in the buffer while the system is idle.
+    """
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        try:
+            return self.queue.get_nowait()
+        except queue.Empty:
+            for handler in self.handlers:
+                handler.flush()
+            return self.queue.get(block)
+
+
+_listeners: Dict[Tuple[str, str], Tuple[QueueHandler, QueueListener]] = {}
+_listeners_lock = threading.Lock()
+
+
+def get_queue_handler(
+    directory: Path,
+    pattern: str,
+    formatter: logging.Formatter,
+    compress: bool = False
+) -> QueueHandler:
+    """
+    Get the process-wide QueueHandler writing to a daily file set.
+
+    The first call for a (directory, pattern) pair starts its background
+    writer thread; later calls (other watchers, restarts) reuse it.
+
+    Args:
+        directory: Folder for the daily files
+        pattern: File name pattern containing '{date}'
+        formatter: Formatter applied on the writer thread
+        compress: Gzip previous days' files
+
+    Returns:
+        QueueHandler to attach to a logger
+    """
+    key = (str(Path(directory).resolve()), pattern)
+    with _listeners_lock:
+        if key not in _listeners:
+            file_handler = DailyFileHandler(directory, pattern, compress=compress)
+            file_handler.setFormatter(formatter)
+
+            log_queue: queue.Queue = queue.Queue()
+            queue_handler = QueueHandler(log_queue)
+            listener = BatchingQueueListener(log_queue, file_handler, respect_handler_level=True)
+            listener.start()
+
+            _listeners[key] = (queue_handler, listener)
+        return _listeners[key][0]
+
+
+def vault_logger(name: str, vault_path: Path) -> logging.Logger:
+    """
+    Get a logger for one watcher class writing to one vault.
+
+    Handlers are attached per vault, so two watchers of the same class
+    on different vaults in one process (host mode, tests) each log to
+    their own /Logs. The logger is a child of name, keyed by the vault
+    path, but its records are still reported under name.
+
+    Args:
+        name: Logger name shown in records (e.g. 'GmailWatcher')
+        vault_path: The watcher's vault
+
+    Returns:
+        Logger for this (name, vault) pair; new ones have no handlers yet
+    """
+    key = hashlib.sha1(str(Path(vault_path).resolve()).encode('utf-8')).hexdigest()[:12]
+    logger = logging.getLogger(name).getChild(key)
+    if not logger.filters:
+        def report_as_parent(record: logging.LogRecord) -> bool:
+            record.name = name
+            return True
+        logger.addFilter(report_as_parent)
+    return logger
+
+
+@atexit.register
+def stop_listeners() -> None:
+    """Drain every queue and close the files (runs at interpreter exit)."""
+    with _listeners_lock:
+        for _, listener in _listeners.values():
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+        _listeners.clear()
@@ -0,0 +1,142 @@
+"""
+Backpressure between watchers and the /Needs_Action queue.
+
+BacklogGauge counts pending action files without globbing on every
+call: the count is cached against the folder's mtime, which changes
+whenever an entry is added or removed, so a steady folder costs one
+stat(). HoldingQueue keeps items deferred while the backlog is over
+its threshold, deduplicated by key, until the backlog recovers.
+"""
+
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, List, Optional, Tuple
+
+
+class BacklogGauge:
+    """
+    Cheap counter of action files waiting in a folder.
+
+    Attributes:
+        folder: Folder whose pending files are counted
+        suffix: Only names ending with this count (action files are .md)
+        max_age: Recount at least this often, for filesystems with coarse mtimes
+    """
+
+    def __init__(self, folder: Path, suffix: str = '.md', max_age: float = 30.0):
+        """
+        Initialize the gauge.
+
+        Args:
+            folder: Folder to count
+            suffix: File name suffix to count
+            max_age: Seconds after which the cached count is refreshed anyway
+        """
+        self.folder = Path(folder)
+        self.suffix = suffix
+        self.max_age = max_age
+
+        self._mtime_ns: Optional[int] = None
+        self._counted_at = 0.0
+        self._count = 0
+
+    def count(self) -> int:
+        """
+        Get the number of pending files, rescanning only when the folder changed.
+
+        Returns:
+            Number of matching files
+        """
+        try:
+            mtime_ns = os.stat(self.folder).st_mtime_ns
+        except OSError:
+            return 0
+
+        now = time.monotonic()
+        if mtime_ns != self._mtime_ns or now - self._counted_at > self.max_age:
+            with os.scandir(self.folder) as entries:
+                self._count = sum(
+                    1 for entry in entries
+                    if entry.name.endswith(self.suffix) and not entry.name.startswith('.')
+                )
+            self._mtime_ns = mtime_ns
+            self._counted_at = now
+        return self._count
+
+
+class HoldingQueue:
+    """
+    Bounded FIFO of deferred items, deduplicated by item key.
+
+    Attributes:
+        max_items: Oldest items are dropped beyond this size
+    """
+
+    def __init__(self, max_items: int = 1000):
+        """
+        Initialize an empty queue.
+
+        Args:
+            max_items: Maximum number of held items
+        """
+        self.max_items = max_items
+        self._items: 'OrderedDict[str, Any]' = OrderedDict()
+
+    def add(self, key: str, item: Any) -> Optional[Tuple[str, Any]]:
+        """
+        Hold an item (no-op if an item with the same key is already held).
+
+        Args:
+            key: Stable item key
+            item: Item to hold
+
+        Returns:
+            The (key, item) dropped to make room, if any
+        """
+        if key in self._items:
+            return None
+        self._items[key] = item
+        if len(self._items) > self.max_items:
+            return self._items.popitem(last=False)
+        return None
+
+    def discard(self, key: str) -> None:
+        """
+        Forget a held item (e.g. because the source delivered it again).
+
+        Args:
+            key: Item key
+        """
+        self._items.pop(key, None)
+
+    def drain(self, limit: int) -> List[Any]:
+        """
+        Release the oldest held items.
+
+        Args:
+            limit: Maximum number of items to release
+
+        Returns:
+            Released items, oldest first
+        """
+        released = []
+        while self._items and len(released) < limit:
+            released.append(self._items.popitem(last=False)[1])
+        return released
+
+    def keys(self) -> List[str]:
+        """
+        Get the keys of the held items.
+
+        Returns:
+            Item keys, oldest first
+        """
+        return list(self._items)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
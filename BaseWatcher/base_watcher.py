@@ -18,10 +18,19 @@ Usage:
 
 import logging
 import sys
+import threading
+import time
 from abc import ABC, abstractmethod
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from .audit_log import JsonLinesFormatter, get_queue_handler, vault_logger
+from .backlog import BacklogGauge, HoldingQueue
+from .metrics import WatcherMetrics, get_metrics, start_metrics_server, write_snapshot
+from .poll_schedule import PollSchedule
+from .priority_classifier import DEFAULT_RULES, PriorityClassifier, load_classifier
+from .processed_store import ProcessedStore
 
 ## Check if dryrun enabled 
 import os 
@@ -34,19 +43,44 @@ class BaseWatcher(ABC):
     Attributes:
         vault_path: Path to the Obsidian vault root
         check_interval: Seconds between checks (default: 60)
+        poll_schedule: Adaptive schedule deciding the delay between checks
+        processed_store: Durable dedup store of processed item keys
+        classifier: Shared keyword priority classifier
+        metrics: Cycle counters and latency histograms for this watcher
+        backlog: Cheap /Needs_Action counter (None when backpressure is off)
+        holding: Items deferred while the backlog is over its threshold
         logger: Configured logger for the watcher
     """
 
-    def __init__(self, vault_path: str, check_interval: int = 60):
+    # Short name used for environment variables and per-watcher state files
+    WATCHER_NAME = 'watcher'
+
+    # Pre-ProcessedStore dedup files in /Logs, migrated on first start
+    LEGACY_PROCESSED_FILES: List[str] = []
+
+    def __init__(
+        self,
+        vault_path: str,
+        check_interval: int = 60,
+        min_interval: Optional[float] = None,
+        max_interval: Optional[float] = None,
+        adaptive: Optional[bool] = None
+    ):
         """
         Initialize the base watcher.
 
         Args:
             vault_path: Path to the Obsidian vault directory
             check_interval: How often to check for updates (in seconds)
+            min_interval: Fastest adaptive interval (default: <NAME>_MIN_INTERVAL env)
+            max_interval: Slowest adaptive interval (default: <NAME>_MAX_INTERVAL env)
+            adaptive: Enable adaptive polling (default: ADAPTIVE_POLLING env)
         """
         self.vault_path = Path(vault_path)
         self.check_interval = check_interval
+        self.poll_schedule = PollSchedule.from_env(
+            self.WATCHER_NAME.upper(), check_interval, min_interval, max_interval, adaptive
+        )
         
         # Folder paths
         self.inbox = self.vault_path / 'Inbox'
@@ -59,9 +93,19 @@ class BaseWatcher(ABC):
         
         # Setup logging
         self.logger = self._setup_logging()
+        self.audit_logger = self._setup_audit_logging()
+
+        # Cycle metrics (optional /metrics endpoint and /Logs snapshot)
+        self.metrics = self._setup_metrics()
         
         # Track processed items to avoid duplicates
-        self.processed_ids: set = set()
+        self.processed_store = self._open_processed_store()
+
+        # Priority rules, compiled once per process
+        self.classifier = self._load_classifier()
+
+        # Backpressure against a growing /Needs_Action backlog
+        self._setup_backpressure()
         
         # Dry run mode (from environment)
         self.dry_run = dry_run
@@ -71,6 +115,222 @@ class BaseWatcher(ABC):
         for folder in [self.inbox, self.needs_action, self.done, self.logs]:
             folder.mkdir(parents=True, exist_ok=True)
 
+    def _open_processed_store(self) -> ProcessedStore:
+        """
+        Open this watcher's dedup store and migrate legacy dedup files.
+
+        Retention comes from <NAME>_PROCESSED_TTL_DAYS (or PROCESSED_TTL_DAYS);
+        unset keeps keys forever.
+
+        Returns:
+            Opened ProcessedStore
+        """
+        prefix = self.WATCHER_NAME.upper()
+        ttl_days = os.getenv(f'{prefix}_PROCESSED_TTL_DAYS', os.getenv('PROCESSED_TTL_DAYS'))
+        store = ProcessedStore(
+            self.logs / f'{self.WATCHER_NAME}_processed.log',
+            ttl_seconds=float(ttl_days) * 86400 if ttl_days else None,
+            fsync=os.getenv('PROCESSED_STORE_FSYNC', 'false').lower() == 'true'
+        )
+
+        for legacy_name in self.LEGACY_PROCESSED_FILES:
+            try:
+                imported = store.migrate(self.logs / legacy_name)
+                if imported:
+                    self.logger.info(f"Migrated {imported} processed keys from {legacy_name}")
+            except Exception as e:
+                self.logger.warning(f"Could not migrate {legacy_name}: {e}")
+
+        self.logger.info(f"Loaded {len(store)} previously processed item(s)")
+        return store
+
+    def _load_classifier(self) -> PriorityClassifier:
+        """
+        Load the vault's priority rules, falling back to the defaults.
+
+        Returns:
+            Compiled priority classifier
+        """
+        try:
+            return load_classifier(self.vault_path)
+        except Exception as e:
+            self.logger.warning(f"Could not load priority rules, using defaults: {e}")
+            return PriorityClassifier(DEFAULT_RULES)
+
+    def _setup_backpressure(self) -> None:
+        """
+        Configure backpressure from the environment.
+
+        <NAME>_BACKLOG_THRESHOLD (or BACKLOG_THRESHOLD) is the number of
+        pending action files at which polling slows to max_interval; unset
+        or 0 disables backpressure. BACKLOG_ADMIT_PRIORITIES (e.g.
+        'critical,high') additionally defers items of any other priority
+        until the backlog recovers. BACKLOG_HOLD_MAX bounds the number of
+        deferred items kept (default 1000).
+        """
+        prefix = self.WATCHER_NAME.upper()
+        threshold = os.getenv(f'{prefix}_BACKLOG_THRESHOLD', os.getenv('BACKLOG_THRESHOLD', '0'))
+        self.backlog_threshold = int(threshold or 0)
+        self.backlog = BacklogGauge(self.needs_action) if self.backlog_threshold > 0 else None
+
+        admit = os.getenv('BACKLOG_ADMIT_PRIORITIES', '')
+        self.admit_priorities = {p.strip().lower() for p in admit.split(',') if p.strip()}
+        self.holding = HoldingQueue(int(os.getenv('BACKLOG_HOLD_MAX', '1000')))
+        self._over_backlog = False
+        # Watchers may admit items from several threads (e.g. filesystem workers)
+        self._backpressure_lock = threading.Lock()
+
+    def item_key(self, item: Any) -> str:
+        """
+        Get a stable key for an item, used to deduplicate held items.
+
+        Args:
+            item: Item returned by check_for_updates
+
+        Returns:
+            The item's 'id' for dictionaries, otherwise str(item)
+        """
+        if isinstance(item, dict) and item.get('id'):
+            return str(item['id'])
+        return str(item)
+
+    def item_priority(self, item: Any) -> str:
+        """
+        Get an item's priority before its action file is written.
+
+        Args:
+            item: Item returned by check_for_updates
+
+        Returns:
+            Priority level: 'critical', 'high', 'normal', or 'low'
+        """
+        if isinstance(item, dict) and item.get('priority'):
+            return item['priority']
+        return self.get_priority(str(item))
+
+    def _apply_backpressure(self, items: Iterable[Any]) -> Iterable[Any]:
+        """
+        Throttle polling and defer items while /Needs_Action is backed up.
+
+        Over the threshold the poll schedule is throttled and, if admit
+        priorities are configured, only those items pass; the rest are
+        held. Once the backlog recovers, held items are released ahead of
+        the cycle's new items, up to the room left under the threshold.
+
+        Items are read one at a time as the caller consumes the result,
+        and each is admitted or deferred (on_deferred) before the next is
+        read. A lazy source that saves its cursor as it goes (Gmail) thus
+        never runs ahead of the action files written for it.
+
+        Args:
+            items: New items from check_for_updates
+
+        Returns:
+            Items to write action files for in this cycle (an iterator
+            when backpressure is on; wrap in list() to count them)
+        """
+        if self.backlog is None:
+            return items
+
+        with self._backpressure_lock:
+            pending = self.backlog.count()
+            over = pending >= self.backlog_threshold
+            self.poll_schedule.throttled = over
+            self.metrics.set_gauge('backlog', pending)
+
+            if over != self._over_backlog:
+                self._over_backlog = over
+                if over:
+                    self.logger.warning(
+                        f"Needs_Action backlog at {pending} (threshold {self.backlog_threshold}), slowing down"
+                    )
+                else:
+                    self.logger.info(f"Needs_Action backlog recovered ({pending}), resuming")
+
+            released = []
+            if not over and len(self.holding):
+                released = self.holding.drain(max(0, self.backlog_threshold - pending))
+                if released:
+                    self.logger.info(f"Released {len(released)} deferred item(s)")
+            self.metrics.set_gauge('held_items', len(self.holding))
+
+        return self._stream_backpressure(items, over, released)
+
+    def _stream_backpressure(self, items: Iterable[Any], over: bool, released: List[Any]) -> Iterator[Any]:
+        """
+        Yield released items, then admit or defer new items one by one.
+
+        Args:
+            items: New items from check_for_updates
+            over: Whether the backlog is over the threshold this cycle
+            released: Held items released this cycle
+
+        Yields:
+            Items to write action files for
+        """
+        yield from released
+        released_keys = {self.item_key(item) for item in released}
+
+        for item in items or ():
+            key = self.item_key(item)
+            if not over:
+                # A re-delivered item is processed once, from the queue or from this cycle
+                with self._backpressure_lock:
+                    self.holding.discard(key)
+                    self.metrics.set_gauge('held_items', len(self.holding))
+                if key not in released_keys:
+                    yield item
+                continue
+
+            if not self.admit_priorities or self.item_priority(item) in self.admit_priorities:
+                yield item
+                continue
+
+            with self._backpressure_lock:
+                dropped = self.holding.add(key, item)
+                self.metrics.set_gauge('held_items', len(self.holding))
+            self.metrics.inc('deferred')
+            if dropped:
+                self.logger.warning(f"Holding queue full, dropped deferred item {dropped[0]}")
+            # Recorded before the source is asked for the next item
+            self.on_deferred([key])
+
+    def on_deferred(self, keys: List[str]) -> None:
+        """
+        Called with the keys of deferred items, as each is deferred.
+
+        The holding queue is in memory and drops its oldest items when
+        full. Sources that will not deliver an item again (e.g. a cursor
+        that has moved past it) override this to remember the keys.
+
+        Args:
+            keys: Keys of the deferred items, including any dropped
+        """
+
+    def is_processed(self, key: str) -> bool:
+        """
+        Check whether an item has already been turned into an action file.
+
+        Args:
+            key: Stable item key (message ID, file hash, ...)
+
+        Returns:
+            True if the item was processed before
+        """
+        if self.processed_store.seen(key):
+            self.metrics.inc('dedup_hits')
+            return True
+        return False
+
+    def mark_processed(self, key: str) -> None:
+        """
+        Durably record an item as processed.
+
+        Args:
+            key: Stable item key (message ID, file hash, ...)
+        """
+        self.processed_store.mark(key)
+
     def _setup_logging(self) -> logging.Logger:
         """
         Configure logging for the watcher.
@@ -78,37 +338,96 @@ class BaseWatcher(ABC):
         Returns:
             Configured logger instance
         """
-        logger = logging.getLogger(self.__class__.__name__)
-        logger.setLevel(logging.INFO)
-        
-        # Console handler
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(logging.INFO)
-        
-        # File handler (daily rotating)
-        log_file = self.logs / f'watcher_{datetime.now().strftime("%Y-%m-%d")}.log'
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setLevel(logging.DEBUG)
-        
-        # Formatter
+        name = self.__class__.__name__
         formatter = logging.Formatter(
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         )
-        console_handler.setFormatter(formatter)
-        file_handler.setFormatter(formatter)
-        
-        logger.addHandler(console_handler)
-        logger.addHandler(file_handler)
-        
+
+        # Console output is shared by every instance of the class
+        console_logger = logging.getLogger(name)
+        console_logger.setLevel(logging.INFO)
+        if not console_logger.handlers:
+            console_handler = logging.StreamHandler(sys.stdout)
+            console_handler.setLevel(logging.INFO)
+            console_handler.setFormatter(formatter)
+            console_logger.addHandler(console_handler)
+
+        # File handler per vault (rotates at midnight, written off the hot path)
+        logger = vault_logger(name, self.vault_path)
+        logger.setLevel(logging.INFO)
+        if not logger.handlers:
+            logger.addHandler(get_queue_handler(self.logs, 'watcher_{date}.log', formatter))
+
         return logger
 
+    def _setup_audit_logging(self) -> logging.Logger:
+        """
+        Configure the structured audit trail (/Logs/audit-YYYY-MM-DD.jsonl).
+
+        Returns:
+            Logger whose records are written as JSON Lines by a background thread
+        """
+        logger = vault_logger(f'audit.{self.__class__.__name__}', self.vault_path)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+
+        if not logger.handlers:
+            logger.addHandler(
+                get_queue_handler(self.logs, 'audit-{date}.jsonl', JsonLinesFormatter(), compress=True)
+            )
+
+        return logger
+
+    def _setup_metrics(self) -> WatcherMetrics:
+        """
+        Get this watcher's metrics and start the endpoint if configured.
+
+        METRICS_PORT enables the Prometheus endpoint (bound to METRICS_HOST,
+        default 127.0.0.1). METRICS_SNAPSHOT_INTERVAL sets how often
+        /Logs/metrics_<name>.json is rewritten (default 60s, 0 disables).
+
+        Returns:
+            Shared WatcherMetrics for WATCHER_NAME
+        """
+        metrics = get_metrics(self.WATCHER_NAME)
+
+        port = os.getenv('METRICS_PORT')
+        if port:
+            host = os.getenv('METRICS_HOST', '127.0.0.1')
+            try:
+                start_metrics_server(int(port), host)
+                self.logger.info(f"Metrics endpoint: http://{host}:{port}/metrics")
+            except (OSError, ValueError) as e:
+                self.logger.warning(f"Could not start metrics endpoint on port {port}: {e}")
+
+        self.snapshot_interval = float(os.getenv('METRICS_SNAPSHOT_INTERVAL', '60'))
+        self.snapshot_path = self.logs / f'metrics_{self.WATCHER_NAME}.json'
+        self._next_snapshot_at = 0.0
+        return metrics
+
+    def _maybe_write_snapshot(self) -> None:
+        """Rewrite the metrics snapshot file if the snapshot interval has elapsed."""
+        if self.snapshot_interval <= 0:
+            return
+        now = time.monotonic()
+        if now < self._next_snapshot_at:
+            return
+        self._next_snapshot_at = now + self.snapshot_interval
+        try:
+            write_snapshot(self.metrics, self.snapshot_path)
+        except OSError as e:
+            self.logger.warning(f"Could not write metrics snapshot: {e}")
+
     @abstractmethod
-    def check_for_updates(self) -> List[Any]:
+    def check_for_updates(self) -> Iterable[Any]:
         """
         Check for new items to process.
+
+        May return a generator, which run_once() consumes item by item,
+        writing each action file before the next item is produced.
         
         Returns:
-            List of new items (emails, messages, files, etc.)
+            List or iterator of new items (emails, messages, files, etc.)
             
         Raises:
             NotImplementedError: Must be implemented by subclass
@@ -145,24 +464,7 @@ class BaseWatcher(ABC):
         Returns:
             Priority level: 'critical', 'high', 'normal', or 'low'
         """
-        content_lower = content.lower()
-        
-        # Critical keywords
-        critical_keywords = ['urgent', 'asap', 'emergency', 'help', 'critical']
-        if any(kw in content_lower for kw in critical_keywords):
-            return 'critical'
-        
-        # High keywords
-        high_keywords = ['invoice', 'payment', 'deadline', 'due', 'important']
-        if any(kw in content_lower for kw in high_keywords):
-            return 'high'
-        
-        # Low keywords
-        low_keywords = ['newsletter', 'unsubscribe', 'promotion', 'offer']
-        if any(kw in content_lower for kw in low_keywords):
-            return 'low'
-        
-        return 'normal'
+        return self.classifier.classify(content).priority
 
     def sanitize_filename(self, name: str) -> str:
         """
@@ -184,7 +486,9 @@ class BaseWatcher(ABC):
 
     def log_action(self, action_type: str, details: Dict[str, Any]) -> None:
         """
-        Log an action to the daily log file.
+        Record an action in the daily JSON Lines audit log.
+
+        Dry-run actions are recorded too, flagged with "dry_run": true.
         
         Args:
             action_type: Type of action (e.g., 'email_received', 'file_created')
@@ -198,49 +502,141 @@ class BaseWatcher(ABC):
             'dry_run': self.dry_run
         }
         
+        self.audit_logger.info(action_type, extra={'audit': log_entry})
+
         if self.dry_run:
-            self.logger.info(f"[DRY RUN] Would log: {log_entry}")
-        else:
-            self.logger.debug(f"Logged action: {log_entry}")
+            self.logger.info(f"[DRY RUN] {action_type}: {details}")
+
+    def setup(self) -> None:
+        """
+        Prepare the watcher before its first check cycle.
+
+        Override to acquire long-lived resources (observers, browsers).
+        Called by the scheduler on the thread that runs the watcher's cycles.
+        """
+
+    def teardown(self) -> None:
+        """
+        Release resources acquired in setup() after the last check cycle.
+        """
+
+    def _timed_check(self) -> Iterable[Any]:
+        """
+        Call check_for_updates, recording its duration and item count.
+
+        Items of an iterator are counted as they are consumed, and its
+        duration only covers the call (the work happens while iterating).
+
+        Returns:
+            New items from check_for_updates
+        """
+        started = time.perf_counter()
+        items = self.check_for_updates()
+        self.metrics.observe('check_duration_seconds', time.perf_counter() - started)
+        if isinstance(items, Iterator):
+            return self._count_found(items)
+        self.metrics.inc('items_found', len(items) if items else 0)
+        return items
+
+    def _count_found(self, items: Iterator[Any]) -> Iterator[Any]:
+        """
+        Pass items through, counting each as found.
+
+        Args:
+            items: Iterator from check_for_updates
+
+        Yields:
+            The same items
+        """
+        for item in items:
+            self.metrics.inc('items_found')
+            yield item
+
+    def _write_action_file(self, item: Any) -> Optional[Path]:
+        """
+        Call create_action_file, recording its duration and outcome.
+
+        Args:
+            item: The item to create an action file for
+
+        Returns:
+            Path to the created file, or None if creation failed
+        """
+        started = time.perf_counter()
+        try:
+            filepath = self.create_action_file(item)
+        finally:
+            self.metrics.observe('write_duration_seconds', time.perf_counter() - started)
+        if filepath:
+            self.metrics.inc('items_written')
+        return filepath
+
+    def _record_cycle(self, started: float) -> None:
+        """
+        Record a finished cycle and refresh the snapshot file when due.
+
+        Args:
+            started: time.perf_counter() at the start of the cycle
+        """
+        self.metrics.observe('cycle_duration_seconds', time.perf_counter() - started)
+        self.metrics.inc('cycles')
+        self._maybe_write_snapshot()
+
+    def run_once(self) -> int:
+        """
+        Run a single check cycle: fetch new items and create action files.
+
+        Returns:
+            Number of items processed in this cycle (after backpressure)
+        """
+        started = time.perf_counter()
+        try:
+            items = self._apply_backpressure(self._timed_check())
+
+            count = 0
+            for item in items or ():
+                count += 1
+                if self.dry_run:
+                    self.logger.info(f"[DRY RUN] Would process item")
+                else:
+                    filepath = self._write_action_file(item)
+                    if filepath:
+                        self.logger.info(f"Created action file: {filepath}")
+
+            if not count:
+                self.logger.debug("No new items found")
+            else:
+                self.logger.info(f"Processed {count} new item(s)")
+            return count
+        except Exception:
+            self.metrics.inc('errors')
+            raise
+        finally:
+            self._record_cycle(started)
 
     def run(self) -> None:
         """
         Main run loop for the watcher.
-        
+
         Continuously checks for updates and creates action files.
         Runs until interrupted (Ctrl+C).
         """
         self.logger.info(f"Starting {self.__class__.__name__}")
         self.logger.info(f"Vault path: {self.vault_path}")
-        self.logger.info(f"Check interval: {self.check_interval}s")
+        self.logger.info(f"Check interval: {self.poll_schedule.describe()}")
         self.logger.info(f"Dry run mode: {self.dry_run}")
-        
+
         try:
             while True:
+                found = 0
                 try:
-                    # Check for new items
-                    items = self.check_for_updates()
-                    
-                    if items:
-                        self.logger.info(f"Found {len(items)} new item(s)")
-                        
-                        for item in items:
-                            if self.dry_run:
-                                self.logger.info(f"[DRY RUN] Would process item")
-                            else:
-                                filepath = self.create_action_file(item)
-                                if filepath:
-                                    self.logger.info(f"Created action file: {filepath}")
-                    else:
-                        self.logger.debug("No new items found")
-                    
+                    found = self.run_once()
                 except Exception as e:
                     self.logger.error(f"Error processing items: {e}", exc_info=True)
-                
+
                 # Wait before next check
-                import time
-                time.sleep(self.check_interval)
-                
+                time.sleep(self.poll_schedule.next_delay(found))
+
         except KeyboardInterrupt:
             self.logger.info(f"{self.__class__.__name__} stopped by user")
         except Exception as e:
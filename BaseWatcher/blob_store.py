@@ -0,0 +1,100 @@
+"""
+Content-addressed blob store for files ingested into the vault.
+
+Blobs live under <vault>/.blobs/ab/cdef... named by the content hash the
+watcher already computed, so two different files with the same name
+never collide and identical content dropped under several names (or by
+several sources) is stored once. Checking for a duplicate is a single
+stat(); storing writes to a temporary name and renames it into place.
+"""
+
+import os
+import shutil
+from pathlib import Path
+from typing import Callable, Optional, Tuple
+
+BLOBS_DIRNAME = '.blobs'
+
+
+def _copy(src: Path, dest: Path) -> str:
+    """Default placement: plain copy."""
+    shutil.copy2(src, dest)
+    return 'copy'
+
+
+class BlobStore:
+    """
+    Stores files by content hash under a vault.
+
+    Attributes:
+        vault_path: Vault root (blob paths are reported relative to it)
+        root: Blob directory (<vault>/.blobs)
+    """
+
+    def __init__(self, vault_path: Path):
+        """
+        Initialize the store.
+
+        Args:
+            vault_path: Path to the Obsidian vault
+        """
+        self.vault_path = Path(vault_path)
+        self.root = self.vault_path / BLOBS_DIRNAME
+
+    def path_for(self, digest: str) -> Path:
+        """
+        Get the blob path for a content hash.
+
+        Bare hex digests map to .blobs/ab/cdef...; 'algorithm:hex'
+        digests get their own .blobs/<algorithm>/ subtree.
+
+        Args:
+            digest: Content hash key
+
+        Returns:
+            Absolute blob path
+        """
+        algorithm, _, hexdigest = digest.rpartition(':')
+        base = self.root / algorithm if algorithm else self.root
+        return base / hexdigest[:2] / hexdigest[2:]
+
+    def relative(self, path: Path) -> str:
+        """
+        Get a blob path relative to the vault root (for action files).
+
+        Args:
+            path: Absolute blob path
+
+        Returns:
+            POSIX-style relative path
+        """
+        return path.relative_to(self.vault_path).as_posix()
+
+    def put_file(
+        self,
+        src: Path,
+        digest: str,
+        place: Optional[Callable[[Path, Path], str]] = None
+    ) -> Tuple[Path, Optional[str]]:
+        """
+        Store a file under its content hash unless it is already stored.
+
+        Args:
+            src: File to store
+            digest: The file's content hash key
+            place: Function putting src at a destination path and returning
+                the method used (default: copy)
+
+        Returns:
+            (blob path, method used), with method None when the content
+            was already stored and nothing was written
+        """
+        blob_path = self.path_for(digest)
+        if blob_path.exists():
+            return blob_path, None
+
+        blob_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = blob_path.with_name(f'.{blob_path.name}.{os.getpid()}.tmp')
+        method = (place or _copy)(src, tmp_path)
+        os.replace(tmp_path, blob_path)
+        return blob_path, method
@@ -0,0 +1,336 @@
+"""
+Cycle metrics for Digital FTE watchers.
+
+Every watcher records counters and latency histograms for its check
+cycles in a process-wide registry. They can be read two ways:
+
+- An optional local HTTP endpoint in Prometheus text format
+  (METRICS_PORT, bound to METRICS_HOST, default 127.0.0.1)
+- A JSON snapshot per watcher, /Logs/metrics_<name>.json, rewritten
+  every METRICS_SNAPSHOT_INTERVAL seconds (default 60, 0 disables)
+
+Metrics (all labelled with watcher="<name>"):
+    watcher_cycles_total                Completed check cycles
+    watcher_items_found_total           Items returned by check_for_updates
+    watcher_items_written_total         Action files created
+    watcher_errors_total                Cycles or writes that raised
+    watcher_dedup_hits_total            Items skipped as already processed
+    watcher_deferred_total              Items held back by backpressure
+    watcher_backlog                     Action files waiting in /Needs_Action
+    watcher_held_items                  Items in the backpressure holding queue
+    watcher_cycle_duration_seconds      Whole cycle (check + writes)
+    watcher_check_duration_seconds      check_for_updates only
+    watcher_write_duration_seconds      One create_action_file call
+"""
+
+import bisect
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+# Upper bounds in seconds, spanning a local file write to a slow browser scrape
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+COUNTERS = {
+    'cycles': 'Completed check cycles',
+    'items_found': 'Items returned by check_for_updates',
+    'items_written': 'Action files created',
+    'errors': 'Cycles or action file writes that raised',
+    'dedup_hits': 'Items skipped as already processed',
+    'deferred': 'Items held back by backpressure',
+}
+
+GAUGES = {
+    'backlog': 'Action files waiting in /Needs_Action',
+    'held_items': 'Items in the backpressure holding queue',
+}
+
+HISTOGRAMS = {
+    'cycle_duration_seconds': 'Duration of a whole check cycle',
+    'check_duration_seconds': 'Duration of check_for_updates',
+    'write_duration_seconds': 'Duration of one create_action_file call',
+}
+
+
+class Histogram:
+    """
+    Fixed-bucket latency histogram (Prometheus semantics).
+
+    Attributes:
+        buckets: Sorted bucket upper bounds in seconds
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """
+        Initialize an empty histogram.
+
+        Args:
+            buckets: Bucket upper bounds in seconds
+        """
+        self.buckets = sorted(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """
+        Record one observation.
+
+        Args:
+            value: Observed duration in seconds
+        """
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[int]:
+        """Get cumulative counts per bucket, ending with +Inf."""
+        total = 0
+        result = []
+        for count in self.counts:
+            total += count
+            result.append(total)
+        return result
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate a quantile as the upper bound of the bucket containing it.
+
+        Args:
+            q: Quantile between 0 and 1
+
+        Returns:
+            Bucket upper bound in seconds (None if empty or beyond the last bucket)
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        for bound, total in zip(self.buckets, self.cumulative()):
+            if total >= rank:
+                return bound
+        return None
+
+
+class WatcherMetrics:
+    """
+    Counters and histograms for one watcher, safe to update from any thread.
+
+    Attributes:
+        name: Watcher name used as the metric label
+    """
+
+    def __init__(self, name: str):
+        """
+        Initialize zeroed metrics.
+
+        Args:
+            name: Watcher name (BaseWatcher.WATCHER_NAME)
+        """
+        self.name = name
+        self.counters: Dict[str, int] = {key: 0 for key in COUNTERS}
+        self.histograms: Dict[str, Histogram] = {key: Histogram() for key in HISTOGRAMS}
+        self.gauges: Dict[str, float] = {key: 0 for key in GAUGES}
+        self.last_cycle_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def inc(self, counter: str, amount: int = 1) -> None:
+        """
+        Increment a counter.
+
+        Args:
+            counter: Counter name (see COUNTERS)
+            amount: Amount to add
+        """
+        with self._lock:
+            self.counters[counter] += amount
+
+    def set_gauge(self, gauge: str, value: float) -> None:
+        """
+        Set a gauge to its current value.
+
+        Args:
+            gauge: Gauge name (see GAUGES)
+            value: Current value
+        """
+        with self._lock:
+            self.gauges[gauge] = value
+
+    def observe(self, histogram: str, seconds: float) -> None:
+        """
+        Record a duration.
+
+        Args:
+            histogram: Histogram name (see HISTOGRAMS)
+            seconds: Duration in seconds
+        """
+        with self._lock:
+            self.histograms[histogram].observe(seconds)
+            if histogram == 'cycle_duration_seconds':
+                self.last_cycle_at = time.time()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get a JSON-serialisable copy of the current values.
+
+        Returns:
+            Dictionary with counters, histogram summaries and timestamps
+        """
+        with self._lock:
+            histograms = {}
+            for key, hist in self.histograms.items():
+                histograms[key] = {
+                    'count': hist.count,
+                    'sum': round(hist.sum, 6),
+                    'p50': hist.quantile(0.5),
+                    'p95': hist.quantile(0.95),
+                    'p99': hist.quantile(0.99),
+                    'buckets': dict(zip([str(b) for b in hist.buckets] + ['+Inf'], hist.cumulative())),
+                }
+            return {
+                'watcher': self.name,
+                'pid': os.getpid(),
+                'timestamp': time.time(),
+                'last_cycle_at': self.last_cycle_at,
+                'counters': dict(self.counters),
+                'gauges': dict(self.gauges),
+                'histograms': histograms,
+            }
+
+    def render_prometheus(self, key: str) -> List[str]:
+        """
+        Render one metric family's samples (without HELP/TYPE) in Prometheus text format.
+
+        Args:
+            key: Counter, gauge or histogram name (see COUNTERS, GAUGES, HISTOGRAMS)
+
+        Returns:
+            Sample lines
+        """
+        label = f'watcher="{self.name}"'
+        lines = []
+        with self._lock:
+            if key in self.counters:
+                lines.append(f'watcher_{key}_total{{{label}}} {self.counters[key]}')
+            elif key in self.gauges:
+                lines.append(f'watcher_{key}{{{label}}} {self.gauges[key]}')
+            else:
+                hist = self.histograms[key]
+                for bound, total in zip(hist.buckets, hist.cumulative()):
+                    lines.append(f'watcher_{key}_bucket{{{label},le="{bound}"}} {total}')
+                lines.append(f'watcher_{key}_bucket{{{label},le="+Inf"}} {hist.count}')
+                lines.append(f'watcher_{key}_sum{{{label}}} {hist.sum}')
+                lines.append(f'watcher_{key}_count{{{label}}} {hist.count}')
+        return lines
+
+
+_registry: Dict[str, WatcherMetrics] = {}
+_registry_lock = threading.Lock()
+_server: Optional['ThreadingHTTPServer'] = None
+
+
+def get_metrics(name: str) -> WatcherMetrics:
+    """
+    Get the process-wide metrics for a watcher, creating them on first use.
+
+    Args:
+        name: Watcher name
+
+    Returns:
+        Shared WatcherMetrics instance
+    """
+    with _registry_lock:
+        if name not in _registry:
+            _registry[name] = WatcherMetrics(name)
+        return _registry[name]
+
+
+def render_prometheus() -> str:
+    """
+    Render every registered watcher's metrics in Prometheus text format.
+
+    Returns:
+        Exposition text (version 0.0.4)
+    """
+    with _registry_lock:
+        watchers = list(_registry.values())
+
+    # Each family's HELP, TYPE and samples (of every watcher) must be contiguous
+    families = (
+        [(key, f'watcher_{key}_total', 'counter', help_text) for key, help_text in COUNTERS.items()]
+        + [(key, f'watcher_{key}', 'gauge', help_text) for key, help_text in GAUGES.items()]
+        + [(key, f'watcher_{key}', 'histogram', help_text) for key, help_text in HISTOGRAMS.items()]
+    )
+    lines = []
+    for key, family, kind, help_text in families:
+        lines.append(f'# HELP {family} {help_text}')
+        lines.append(f'# TYPE {family} {kind}')
+        for metrics in watchers:
+            lines.extend(metrics.render_prometheus(key))
+    return '\n'.join(lines) + '\n'
+
+
+def start_metrics_server(port: int, host: str = '127.0.0.1') -> 'ThreadingHTTPServer':
+    """
+    Start the /metrics endpoint on a daemon thread (once per process).
+
+    http.server is imported here so watchers without METRICS_PORT never load it.
+
+    Args:
+        port: TCP port to listen on
+        host: Interface to bind (default: localhost only)
+
+    Returns:
+        The running server
+
+    Raises:
+        OSError: If the port cannot be bound
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        """Serves /metrics; everything else is a 404."""
+
+        def do_GET(self) -> None:
+            if self.path.split('?')[0] != '/metrics':
+                self.send_error(404)
+                return
+            body = render_prometheus().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            # Scrapes are frequent; keep them out of the watcher logs
+            pass
+
+    global _server
+    with _registry_lock:
+        if _server is None:
+            _server = ThreadingHTTPServer((host, port), MetricsHandler)
+            _server.daemon_threads = True
+            thread = threading.Thread(
+                target=_server.serve_forever, name='MetricsServer', daemon=True
+            )
+            thread.start()
+        return _server
+
+
+def write_snapshot(metrics: WatcherMetrics, path: Path) -> None:
+    """
+    Atomically write a watcher's metrics snapshot as JSON.
+
+    Args:
+        metrics: Metrics to write
+        path: Destination file
+    """
+    tmp_path = path.with_name(path.name + '.tmp')
+    tmp_path.write_text(json.dumps(metrics.snapshot(), indent=2), encoding='utf-8')
+    os.replace(tmp_path, path)
@@ -0,0 +1,147 @@
+"""
+Adaptive poll scheduling for Digital FTE watchers.
+
+Polls faster while items keep arriving and backs off exponentially,
+up to a ceiling, while cycles come back empty. A throttled schedule
+(e.g. while /Needs_Action is over its backlog threshold) always waits
+the maximum interval.
+"""
+
+import os
+from typing import Optional
+
+
+class PollSchedule:
+    """
+    Computes the delay before a watcher's next check cycle.
+
+    Attributes:
+        base_interval: Fixed interval used when adaptive polling is off
+        min_interval: Fastest allowed interval in seconds
+        max_interval: Slowest allowed interval in seconds
+        adaptive: Whether the interval adapts to activity
+        current_interval: Interval returned by the last next_delay() call
+        throttled: Poll at max_interval regardless of activity (backpressure)
+    """
+
+    def __init__(
+        self,
+        base_interval: float,
+        min_interval: Optional[float] = None,
+        max_interval: Optional[float] = None,
+        adaptive: bool = False,
+        backoff: float = 2.0,
+        speedup: float = 0.5
+    ):
+        """
+        Initialize the schedule.
+
+        Args:
+            base_interval: Starting (and non-adaptive) interval in seconds
+            min_interval: Lower bound (default: a quarter of base_interval,
+                at most max_interval)
+            max_interval: Upper bound (default: 8x base_interval, at least
+                min_interval)
+            adaptive: Enable adaptive polling
+            backoff: Multiplier applied after an empty cycle
+            speedup: Multiplier applied after a cycle that found items
+
+        Raises:
+            ValueError: If both bounds are given and min_interval exceeds max_interval
+        """
+        if min_interval is not None and max_interval is not None and min_interval > max_interval:
+            raise ValueError(
+                f"min_interval ({min_interval}) must not exceed max_interval ({max_interval})"
+            )
+
+        # A derived bound gives way to an explicit one
+        self.base_interval = base_interval
+        if min_interval is None:
+            min_interval = max(1, base_interval / 4)
+            if max_interval is not None:
+                min_interval = min(min_interval, max_interval)
+        if max_interval is None:
+            max_interval = max(base_interval * 8, min_interval)
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.adaptive = adaptive
+        self.backoff = backoff
+        self.speedup = speedup
+        self.current_interval = min(max(base_interval, self.min_interval), self.max_interval)
+        self.throttled = False
+
+    @classmethod
+    def from_env(
+        cls,
+        prefix: str,
+        base_interval: float,
+        min_interval: Optional[float] = None,
+        max_interval: Optional[float] = None,
+        adaptive: Optional[bool] = None
+    ) -> 'PollSchedule':
+        """
+        Build a schedule, filling unset options from the environment.
+
+        Explicit arguments (e.g. from the CLI) win over environment
+        variables. Recognised variables, for prefix 'GMAIL':
+            GMAIL_ADAPTIVE_POLLING / ADAPTIVE_POLLING: 'true' to enable
+            GMAIL_MIN_INTERVAL: Lower bound in seconds
+            GMAIL_MAX_INTERVAL: Upper bound in seconds
+
+        Args:
+            prefix: Per-watcher environment variable prefix
+            base_interval: Starting interval in seconds
+            min_interval: Lower bound override
+            max_interval: Upper bound override
+            adaptive: Adaptive polling override
+
+        Returns:
+            Configured PollSchedule
+        """
+        if adaptive is None:
+            flag = os.getenv(f'{prefix}_ADAPTIVE_POLLING', os.getenv('ADAPTIVE_POLLING', 'false'))
+            adaptive = flag.lower() == 'true'
+
+        if min_interval is None and os.getenv(f'{prefix}_MIN_INTERVAL'):
+            min_interval = float(os.getenv(f'{prefix}_MIN_INTERVAL'))
+
+        if max_interval is None and os.getenv(f'{prefix}_MAX_INTERVAL'):
+            max_interval = float(os.getenv(f'{prefix}_MAX_INTERVAL'))
+
+        return cls(base_interval, min_interval, max_interval, adaptive)
+
+    def next_delay(self, items_found: int) -> float:
+        """
+        Get the delay before the next cycle and update the schedule.
+
+        Args:
+            items_found: Number of items the last cycle produced
+
+        Returns:
+            Seconds to wait before the next check
+        """
+        if self.throttled:
+            # Resume from the slow end once the throttle is lifted
+            self.current_interval = self.max_interval
+            return self.max_interval
+
+        if not self.adaptive:
+            return self.base_interval
+
+        if items_found > 0:
+            self.current_interval = max(self.min_interval, self.current_interval * self.speedup)
+        else:
+            self.current_interval = min(self.max_interval, self.current_interval * self.backoff)
+
+        return self.current_interval
+
+    def describe(self) -> str:
+        """
+        Get a short human-readable description for startup logs.
+
+        Returns:
+            Description string
+        """
+        if not self.adaptive:
+            return f"{self.base_interval}s"
+        return f"adaptive {self.min_interval:g}s-{self.max_interval:g}s (start {self.base_interval}s)"
@@ -0,0 +1,215 @@
+"""
+Priority classifier for Digital FTE watchers.
+
+All priority keywords are compiled once into a single regular expression
+with word boundaries, so classifying a message is one pass over the text
+no matter how many terms the rules contain. Only letters count as word
+characters, so underscores, digits and dots in file names separate words
+('urgent_invoice.pdf', 'Invoice_2024-03.pdf'), and a term also matches
+its plural ('invoices', 'payments'). Rules are loaded from
+``priority_rules.json`` in the vault root (see Company_Handbook.md,
+"Priority Classification"), falling back to built-in defaults.
+
+Rules file format:
+    {
+        "critical": ["urgent", "asap", ...],
+        "high": ["invoice", "payment", ...],
+        "low": ["newsletter", ...]
+    }
+"""
+
+import bisect
+import json
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+# Levels in precedence order: the first level with a match wins
+PRIORITY_LEVELS = ['critical', 'high', 'low']
+DEFAULT_PRIORITY = 'normal'
+
+DEFAULT_RULES: Dict[str, List[str]] = {
+    'critical': ['urgent', 'asap', 'emergency', 'help', 'critical'],
+    'high': ['invoice', 'payment', 'deadline', 'due', 'overdue', 'important'],
+    'low': ['newsletter', 'unsubscribe', 'promotion', 'offer'],
+}
+
+RULES_FILENAME = 'priority_rules.json'
+
+# Joins batch texts; never part of a term and never a word character
+_BATCH_SEPARATOR = '\x00'
+
+
+class Classification(NamedTuple):
+    """Result of classifying one text."""
+    priority: str
+    matches: List[str]
+
+
+class PriorityClassifier:
+    """
+    Single-pass keyword classifier.
+
+    Attributes:
+        term_levels: Lowercased term -> priority level (None for watch-only terms)
+    """
+
+    def __init__(self, rules: Dict[str, Iterable[str]], watch_terms: Iterable[str] = ()):
+        """
+        Compile the classifier.
+
+        Args:
+            rules: Priority level -> keywords
+            watch_terms: Extra terms to report in matches without affecting priority
+        """
+        self.rules = {level: list(terms) for level, terms in rules.items()}
+        self.term_levels: Dict[str, Optional[str]] = {}
+
+        # Iterate lowest precedence first so higher levels overwrite duplicates
+        for level in reversed(PRIORITY_LEVELS):
+            for term in self.rules.get(level, []):
+                term = term.strip().lower()
+                if term:
+                    self.term_levels[term] = level
+
+        for term in watch_terms:
+            term = term.strip().lower()
+            if term:
+                self.term_levels.setdefault(term, None)
+
+        self._rank = {level: i for i, level in enumerate(PRIORITY_LEVELS)}
+        self._pattern = self._compile(self.term_levels)
+
+    @staticmethod
+    def _compile(terms: Iterable[str]) -> Optional['re.Pattern']:
+        """
+        Build one alternation over all terms, longest first.
+
+        Lookarounds are used instead of \\b so terms that start or end
+        with punctuation still match on whole-word boundaries, and so
+        that only letters ([^\\W\\d_]) count as word characters. The
+        term itself is group 1; an optional plural 's'/'es' follows it.
+        """
+        ordered = sorted(terms, key=len, reverse=True)
+        if not ordered:
+            return None
+        alternation = '|'.join(re.escape(term) for term in ordered)
+        return re.compile(rf'(?<![^\W\d_])({alternation})(?:e?s)?(?![^\W\d_])')
+
+    @classmethod
+    def from_file(cls, path: Path) -> 'PriorityClassifier':
+        """
+        Load rules from a JSON file, using defaults for missing levels.
+
+        Args:
+            path: Path to the rules file
+
+        Returns:
+            Compiled classifier
+        """
+        rules = dict(DEFAULT_RULES)
+        data = json.loads(Path(path).read_text(encoding='utf-8'))
+        for level in PRIORITY_LEVELS:
+            if level in data:
+                rules[level] = data[level]
+        return cls(rules)
+
+    def with_terms(self, watch_terms: Iterable[str]) -> 'PriorityClassifier':
+        """
+        Get a classifier that also reports the given watch terms.
+
+        Args:
+            watch_terms: Extra terms (e.g. monitored keywords)
+
+        Returns:
+            New compiled classifier with the same rules
+        """
+        return PriorityClassifier(self.rules, watch_terms)
+
+    def _result(self, found: Sequence[str]) -> Classification:
+        """Reduce matched terms (in text order) to a Classification."""
+        matches = list(dict.fromkeys(found))
+        best = None
+        for term in matches:
+            level = self.term_levels[term]
+            if level is not None and (best is None or self._rank[level] < self._rank[best]):
+                best = level
+        return Classification(best or DEFAULT_PRIORITY, matches)
+
+    def classify(self, text: str) -> Classification:
+        """
+        Classify one text.
+
+        Args:
+            text: Text content to analyze
+
+        Returns:
+            Priority plus every matched term, in order of first appearance
+        """
+        if self._pattern is None or not text:
+            return Classification(DEFAULT_PRIORITY, [])
+        return self._result(self._pattern.findall(text.lower()))
+
+    def classify_batch(self, texts: Sequence[str]) -> List[Classification]:
+        """
+        Classify a whole cycle's worth of texts with one regex scan.
+
+        Args:
+            texts: Texts to analyze
+
+        Returns:
+            One Classification per input text, in the same order
+        """
+        if self._pattern is None or not texts:
+            return [Classification(DEFAULT_PRIORITY, []) for _ in texts]
+
+        cleaned = [(text or '').replace(_BATCH_SEPARATOR, ' ') for text in texts]
+        starts: List[int] = []
+        offset = 0
+        for text in cleaned:
+            starts.append(offset)
+            offset += len(text) + len(_BATCH_SEPARATOR)
+
+        found: List[List[str]] = [[] for _ in texts]
+        joined = _BATCH_SEPARATOR.join(cleaned).lower()
+        for match in self._pattern.finditer(joined):
+            index = bisect.bisect_right(starts, match.start()) - 1
+            found[index].append(match.group(1))
+
+        return [self._result(terms) for terms in found]
+
+
+_cache: Dict[Tuple[str, float], PriorityClassifier] = {}
+_cache_lock = threading.Lock()
+
+
+def load_classifier(vault_path: Path) -> PriorityClassifier:
+    """
+    Get the process-wide classifier for a vault, compiling it only once.
+
+    The rules file is PRIORITY_RULES_PATH if set, otherwise
+    <vault>/priority_rules.json. Editing the file (new mtime) yields a
+    freshly compiled classifier on the next call.
+
+    Args:
+        vault_path: Path to the Obsidian vault
+
+    Returns:
+        Compiled classifier
+    """
+    rules_path = Path(os.getenv('PRIORITY_RULES_PATH', Path(vault_path) / RULES_FILENAME))
+    try:
+        mtime = rules_path.stat().st_mtime
+    except OSError:
+        mtime = -1.0
+
+    key = (str(rules_path.resolve()), mtime)
+    with _cache_lock:
+        if key not in _cache:
+            _cache[key] = (
+                PriorityClassifier.from_file(rules_path) if mtime >= 0
+                else PriorityClassifier(DEFAULT_RULES)
+            )
+        return _cache[key]
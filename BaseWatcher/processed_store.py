@@ -0,0 +1,250 @@
+"""
+Durable dedup store for Digital FTE watchers.
+
+Processed item keys (message IDs, file hashes) are kept in memory for
+O(1) lookups and persisted to an append-only log, one JSON record per
+line. Marking an item appends a single line instead of rewriting the
+whole file. A torn final line after a crash is skipped on load and cut
+off, so the next record starts on a fresh line. The log is periodically
+compacted via an atomic rename.
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+
+class ProcessedStore:
+    """
+    Append-only, optionally TTL-bounded set of processed item keys.
+
+    Attributes:
+        path: Path to the append-only log file
+        ttl_seconds: Forget keys older than this (None keeps them forever)
+    """
+
+    # Compact when the log holds this many times more lines than live keys
+    COMPACT_RATIO = 2.0
+    # ...but never for logs shorter than this
+    COMPACT_MIN_LINES = 1000
+    # Sweep expired keys from memory every N marks
+    EVICT_EVERY = 1000
+
+    def __init__(self, path: Path, ttl_seconds: Optional[float] = None, fsync: bool = False):
+        """
+        Open (or create) a store.
+
+        Args:
+            path: Path to the append-only log file
+            ttl_seconds: Retention for keys in seconds (default: keep forever)
+            fsync: fsync after every append for power-loss durability
+        """
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.fsync = fsync
+
+        self._entries: Dict[str, float] = {}
+        self._log_lines = 0
+        self._marks_since_evict = 0
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._load()
+        self._file = open(self.path, 'a', encoding='utf-8')
+
+    def _expired(self, marked_at: float, now: float) -> bool:
+        """Check whether a key marked at marked_at has outlived the TTL."""
+        return self.ttl_seconds is not None and now - marked_at > self.ttl_seconds
+
+    def _load(self) -> None:
+        """Replay the log into memory, skipping torn or malformed lines."""
+        if not self.path.exists():
+            return
+
+        now = time.time()
+        line = ''
+        parsed = False
+        with open(self.path, 'r', encoding='utf-8', errors='replace') as f:
+            for line in f:
+                self._log_lines += 1
+                parsed = False
+                try:
+                    marked_at, key = json.loads(line)
+                    parsed = True
+                    if self._expired(marked_at, now):
+                        continue
+                except (ValueError, TypeError):
+                    continue
+                self._entries[key] = marked_at
+
+        if line and not line.endswith('\n'):
+            self._repair_tail(keep=parsed)
+
+    def _repair_tail(self, keep: bool) -> None:
+        """
+        End the log with a newline before appending to it again.
+
+        Args:
+            keep: The final line is a whole record that only lacks its
+                newline; otherwise it is torn and cut off
+        """
+        with open(self.path, 'rb+') as f:
+            if keep:
+                f.seek(0, os.SEEK_END)
+                f.write(b'\n')
+                return
+
+            # Scan back for the end of the last complete line
+            end = f.seek(0, os.SEEK_END)
+            while end > 0:
+                start = max(0, end - 4096)
+                f.seek(start)
+                newline = f.read(end - start).rfind(b'\n')
+                if newline != -1:
+                    f.truncate(start + newline + 1)
+                    break
+                end = start
+            else:
+                f.truncate(0)
+        self._log_lines -= 1
+
+    def _append(self, lines: str) -> None:
+        """Append pre-formatted records and push them to the OS."""
+        self._file.write(lines)
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+    def _evict_expired(self) -> None:
+        """Drop expired keys from memory so the working set stays bounded."""
+        if self.ttl_seconds is None:
+            return
+        now = time.time()
+        expired = [k for k, ts in self._entries.items() if self._expired(ts, now)]
+        for key in expired:
+            del self._entries[key]
+
+    def _maybe_compact(self) -> None:
+        """Evict and compact when the log has grown well past the live set."""
+        self._marks_since_evict += 1
+        if self._marks_since_evict >= self.EVICT_EVERY:
+            self._marks_since_evict = 0
+            self._evict_expired()
+
+        threshold = max(self.COMPACT_MIN_LINES, len(self._entries) * self.COMPACT_RATIO)
+        if self._log_lines > threshold:
+            self._compact()
+
+    def _compact(self) -> None:
+        """Rewrite the log with only live keys, atomically replacing it."""
+        self._evict_expired()
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for key, marked_at in self._entries.items():
+                f.write(json.dumps([marked_at, key]) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+        self._file.close()
+        os.replace(tmp_path, self.path)
+        self._file = open(self.path, 'a', encoding='utf-8')
+        self._log_lines = len(self._entries)
+
+    def seen(self, key: str) -> bool:
+        """
+        Check whether a key has been marked (and not expired).
+
+        Args:
+            key: Item key
+
+        Returns:
+            True if the item was already processed
+        """
+        with self._lock:
+            marked_at = self._entries.get(key)
+            if marked_at is None:
+                return False
+            if self._expired(marked_at, time.time()):
+                del self._entries[key]
+                return False
+            return True
+
+    def mark(self, key: str) -> None:
+        """
+        Record a key as processed.
+
+        Args:
+            key: Item key
+        """
+        with self._lock:
+            marked_at = time.time()
+            self._append(json.dumps([marked_at, key]) + '\n')
+            self._entries[key] = marked_at
+            self._log_lines += 1
+            self._maybe_compact()
+
+    def mark_many(self, keys: Iterable[str]) -> int:
+        """
+        Record several keys with a single append.
+
+        Args:
+            keys: Item keys
+
+        Returns:
+            Number of keys written
+        """
+        with self._lock:
+            marked_at = time.time()
+            new_keys = [k for k in dict.fromkeys(keys) if k not in self._entries]
+            if not new_keys:
+                return 0
+            self._append(''.join(json.dumps([marked_at, k]) + '\n' for k in new_keys))
+            for key in new_keys:
+                self._entries[key] = marked_at
+            self._log_lines += len(new_keys)
+            self._maybe_compact()
+            return len(new_keys)
+
+    def migrate(self, legacy_path: Path) -> int:
+        """
+        Import keys from a legacy dedup file and retire it.
+
+        Understands the old one-key-per-line ``*.txt`` files and the
+        ``{"ids": [...]}`` JSON format. The legacy file is renamed with a
+        ``.migrated`` suffix so the import happens only once.
+
+        Args:
+            legacy_path: Path to the legacy file
+
+        Returns:
+            Number of keys imported
+        """
+        legacy_path = Path(legacy_path)
+        if not legacy_path.exists():
+            return 0
+
+        text = legacy_path.read_text(encoding='utf-8')
+        if legacy_path.suffix == '.json':
+            keys = json.loads(text).get('ids', []) if text.strip() else []
+        else:
+            keys = [line.strip() for line in text.splitlines() if line.strip()]
+
+        imported = self.mark_many(keys)
+        legacy_path.replace(legacy_path.with_name(legacy_path.name + '.migrated'))
+        return imported
+
+    def close(self) -> None:
+        """Flush and close the underlying log file."""
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+    def __contains__(self, key: str) -> bool:
+        return self.seen(key)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,198 @@
+"""
+Watcher Scheduler for Digital FTE
+
+Hosts several watchers in a single event loop, each on its own cadence.
+
+Async watchers (AsyncBaseWatcher) run directly on the loop. Blocking
+watchers (BaseWatcher) get a dedicated worker thread each, so a slow
+Gmail call never delays a filesystem pickup, and libraries with thread
+affinity (Playwright's sync API) always see the same thread.
+
+Each watcher is supervised independently: if it fails to start, or
+keeps failing cycle after cycle, it is torn down and restarted with
+exponential backoff while the other watchers keep running.
+
+Usage:
+    scheduler = WatcherScheduler()
+    scheduler.add(FilesystemWatcher(vault_path='./vault'))
+    scheduler.add(GmailWatcher(vault_path='./vault'))
+    scheduler.run_forever()
+"""
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from .async_base_watcher import AsyncBaseWatcher
+from .base_watcher import BaseWatcher
+
+
+class WatcherScheduler:
+    """
+    Runs multiple watchers concurrently in one asyncio event loop.
+
+    Attributes:
+        watchers: Watchers hosted by this scheduler
+        logger: Logger for scheduler-level events
+        restarts: Watcher class name -> number of restarts so far
+    """
+
+    # First restart delay in seconds, doubled after each consecutive crash
+    RESTART_BASE_DELAY = 5.0
+    RESTART_MAX_DELAY = 300.0
+    # A watcher that ran this long before crashing restarts with the base delay
+    STABLE_AFTER = 600.0
+
+    def __init__(
+        self,
+        logger: Optional[logging.Logger] = None,
+        restart: bool = True,
+        max_consecutive_errors: int = 5
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            logger: Logger to use (default: 'WatcherScheduler')
+            restart: Restart watchers that crash (default: True)
+            max_consecutive_errors: Failed cycles in a row before a blocking
+                watcher is torn down and restarted (0 disables)
+        """
+        self.watchers: List[BaseWatcher] = []
+        self.logger = logger or logging.getLogger('WatcherScheduler')
+        self.restart = restart
+        self.max_consecutive_errors = max_consecutive_errors
+        self.restarts: Dict[str, int] = {}
+
+    def add(self, watcher: BaseWatcher) -> None:
+        """
+        Register a watcher to be run by the scheduler.
+
+        Args:
+            watcher: Watcher instance (sync or async)
+        """
+        self.watchers.append(watcher)
+
+    async def _run_async_watcher(self, watcher: AsyncBaseWatcher) -> None:
+        """
+        Drive an AsyncBaseWatcher directly on the event loop.
+
+        Args:
+            watcher: Async watcher to run
+        """
+        await watcher.run_async()
+
+    async def _run_sync_watcher(self, watcher: BaseWatcher) -> None:
+        """
+        Drive a blocking BaseWatcher on its own dedicated thread.
+
+        Args:
+            watcher: Blocking watcher to run
+        """
+        name = watcher.__class__.__name__
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=name)
+
+        watcher.logger.info(f"Starting {name} (check interval: {watcher.poll_schedule.describe()})")
+
+        try:
+            await loop.run_in_executor(executor, watcher.setup)
+
+            consecutive_errors = 0
+            while True:
+                found = 0
+                try:
+                    found = await loop.run_in_executor(executor, watcher.run_once)
+                    consecutive_errors = 0
+                except Exception as e:
+                    watcher.logger.error(f"Error processing items: {e}", exc_info=True)
+                    consecutive_errors += 1
+                    if self.max_consecutive_errors and consecutive_errors >= self.max_consecutive_errors:
+                        raise RuntimeError(
+                            f"{consecutive_errors} consecutive failed cycles"
+                        ) from e
+
+                # Wait before next check
+                await asyncio.sleep(watcher.poll_schedule.next_delay(found))
+        finally:
+            # Queued behind any in-flight cycle, so it runs on the same thread
+            await loop.run_in_executor(executor, watcher.teardown)
+            executor.shutdown(wait=False)
+            watcher.logger.info(f"{name} stopped")
+
+    async def _supervise(
+        self,
+        watcher: BaseWatcher,
+        runner: Callable[[BaseWatcher], Awaitable[None]]
+    ) -> None:
+        """
+        Run a watcher, restarting it with exponential backoff when it crashes.
+
+        Failures are contained here so one watcher never stops the others.
+
+        Args:
+            watcher: Watcher to run
+            runner: Coroutine function driving the watcher
+        """
+        name = watcher.__class__.__name__
+        loop = asyncio.get_running_loop()
+        failures = 0
+
+        while True:
+            started = loop.time()
+            try:
+                await runner(watcher)
+                self.logger.info(f"{name} exited")
+                return
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if not self.restart:
+                    self.logger.error(f"{name} crashed: {e}", exc_info=True)
+                    return
+
+                if loop.time() - started >= self.STABLE_AFTER:
+                    failures = 0
+                delay = min(self.RESTART_MAX_DELAY, self.RESTART_BASE_DELAY * 2 ** failures)
+                failures += 1
+                self.restarts[name] = self.restarts.get(name, 0) + 1
+
+                self.logger.error(f"{name} crashed: {e}; restarting in {delay:.0f}s", exc_info=True)
+                await asyncio.sleep(delay)
+
+    async def run(self) -> None:
+        """
+        Run all registered watchers until cancelled.
+        """
+        if not self.watchers:
+            self.logger.warning("No watchers registered, nothing to run")
+            return
+
+        tasks = []
+        for watcher in self.watchers:
+            if isinstance(watcher, AsyncBaseWatcher):
+                runner = self._run_async_watcher
+            else:
+                runner = self._run_sync_watcher
+            tasks.append(asyncio.create_task(
+                self._supervise(watcher, runner), name=watcher.__class__.__name__
+            ))
+
+        self.logger.info(f"Scheduler running {len(tasks)} watcher(s)")
+
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def run_forever(self) -> None:
+        """
+        Run the scheduler on a new event loop until interrupted (Ctrl+C).
+        """
+        try:
+            asyncio.run(self.run())
+        except KeyboardInterrupt:
+            self.logger.info("Scheduler stopped by user")
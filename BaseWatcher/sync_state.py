@@ -0,0 +1,87 @@
+"""
+Persisted sync cursors for Digital FTE watchers.
+
+Incremental sources (e.g. the Gmail History API) hand out a cursor that
+marks how far the watcher has read. It is kept in a small JSON file in
+/Logs so a restart resumes from it instead of re-listing everything.
+The file is rewritten atomically (temp file + rename), so a crash
+leaves either the old or the new cursor, never a torn one.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict
+
+
+class SyncState:
+    """
+    Small key-value document persisted as JSON.
+
+    Attributes:
+        path: Path to the JSON file
+    """
+
+    def __init__(self, path: Path):
+        """
+        Load the state (a missing or corrupt file starts empty).
+
+        Args:
+            path: Path to the JSON file
+        """
+        self.path = Path(path)
+        self._values: Dict[str, Any] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                self._values = data
+        except (OSError, ValueError):
+            pass
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Get a value.
+
+        Args:
+            key: Value name
+            default: Returned if the key is not set
+
+        Returns:
+            The stored value, or default
+        """
+        with self._lock:
+            return self._values.get(key, default)
+
+    def update(self, **values: Any) -> None:
+        """
+        Set values in memory (call save() to persist them).
+
+        Args:
+            values: Values to set; None removes a key
+        """
+        with self._lock:
+            for key, value in values.items():
+                if value is None:
+                    if self._values.pop(key, None) is not None:
+                        self._dirty = True
+                elif self._values.get(key) != value:
+                    self._values[key] = value
+                    self._dirty = True
+
+    def save(self) -> None:
+        """Persist the state if it changed (write to a temp file, then rename)."""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = json.dumps(self._values)
+            self._dirty = False
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+        tmp_path.write_text(data, encoding='utf-8')
+        os.replace(tmp_path, self.path)
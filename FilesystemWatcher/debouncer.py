@@ -0,0 +1,155 @@
+"""
+Write-completion detection for watchdog events.
+
+A create event fires as soon as a file appears, usually long before a
+large copy has finished. The debouncer merges every created, modified
+and moved event for a path into one pending entry and only hands the
+path on once its size and mtime have stayed unchanged for a settle
+window, so each dropped file is read once, after it is complete.
+"""
+
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+
+class _Pending:
+    """Observation state of one path waiting to settle."""
+
+    __slots__ = ('signature', 'stable_since')
+
+    def __init__(self):
+        self.signature: Optional[Tuple[int, int]] = None
+        self.stable_since = time.monotonic()
+
+
+class WriteDebouncer:
+    """
+    Coalesces file events per path and releases paths once writes settle.
+
+    Attributes:
+        settle_seconds: How long size and mtime must stay unchanged
+        on_ready: Called with each settled path (on the debouncer thread)
+    """
+
+    def __init__(self, on_ready: Callable[[Path], None], settle_seconds: float = 2.0):
+        """
+        Initialize the debouncer (call start() to begin releasing paths).
+
+        Args:
+            on_ready: Callback receiving settled paths
+            settle_seconds: Quiet period required before a path is released
+        """
+        self.on_ready = on_ready
+        self.settle_seconds = settle_seconds
+
+        self._pending: Dict[Path, _Pending] = {}
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+
+    def touch(self, path: Path) -> None:
+        """
+        Record activity on a path, restarting its settle window.
+
+        Args:
+            path: Path that was created, modified or moved into place
+        """
+        with self._condition:
+            self._pending[path] = _Pending()
+            self._condition.notify()
+
+    def forget(self, path: Path) -> None:
+        """
+        Stop tracking a path (deleted or moved away).
+
+        Args:
+            path: Path to drop
+        """
+        with self._condition:
+            self._pending.pop(path, None)
+
+    def start(self) -> None:
+        """Start the background thread that releases settled paths."""
+        if self._thread is not None:
+            return
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name='fte-debouncer', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> int:
+        """
+        Stop the background thread.
+
+        Returns:
+            Number of paths still waiting to settle (not released)
+        """
+        with self._condition:
+            self._stopping = True
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        with self._condition:
+            dropped = len(self._pending)
+            self._pending.clear()
+        return dropped
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def _run(self) -> None:
+        """Poll pending paths until stopped."""
+        # Check often enough to release a path soon after its window ends
+        tick = max(0.05, min(self.settle_seconds / 2, 0.5))
+        while True:
+            with self._condition:
+                while not self._pending and not self._stopping:
+                    self._condition.wait()
+                if self._stopping:
+                    return
+                self._condition.wait(tick)
+                if self._stopping:
+                    return
+                paths = list(self._pending)
+
+            for path in self._settled(paths):
+                self.on_ready(path)
+
+    def _settled(self, paths: Iterable[Path]) -> List[Path]:
+        """
+        Re-stat pending paths and take the ones that have settled.
+
+        Args:
+            paths: Paths to check
+
+        Returns:
+            Paths whose size and mtime were unchanged for settle_seconds
+        """
+        now = time.monotonic()
+        ready = []
+        for path in paths:
+            try:
+                stat = os.stat(path)
+                signature = (stat.st_size, stat.st_mtime_ns)
+            except OSError:
+                signature = None
+
+            with self._condition:
+                pending = self._pending.get(path)
+                if pending is None:
+                    continue
+                if signature is None:
+                    # Gone (or not readable yet): drop it, a new event re-adds it
+                    del self._pending[path]
+                    continue
+                if signature != pending.signature:
+                    pending.signature = signature
+                    pending.stable_since = now
+                    continue
+                if now - pending.stable_since >= self.settle_seconds:
+                    del self._pending[path]
+                    ready.append(path)
+        return ready
@@ -0,0 +1,7 @@
+from .archives import ARCHIVE_TYPES, extract_members
+from .pool import ExtractorPool, format_facts
+from .registry import EXTRACTORS, Extractor, load_plugins, register
+from .sniff import describe, sniff, sniff_file
+
+# Built-in extractors register themselves on import
+from . import archives, documents, images, media, profiler  # noqa: E402,F401
@@ -0,0 +1,223 @@
+"""
+Archive introspection: ZIP and tar listings without extracting.
+
+A ZIP's central directory, or a tar's member headers, say what an archive
+holds without writing anything to disk. The listing reports members with
+their sizes and compression ratios, and flags archives that look like
+decompression bombs:
+
+    - overall or per-member compression ratio beyond MAX_RATIO / MAX_MEMBER_RATIO
+    - declared total size beyond MAX_TOTAL_SIZE, or more than MAX_MEMBERS members
+    - overlapping ZIP entries (several members sharing compressed data)
+    - member paths escaping the archive root ('..' or absolute)
+
+extract_members() streams selected members out of an archive (used to
+feed them to the drop pipeline as child items); it refuses flagged
+archives and stops any member that inflates beyond its limit.
+"""
+
+import os
+import posixpath
+import shutil
+import tarfile
+import zipfile
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Set, Tuple
+
+from .registry import register
+
+ZIP_TYPES = {'application/zip'}
+TAR_TYPES = {'application/x-tar', 'application/gzip', 'application/x-bzip2', 'application/x-xz'}
+ARCHIVE_TYPES = ZIP_TYPES | TAR_TYPES
+
+MAX_RATIO = 100
+MAX_MEMBER_RATIO = 1000
+MAX_TOTAL_SIZE = 10 * 1024 ** 3
+MAX_MEMBERS = 100000
+
+# Members listed in the front matter (all are counted)
+MAX_LISTED = 50
+EXTENSIONS_LISTED = 10
+
+COPY_CHUNK = 1024 * 1024
+
+
+def _unsafe(name: str) -> bool:
+    """Check whether a member path would land outside the extraction root."""
+    name = name.replace('\\', '/')
+    return name.startswith('/') or '..' in name.split('/') or (len(name) > 1 and name[1] == ':')
+
+
+def _ratio(size: int, compressed: int) -> float:
+    """Compression ratio, rounded for display."""
+    return round(size / compressed, 1) if compressed else 0.0
+
+
+def _summarise(
+    fmt: str,
+    path: str,
+    entries: List[Dict[str, Any]],
+    directories: int,
+    total: int,
+    compressed: int,
+    suspicious: List[str]
+) -> Dict[str, Any]:
+    """Common facts for ZIP and tar listings."""
+    archive_size = os.path.getsize(path)
+    ratio = _ratio(total, compressed or archive_size)
+    if ratio > MAX_RATIO:
+        suspicious.append(f'compression ratio {ratio:g}')
+    if total > MAX_TOTAL_SIZE:
+        suspicious.append(f'{total} bytes uncompressed')
+    if len(entries) > MAX_MEMBERS:
+        suspicious.append(f'{len(entries)} members')
+    unsafe = sum(1 for entry in entries if _unsafe(entry['name']))
+    if unsafe:
+        suspicious.append(f'{unsafe} member path(s) outside the archive root')
+
+    extensions = Counter(posixpath.splitext(entry['name'])[1].lower() or '(none)' for entry in entries)
+    facts: Dict[str, Any] = {
+        'format': fmt,
+        'members': len(entries),
+        'directories': directories,
+        'total_size': total,
+        'compression_ratio': ratio,
+        'extensions': dict(extensions.most_common(EXTENSIONS_LISTED)),
+        'entries': entries[:MAX_LISTED],
+    }
+    if len(entries) > MAX_LISTED:
+        facts['entries_truncated'] = True
+    if suspicious:
+        facts['suspicious'] = suspicious
+    return facts
+
+
+@register(*ZIP_TYPES, timeout=30)
+def zip_listing(path: str) -> Dict[str, Any]:
+    """List a ZIP archive from its central directory."""
+    with zipfile.ZipFile(path) as archive:
+        infos = archive.infolist()
+
+    entries = []
+    directories = total = compressed = encrypted = 0
+    suspicious: List[str] = []
+    for info in infos:
+        if info.is_dir():
+            directories += 1
+            continue
+        entry = {
+            'name': info.filename,
+            'size': info.file_size,
+            'ratio': _ratio(info.file_size, info.compress_size),
+        }
+        if info.flag_bits & 0x1:
+            entry['encrypted'] = True
+            encrypted += 1
+        entries.append(entry)
+        total += info.file_size
+        compressed += info.compress_size
+        if entry['ratio'] > MAX_MEMBER_RATIO:
+            suspicious.append(f"{info.filename}: compression ratio {entry['ratio']:g}")
+
+    # Entries of an honest ZIP never share compressed data
+    spans = sorted((info.header_offset, info.header_offset + info.compress_size) for info in infos)
+    if any(start < previous_end for (_, previous_end), (start, _) in zip(spans, spans[1:])):
+        suspicious.append('overlapping entries')
+
+    facts = _summarise('zip', path, entries, directories, total, compressed, suspicious[:10])
+    if encrypted:
+        facts['encrypted_members'] = encrypted
+    return facts
+
+
+@register(*TAR_TYPES, timeout=60)
+def tar_listing(path: str) -> Dict[str, Any]:
+    """List a (possibly compressed) tar archive from its member headers."""
+    entries = []
+    directories = total = 0
+    suspicious: List[str] = []
+    try:
+        with tarfile.open(path, 'r|*') as archive:
+            for info in archive:
+                if info.isdir():
+                    directories += 1
+                elif info.isfile():
+                    entries.append({'name': info.name, 'size': info.size})
+                    total += info.size
+                elif info.issym() or info.islnk():
+                    if _unsafe(info.linkname):
+                        suspicious.append(f'{info.name}: link outside the archive root')
+                if len(entries) > MAX_MEMBERS:
+                    break
+    except tarfile.ReadError:
+        # A compressed single file, not a tar
+        return {'format': 'compressed file', 'tar': False}
+
+    return _summarise('tar', path, entries, directories, total, 0, suspicious[:10])
+
+
+def _iter_zip(path: Path, wanted: Set[str], max_bytes: int) -> Iterator[Tuple[str, Any]]:
+    """Open wanted, unencrypted ZIP members of acceptable size."""
+    with zipfile.ZipFile(path) as archive:
+        for info in archive.infolist():
+            if info.is_dir() or info.flag_bits & 0x1 or info.file_size > max_bytes:
+                continue
+            if posixpath.splitext(info.filename)[1].lower() in wanted and not _unsafe(info.filename):
+                with archive.open(info) as member:
+                    yield info.filename, member
+
+
+def _iter_tar(path: Path, wanted: Set[str], max_bytes: int) -> Iterator[Tuple[str, Any]]:
+    """Open wanted tar members (regular files) of acceptable size."""
+    with tarfile.open(path, 'r|*') as archive:
+        for info in archive:
+            if not info.isfile() or info.size > max_bytes:
+                continue
+            if posixpath.splitext(info.name)[1].lower() in wanted and not _unsafe(info.name):
+                member = archive.extractfile(info)
+                if member is not None:
+                    yield info.name, member
+
+
+def extract_members(
+    path: Path,
+    content_type: str,
+    wanted: Set[str],
+    max_bytes: int,
+    staging: Path
+) -> Iterator[Tuple[str, Path]]:
+    """
+    Stream selected members out of an archive one at a time.
+
+    Each member is copied in chunks to its own directory under staging
+    and yielded; it is deleted when the caller asks for the next one.
+    A member that inflates beyond max_bytes (a lying header) is dropped.
+
+    Args:
+        path: Archive file
+        content_type: Its sniffed content type (one of ARCHIVE_TYPES)
+        wanted: Member extensions to extract (e.g. {'.pdf', '.csv'})
+        max_bytes: Largest member extracted
+        staging: Directory for the extracted member files
+
+    Yields:
+        (member name inside the archive, path of the extracted copy)
+    """
+    members = _iter_zip if content_type in ZIP_TYPES else _iter_tar
+    for index, (name, source) in enumerate(members(path, wanted, max_bytes)):
+        target_dir = staging / str(index)
+        target_dir.mkdir(parents=True)
+        target = target_dir / posixpath.basename(name)
+
+        written = 0
+        with open(target, 'wb') as out:
+            while written <= max_bytes:
+                chunk = source.read(COPY_CHUNK)
+                if not chunk:
+                    break
+                out.write(chunk)
+                written += len(chunk)
+        if written <= max_bytes:
+            yield name, target
+        shutil.rmtree(target_dir, ignore_errors=True)
@@ -0,0 +1,113 @@
+"""
+Document extractors: PDF structure and Office Open XML properties.
+
+Neither needs a third-party library: a PDF's page objects and trailer
+are found with byte patterns (good for counts and flags, not for text),
+and .docx/.xlsx/.pptx are ZIP packages whose docProps/*.xml parts hold
+the title, author and page/word/slide counts.
+"""
+
+import re
+import zipfile
+from typing import Any, Dict
+from xml.etree import ElementTree
+
+from .registry import register
+from .sniff import OOXML_FOLDERS
+
+# PDFs larger than this are only partially scanned (page count is then a lower bound)
+PDF_SCAN_LIMIT = 64 * 1024 * 1024
+
+PDF_PAGE = re.compile(rb'/Type\s*/Page(?![a-zA-Z])')
+PDF_PAGE_COUNT = re.compile(rb'/Type\s*/Pages\b[^>]*?/Count\s+(\d+)', re.S)
+PDF_INFO_FIELD = re.compile(rb'/(Title|Author|Creator|Producer)\s*\(((?:\\.|[^\\)])*)\)')
+
+# Namespaces of the docProps parts
+CORE_NS = {
+    'dc': 'http://purl.org/dc/elements/1.1/',
+    'cp': 'http://schemas.openxmlformats.org/package/2006/metadata/core-properties',
+    'dcterms': 'http://purl.org/dc/terms/',
+}
+APP_NS = {'ep': 'http://schemas.openxmlformats.org/officeDocument/2006/extended-properties'}
+SHEET_NS = {'s': 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'}
+
+# Zip members are small XML parts; refuse anything bigger (zip bombs)
+MAX_PART_SIZE = 4 * 1024 * 1024
+
+
+@register('application/pdf', timeout=15)
+def pdf(path: str) -> Dict[str, Any]:
+    """Read the PDF version, page count, encryption flag and Info fields."""
+    with open(path, 'rb') as f:
+        data = f.read(PDF_SCAN_LIMIT)
+        truncated = bool(f.read(1))
+
+    facts: Dict[str, Any] = {'version': data[5:8].decode('ascii', 'replace')}
+    # The page tree root states the total; count page objects if it is in a compressed stream
+    counts = [int(count) for count in PDF_PAGE_COUNT.findall(data)]
+    facts['pages'] = max(counts) if counts else len(PDF_PAGE.findall(data))
+    facts['encrypted'] = b'/Encrypt' in data
+    for field, value in PDF_INFO_FIELD.findall(data):
+        key = field.decode().lower()
+        if key not in facts:
+            text = value.decode('latin-1').replace('\\(', '(').replace('\\)', ')').strip()
+            if text:
+                facts[key] = text[:200]
+    if truncated:
+        facts['partial_scan'] = True
+    return facts
+
+
+def _read_part(archive: zipfile.ZipFile, name: str):
+    """Parse one XML part of an Office package, or None if absent or oversized."""
+    try:
+        info = archive.getinfo(name)
+    except KeyError:
+        return None
+    if info.file_size > MAX_PART_SIZE:
+        return None
+    return ElementTree.fromstring(archive.read(info))
+
+
+def _text(root, path: str, namespaces: Dict[str, str]):
+    """Text of the first element matching path, if non-empty."""
+    element = root.find(path, namespaces) if root is not None else None
+    if element is not None and element.text and element.text.strip():
+        return element.text.strip()
+    return None
+
+
+@register(*OOXML_FOLDERS.values(), timeout=10)
+def ooxml(path: str) -> Dict[str, Any]:
+    """Read core and extended properties of a .docx/.xlsx/.pptx package."""
+    facts: Dict[str, Any] = {}
+    with zipfile.ZipFile(path) as archive:
+        core = _read_part(archive, 'docProps/core.xml')
+        for key, element in [
+            ('title', 'dc:title'),
+            ('author', 'dc:creator'),
+            ('last_modified_by', 'cp:lastModifiedBy'),
+            ('created', 'dcterms:created'),
+            ('modified', 'dcterms:modified'),
+        ]:
+            value = _text(core, element, CORE_NS)
+            if value:
+                facts[key] = value[:200]
+
+        app = _read_part(archive, 'docProps/app.xml')
+        for key, element in [
+            ('application', 'ep:Application'),
+            ('pages', 'ep:Pages'),
+            ('words', 'ep:Words'),
+            ('slides', 'ep:Slides'),
+        ]:
+            value = _text(app, element, APP_NS)
+            if value:
+                facts[key] = int(value) if value.isdigit() else value
+
+        workbook = _read_part(archive, 'xl/workbook.xml')
+        if workbook is not None:
+            facts['sheets'] = [
+                sheet.get('name') for sheet in workbook.iterfind('s:sheets/s:sheet', SHEET_NS)
+            ]
+    return facts
@@ -0,0 +1,69 @@
+"""
+Image extractors: dimensions and colour format from the file header.
+"""
+
+import struct
+from typing import Any, Dict
+
+from .registry import register
+
+PNG_COLOR_TYPES = {0: 'grayscale', 2: 'rgb', 3: 'palette', 4: 'grayscale+alpha', 6: 'rgba'}
+
+# JPEG start-of-frame markers (C4, C8 and CC are other segments)
+JPEG_SOF_MARKERS = set(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+@register('image/png', timeout=5)
+def png(path: str) -> Dict[str, Any]:
+    """Read width, height and colour format from the IHDR chunk."""
+    with open(path, 'rb') as f:
+        header = f.read(29)
+    if len(header) < 29 or header[12:16] != b'IHDR':
+        raise ValueError('missing IHDR chunk')
+    width, height, bit_depth, color_type, _, _, interlace = struct.unpack('>IIBBBBB', header[16:29])
+    return {
+        'width': width,
+        'height': height,
+        'bit_depth': bit_depth,
+        'color': PNG_COLOR_TYPES.get(color_type, f'type {color_type}'),
+        'interlaced': interlace == 1,
+    }
+
+
+@register('image/gif', timeout=5)
+def gif(path: str) -> Dict[str, Any]:
+    """Read the logical screen size and GIF version."""
+    with open(path, 'rb') as f:
+        header = f.read(10)
+    if len(header) < 10:
+        raise ValueError('truncated header')
+    width, height = struct.unpack('<HH', header[6:10])
+    return {'width': width, 'height': height, 'version': header[3:6].decode('ascii')}
+
+
+@register('image/jpeg', timeout=5)
+def jpeg(path: str) -> Dict[str, Any]:
+    """Walk the marker segments up to the start-of-frame header."""
+    with open(path, 'rb') as f:
+        f.read(2)  # SOI
+        while True:
+            marker = f.read(2)
+            if len(marker) < 2 or marker[0] != 0xFF:
+                raise ValueError('no start-of-frame segment')
+            if marker[1] == 0xFF:  # fill byte
+                f.seek(-1, 1)
+                continue
+            length_bytes = f.read(2)
+            if len(length_bytes) < 2:
+                raise ValueError('truncated segment')
+            length = struct.unpack('>H', length_bytes)[0]
+            if marker[1] in JPEG_SOF_MARKERS:
+                precision, height, width, components = struct.unpack('>BHHB', f.read(6))
+                return {
+                    'width': width,
+                    'height': height,
+                    'bit_depth': precision,
+                    'components': components,
+                    'progressive': marker[1] in (0xC2, 0xC6, 0xCA, 0xCE),
+                }
+            f.seek(length - 2, 1)
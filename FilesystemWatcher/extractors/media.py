@@ -0,0 +1,22 @@
+"""
+Audio extractors: format and duration from the file header.
+"""
+
+import wave
+from typing import Any, Dict
+
+from .registry import register
+
+
+@register('audio/wav', timeout=5)
+def wav(path: str) -> Dict[str, Any]:
+    """Read channels, sample rate and duration of a PCM WAV file."""
+    with wave.open(path, 'rb') as audio:
+        rate = audio.getframerate()
+        frames = audio.getnframes()
+        return {
+            'channels': audio.getnchannels(),
+            'sample_rate': rate,
+            'bits_per_sample': audio.getsampwidth() * 8,
+            'duration_seconds': round(frames / rate, 2) if rate else None,
+        }
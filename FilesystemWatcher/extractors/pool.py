@@ -0,0 +1,243 @@
+"""
+Process pool running metadata extractors with time and memory limits.
+
+Parsers of untrusted files can hang, recurse or balloon, so they run in
+separate worker processes. Inside a worker each call gets an address
+space limit (RLIMIT_AS, relative to what the worker already uses) and
+an interval timer; the parent also gives up after the timeout plus a
+grace period and replaces the pool if a worker is stuck in C code or
+died. A failed extraction never fails the file: the result is just an
+'error' fact.
+"""
+
+import json
+import multiprocessing
+import os
+import signal
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from .registry import EXTRACTORS, ExtractorFunc
+
+# Extra seconds the parent waits before assuming a worker is stuck
+GRACE_SECONDS = 2.0
+
+
+class ExtractorTimeout(Exception):
+    """Raised inside a worker when an extractor exceeds its time limit."""
+
+
+def _on_alarm(signum, frame):
+    raise ExtractorTimeout()
+
+
+def _address_space() -> int:
+    """Bytes of address space this process uses now (0 if unknown)."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[0]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def _run_limited(func: ExtractorFunc, path: str, timeout: float, memory_bytes: int) -> Dict[str, Any]:
+    """Worker side: run one extractor under an alarm and an address space limit."""
+    previous_limit = None
+    if resource is not None and memory_bytes > 0:
+        soft, hard = resource.getrlimit(resource.RLIMIT_AS)
+        limit = _address_space() + memory_bytes
+        if hard != resource.RLIM_INFINITY:
+            limit = min(limit, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+        previous_limit = (soft, hard)
+
+    previous_handler = None
+    if timeout > 0 and hasattr(signal, 'setitimer'):
+        previous_handler = signal.signal(signal.SIGALRM, _on_alarm)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+
+    try:
+        return func(path)
+    finally:
+        if previous_handler is not None:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous_handler)
+        if previous_limit is not None:
+            resource.setrlimit(resource.RLIMIT_AS, previous_limit)
+
+
+class ExtractorPool:
+    """
+    Runs registered extractors for dropped files in worker processes.
+
+    Attributes:
+        workers: Number of worker processes (0 disables extraction)
+        timeout: Default seconds allowed per extraction
+        memory_mb: Default extra memory allowed per extraction, in MB
+    """
+
+    def __init__(self, workers: int = 2, timeout: float = 10.0, memory_mb: int = 512):
+        """
+        Initialize the pool (worker processes start on first use).
+
+        Args:
+            workers: Number of worker processes
+            timeout: Default time limit in seconds
+            memory_mb: Default memory limit in MB
+        """
+        self.workers = max(0, workers)
+        self.timeout = timeout
+        self.memory_mb = memory_mb
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> 'ExtractorPool':
+        """
+        Create a pool configured from the environment.
+
+        Environment Variables:
+            FILESYSTEM_EXTRACT_WORKERS: Extractor processes (default: 2, 0 disables)
+            FILESYSTEM_EXTRACT_TIMEOUT: Seconds per extraction (default: 10)
+            FILESYSTEM_EXTRACT_MEMORY_MB: Memory per extraction in MB (default: 512)
+
+        Returns:
+            Configured pool
+        """
+        return cls(
+            workers=int(os.getenv('FILESYSTEM_EXTRACT_WORKERS', '2')),
+            timeout=float(os.getenv('FILESYSTEM_EXTRACT_TIMEOUT', '10')),
+            memory_mb=int(os.getenv('FILESYSTEM_EXTRACT_MEMORY_MB', '512'))
+        )
+
+    def handles(self, content_type: str) -> bool:
+        """
+        Check whether a content type has an extractor (and extraction is on).
+
+        Args:
+            content_type: MIME content type
+
+        Returns:
+            True if extract() would run an extractor
+        """
+        return self.workers > 0 and content_type in EXTRACTORS
+
+    def extract(self, path: Path, content_type: str) -> Optional[Dict[str, Any]]:
+        """
+        Extract facts about a file.
+
+        Safe to call from several threads; calls block until the
+        extraction finishes or times out.
+
+        Args:
+            path: File to inspect
+            content_type: Its sniffed content type
+
+        Returns:
+            Extracted facts (with an 'error' entry if the extractor
+            failed), or None if no extractor handles the content type
+        """
+        if not self.handles(content_type):
+            return None
+        extractor = EXTRACTORS[content_type]
+        timeout = extractor.timeout or self.timeout
+        memory_mb = extractor.memory_mb or self.memory_mb
+
+        try:
+            future = self._pool().submit(
+                _run_limited, extractor.func, str(path), timeout, memory_mb * 1024 * 1024
+            )
+            return future.result(timeout=timeout + GRACE_SECONDS)
+        except ExtractorTimeout:
+            return {'error': f'timed out after {timeout:g}s'}
+        except FuturesTimeoutError:
+            self._recycle()
+            return {'error': f'timed out after {timeout:g}s (worker replaced)'}
+        except BrokenProcessPool:
+            self._recycle()
+            return {'error': 'worker process died'}
+        except MemoryError:
+            return {'error': f'exceeded {memory_mb} MB'}
+        except Exception as e:
+            return {'error': f'{type(e).__name__}: {e}'}
+
+    def _pool(self) -> ProcessPoolExecutor:
+        """Get the executor, starting it on first use."""
+        with self._lock:
+            if self._executor is None:
+                # A fresh interpreter per worker: forking a threaded watcher can deadlock
+                methods = multiprocessing.get_all_start_methods()
+                context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+                self._executor = ProcessPoolExecutor(self.workers, mp_context=context)
+            return self._executor
+
+    def _recycle(self) -> None:
+        """Kill the current workers (one is stuck or dead) and start afresh on next use."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is None:
+            return
+        terminate = getattr(executor, 'terminate_workers', None)  # Python 3.14+
+        if terminate is not None:
+            terminate()
+            return
+        processes: List[multiprocessing.Process] = list((executor._processes or {}).values())
+        executor.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            process.terminate()
+
+    def close(self) -> None:
+        """Shut down the worker processes."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+
+def format_facts(facts: Dict[str, Any], indent: int = 2) -> List[str]:
+    """
+    Render extracted facts as YAML lines for the action file front matter.
+
+    Strings are written JSON-quoted (valid YAML scalars) so names with
+    colons or quotes cannot break the front matter.
+
+    Args:
+        facts: Extracted facts
+        indent: Spaces before each top-level key
+
+    Returns:
+        Lines without trailing newlines
+    """
+    pad = ' ' * indent
+    lines = []
+    for key, value in facts.items():
+        if isinstance(value, dict):
+            if not value:
+                lines.append(f'{pad}{key}: {{}}')
+                continue
+            lines.append(f'{pad}{key}:')
+            lines.extend(format_facts(value, indent + 2))
+        elif isinstance(value, (list, tuple)):
+            if not value:
+                lines.append(f'{pad}{key}: []')
+                continue
+            lines.append(f'{pad}{key}:')
+            for element in value:
+                if isinstance(element, dict) and element:
+                    first, *rest = format_facts(element, indent + 4)
+                    lines.append(f'{pad}  - {first.lstrip()}')
+                    lines.extend(rest)
+                else:
+                    lines.append(f'{pad}  - {json.dumps(element, ensure_ascii=False, default=str)}')
+        else:
+            lines.append(f'{pad}{key}: {json.dumps(value, ensure_ascii=False, default=str)}')
+    return lines
@@ -0,0 +1,274 @@
+"""
+Streaming profiles of delimited data and plain text files.
+
+A large CSV or log dropped into the folder should be understood from
+its action file, not by loading it into the LLM context. These
+extractors read the file once, in bounded memory (fixed-size chunks and
+per-column running statistics), and report:
+
+    CSV/TSV: row count, column names, inferred types, null counts and
+             min/max of numeric and date columns
+    Text:    line count, encoding and the first few lines
+
+A profile that runs out of time reports what it has read so far with
+partial_scan set, instead of failing.
+
+Environment Variables:
+    FILESYSTEM_PROFILE_TIMEOUT: Seconds allowed per profile (default: 5)
+    FILESYSTEM_PROFILE_PREVIEW_LINES: Lines of a text file quoted (default: 10)
+"""
+
+import codecs
+import csv
+import itertools
+import os
+import re
+import time
+from typing import Any, Dict, List, Optional
+
+from .registry import register
+
+# Extraction runs inline with ingestion, so a huge file gets a partial profile
+# rather than holding up every other drop
+PROFILE_TIMEOUT = float(os.getenv('FILESYSTEM_PROFILE_TIMEOUT', '5'))
+PREVIEW_LINES = int(os.getenv('FILESYSTEM_PROFILE_PREVIEW_LINES', '10'))
+
+CHUNK_SIZE = 1024 * 1024
+SAMPLE_SIZE = 64 * 1024
+
+# Columns beyond this are counted but not profiled
+MAX_COLUMNS = 50
+# Preview lines and column names are clipped to this many characters
+MAX_TEXT = 200
+# Rows read and profiled at a time
+BATCH_ROWS = 10000
+
+NULL_TOKENS = {'', 'na', 'n/a', 'null', 'none', 'nan', '-'}
+BOOLEAN_TOKENS = {'true', 'false', 'yes', 'no'}
+ISO_DATE = re.compile(r'\d{4}-\d{2}-\d{2}([ T]\d{2}:\d{2}(:\d{2}(\.\d+)?)?(Z|[+-]\d{2}:?\d{2})?)?$')
+
+
+def _deadline() -> float:
+    """Stop reading a little before the pool's time limit, to report a partial profile."""
+    return time.monotonic() + PROFILE_TIMEOUT * 0.8
+
+
+def detect_encoding(path: str) -> str:
+    """
+    Guess a text file's encoding from its byte order mark and first bytes.
+
+    Args:
+        path: File to inspect
+
+    Returns:
+        Codec name: utf-8-sig, utf-16, utf-8, or latin-1 as the fallback
+    """
+    with open(path, 'rb') as f:
+        sample = f.read(SAMPLE_SIZE)
+    if sample.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    if sample.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return 'utf-16'
+    try:
+        sample.decode('utf-8')
+    except UnicodeDecodeError as e:
+        if not (e.start >= len(sample) - 3 and e.reason == 'unexpected end of data'):
+            return 'latin-1'
+    return 'utf-8'
+
+
+def _clip(text: str) -> str:
+    """Shorten text for the front matter."""
+    text = text.rstrip('\r')
+    return text if len(text) <= MAX_TEXT else text[:MAX_TEXT] + '…'
+
+
+def _is_null(value: str) -> bool:
+    """Check whether a stripped cell counts as missing."""
+    return not value or (len(value) <= 4 and value.lower() in NULL_TOKENS)
+
+
+def _classify(values: List[str]):
+    """
+    Infer the common type of non-null cells.
+
+    Whole batches go through int()/float() via map(), so a clean
+    numeric column costs one C-level pass instead of a Python loop.
+
+    Returns:
+        (type name, numbers for numeric types or None)
+    """
+    try:
+        return 'integer', list(map(int, values))
+    except ValueError:
+        pass
+    try:
+        return 'number', list(map(float, values))
+    except ValueError:
+        pass
+    if all(value.lower() in BOOLEAN_TOKENS for value in values):
+        return 'boolean', None
+    if all(map(ISO_DATE.match, values)):
+        return 'date', None
+    return 'string', None
+
+
+class ColumnProfile:
+    """Running statistics of one column."""
+
+    __slots__ = ('name', 'type', 'nulls', 'minimum', 'maximum')
+
+    def __init__(self, name: str):
+        self.name = name
+        self.type: Optional[str] = None
+        self.nulls = 0
+        self.minimum = None
+        self.maximum = None
+
+    def add_many(self, values: List[str]) -> None:
+        """Account for a batch of cells."""
+        present = [value for value in map(str.strip, values) if not _is_null(value)]
+        self.nulls += len(values) - len(present)
+        if not present or self.type == 'string':
+            return
+
+        kind, numbers = _classify(present)
+        if self.type is not None and kind != self.type:
+            if {self.type, kind} == {'integer', 'number'}:
+                kind = 'number'
+            else:
+                self.type, self.minimum, self.maximum = 'string', None, None
+                return
+        self.type = kind
+
+        ordered = numbers if numbers is not None else (present if kind == 'date' else None)
+        if ordered:
+            low, high = min(ordered), max(ordered)
+            if self.minimum is None or low < self.minimum:
+                self.minimum = low
+            if self.maximum is None or high > self.maximum:
+                self.maximum = high
+
+    def summary(self) -> Dict[str, Any]:
+        """Profile of the column for the front matter."""
+        summary: Dict[str, Any] = {
+            'name': _clip(self.name),
+            'type': self.type or 'empty',
+            'nulls': self.nulls,
+        }
+        if self.minimum is not None:
+            summary['min'] = self.minimum
+            summary['max'] = self.maximum
+        return summary
+
+
+@register('text/csv', 'text/tab-separated-values', timeout=PROFILE_TIMEOUT)
+def delimited(path: str) -> Dict[str, Any]:
+    """Profile a CSV/TSV file in batches of rows."""
+    encoding = detect_encoding(path)
+    with open(path, newline='', encoding=encoding, errors='replace', buffering=CHUNK_SIZE) as f:
+        sample = f.read(SAMPLE_SIZE)
+        sample = sample[:sample.rfind('\n') + 1] or sample
+        f.seek(0)
+
+        sniffer = csv.Sniffer()
+        try:
+            dialect = sniffer.sniff(sample, delimiters=',;|\t')
+        except csv.Error:
+            dialect = csv.excel
+        try:
+            has_header = sniffer.has_header(sample)
+        except csv.Error:
+            has_header = True
+
+        reader = csv.reader(f, dialect)
+        first = next(reader, None)
+        if first is None:
+            return {'encoding': encoding, 'rows': 0, 'columns': []}
+
+        if has_header:
+            names = first
+        else:
+            names = [f'column_{i + 1}' for i in range(len(first))]
+        columns = [ColumnProfile(name) for name in names[:MAX_COLUMNS]]
+
+        facts: Dict[str, Any] = {
+            'encoding': encoding,
+            'delimiter': dialect.delimiter,
+            'header': has_header,
+        }
+        rows = ragged = 0
+        deadline = _deadline()
+        batch = [] if has_header else [first]
+
+        while not facts.get('partial_scan'):
+            try:
+                batch.extend(itertools.islice(reader, BATCH_ROWS - len(batch)))
+            except csv.Error as e:
+                # Profile the rows read so far, then stop
+                facts['malformed'] = f'after row {rows + len(batch)}: {e}'
+                facts['partial_scan'] = True
+            if not batch:
+                break
+
+            rows += len(batch)
+            ragged += sum(1 for row in batch if len(row) != len(names))
+            for i, column in enumerate(columns):
+                column.add_many([row[i] if i < len(row) else '' for row in batch])
+            batch = []
+
+            if time.monotonic() > deadline:
+                facts['partial_scan'] = True
+
+    facts['rows'] = rows
+    facts['column_count'] = len(names)
+    if ragged:
+        facts['ragged_rows'] = ragged
+    facts['columns'] = [column.summary() for column in columns]
+    return facts
+
+
+@register('text/plain', timeout=PROFILE_TIMEOUT)
+def text(path: str) -> Dict[str, Any]:
+    """Count lines and quote the first few, decoding in fixed-size chunks."""
+    encoding = detect_encoding(path)
+    decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+    facts: Dict[str, Any] = {'encoding': encoding}
+
+    lines = 0
+    preview: List[str] = []
+    partial = ''
+    last_char = ''
+    deadline = _deadline()
+
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(CHUNK_SIZE)
+            decoded = decoder.decode(chunk, final=not chunk)
+            if decoded:
+                lines += decoded.count('\n')
+                last_char = decoded[-1]
+                if len(preview) < PREVIEW_LINES:
+                    parts = decoded.split('\n')
+                    parts[0] = partial + parts[0]
+                    for part in parts[:-1]:
+                        if len(preview) == PREVIEW_LINES:
+                            break
+                        preview.append(_clip(part))
+                    # Keep one character more than is quoted, to know it was clipped
+                    partial = parts[-1][:MAX_TEXT + 2]
+            if not chunk:
+                break
+            if time.monotonic() > deadline:
+                facts['partial_scan'] = True
+                break
+
+    # A last line without a trailing newline still counts
+    if last_char and last_char != '\n' and not facts.get('partial_scan'):
+        lines += 1
+        if len(preview) < PREVIEW_LINES:
+            preview.append(_clip(partial))
+
+    facts['lines'] = lines
+    facts['preview'] = preview
+    return facts
@@ -0,0 +1,91 @@
+"""
+Registry of metadata extractors keyed by content type.
+
+An extractor is a module-level function taking a file path (str) and
+returning a dict of facts about the file: numbers, short strings, and
+lists or dicts of those. It runs in a worker process, so it must be
+importable by name and must not rely on state set up in the watcher.
+
+Register one with the decorator:
+
+    @register('image/png', timeout=5)
+    def png(path):
+        ...
+
+Third-party extractors live in any importable module that registers
+itself this way; list such modules in FILESYSTEM_EXTRACTOR_PLUGINS.
+"""
+
+import importlib
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional
+
+ExtractorFunc = Callable[[str], Dict[str, Any]]
+
+
+class Extractor(NamedTuple):
+    """
+    A registered extractor and its limits.
+
+    Attributes:
+        name: Qualified function name (for logs)
+        func: The extractor function
+        timeout: Seconds allowed (None: the pool default)
+        memory_mb: Extra memory allowed in MB (None: the pool default)
+    """
+    name: str
+    func: ExtractorFunc
+    timeout: Optional[float]
+    memory_mb: Optional[int]
+
+
+# Content type -> extractor
+EXTRACTORS: Dict[str, Extractor] = {}
+
+
+def register(
+    *content_types: str,
+    timeout: Optional[float] = None,
+    memory_mb: Optional[int] = None
+) -> Callable[[ExtractorFunc], ExtractorFunc]:
+    """
+    Register a function as the extractor for one or more content types.
+
+    A later registration for the same content type replaces the earlier
+    one, so plugins can override the built-in extractors.
+
+    Args:
+        content_types: MIME content types handled
+        timeout: Per-call time limit in seconds
+        memory_mb: Per-call memory limit in MB
+
+    Returns:
+        Decorator returning the function unchanged
+    """
+    def decorator(func: ExtractorFunc) -> ExtractorFunc:
+        extractor = Extractor(f'{func.__module__}.{func.__qualname__}', func, timeout, memory_mb)
+        for content_type in content_types:
+            EXTRACTORS[content_type] = extractor
+        return func
+    return decorator
+
+
+def load_plugins(modules: Iterable[str]) -> List[str]:
+    """
+    Import plugin modules so their extractors register themselves.
+
+    Args:
+        modules: Dotted module names
+
+    Returns:
+        Error messages for modules that could not be imported
+    """
+    errors = []
+    for module in modules:
+        module = module.strip()
+        if not module:
+            continue
+        try:
+            importlib.import_module(module)
+        except Exception as e:
+            errors.append(f'{module}: {e}')
+    return errors
@@ -0,0 +1,197 @@
+"""
+Content-type detection from a file's leading bytes.
+
+A dropped file's extension is only a hint (renamed, missing, or simply
+wrong), so the extractor for a file is chosen by sniffing the magic
+bytes at its start. ZIP containers are opened just far enough to read
+the central directory, which tells Office documents apart from plain
+archives.
+"""
+
+import codecs
+import csv
+import zipfile
+from collections import Counter
+from pathlib import Path
+from typing import Tuple
+
+# Bytes read from the start of a file for sniffing
+HEAD_SIZE = 4096
+
+OCTET_STREAM = 'application/octet-stream'
+
+# (offset, magic bytes, content type), checked in order
+MAGIC = [
+    (0, b'%PDF-', 'application/pdf'),
+    (0, b'\x89PNG\r\n\x1a\n', 'image/png'),
+    (0, b'\xff\xd8\xff', 'image/jpeg'),
+    (0, b'GIF87a', 'image/gif'),
+    (0, b'GIF89a', 'image/gif'),
+    (0, b'PK\x03\x04', 'application/zip'),
+    (0, b'PK\x05\x06', 'application/zip'),
+    (0, b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1', 'application/x-ole-storage'),
+    (0, b'Rar!\x1a\x07', 'application/vnd.rar'),
+    (0, b"7z\xbc\xaf'\x1c", 'application/x-7z-compressed'),
+    (0, b'\x1f\x8b', 'application/gzip'),
+    (0, b'BZh', 'application/x-bzip2'),
+    (0, b'\xfd7zXZ\x00', 'application/x-xz'),
+    (257, b'ustar', 'application/x-tar'),
+    (0, b'ID3', 'audio/mpeg'),
+    (0, b'\xff\xfb', 'audio/mpeg'),
+    (4, b'ftyp', 'video/mp4'),
+]
+
+# RIFF containers carry their format at offset 8
+RIFF_FORMATS = {
+    b'WAVE': 'audio/wav',
+    b'AVI ': 'video/x-msvideo',
+    b'WEBP': 'image/webp',
+}
+
+# First-level folders identifying Office Open XML packages
+OOXML_FOLDERS = {
+    'word/': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    'xl/': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    'ppt/': 'application/vnd.openxmlformats-officedocument.presentationml.presentation',
+}
+
+# Content type -> (file type, file category), for files with unknown extensions
+CONTENT_TYPES = {
+    'application/pdf': ('PDF Document', 'document'),
+    OOXML_FOLDERS['word/']: ('Word Document', 'document'),
+    OOXML_FOLDERS['xl/']: ('Excel Spreadsheet', 'spreadsheet'),
+    OOXML_FOLDERS['ppt/']: ('PowerPoint Presentation', 'document'),
+    'application/x-ole-storage': ('Legacy Office Document', 'document'),
+    'text/plain': ('Text File', 'document'),
+    'text/csv': ('CSV File', 'spreadsheet'),
+    'text/tab-separated-values': ('TSV File', 'spreadsheet'),
+    'image/png': ('PNG Image', 'image'),
+    'image/jpeg': ('JPEG Image', 'image'),
+    'image/gif': ('GIF Image', 'image'),
+    'image/webp': ('WebP Image', 'image'),
+    'application/zip': ('ZIP Archive', 'archive'),
+    'application/vnd.rar': ('RAR Archive', 'archive'),
+    'application/x-7z-compressed': ('7-Zip Archive', 'archive'),
+    'application/gzip': ('Gzip Archive', 'archive'),
+    'application/x-bzip2': ('Bzip2 Archive', 'archive'),
+    'application/x-xz': ('XZ Archive', 'archive'),
+    'application/x-tar': ('Tar Archive', 'archive'),
+    'audio/mpeg': ('MP3 Audio', 'media'),
+    'audio/wav': ('WAV Audio', 'media'),
+    'video/mp4': ('MP4 Video', 'media'),
+    'video/x-msvideo': ('AVI Video', 'media'),
+}
+
+# Delimiters recognised in delimited text, with their content types
+DELIMITERS = {',': 'text/csv', ';': 'text/csv', '|': 'text/csv', '\t': 'text/tab-separated-values'}
+
+
+def _looks_like_text(head: bytes) -> bool:
+    """Check whether a buffer is text (UTF-8, UTF-16 with BOM, or mostly printable bytes)."""
+    if head.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return True
+    if not head or b'\x00' in head:
+        return False
+    try:
+        head.decode('utf-8')
+        return True
+    except UnicodeDecodeError as e:
+        # A multi-byte character cut off at the end of the buffer is still text
+        if e.start >= len(head) - 3 and e.reason == 'unexpected end of data':
+            return True
+    printable = sum(1 for byte in head if byte >= 0x20 or byte in b'\t\n\r\f')
+    return printable / len(head) >= 0.95
+
+
+def sniff(head: bytes) -> str:
+    """
+    Detect a content type from a file's leading bytes.
+
+    Args:
+        head: First bytes of the file (HEAD_SIZE is enough)
+
+    Returns:
+        MIME content type, or application/octet-stream if unknown
+    """
+    for offset, magic, content_type in MAGIC:
+        if head[offset:offset + len(magic)] == magic:
+            return content_type
+    if head[:4] == b'RIFF' and head[8:12] in RIFF_FORMATS:
+        return RIFF_FORMATS[head[8:12]]
+    if _looks_like_text(head):
+        return _sniff_delimited(head)
+    return OCTET_STREAM
+
+
+def _sniff_delimited(head: bytes) -> str:
+    """
+    Tell delimited data from plain text.
+
+    Text is delimited if most of its first complete lines (at least
+    two) split into the same number (two or more) of fields on one
+    delimiter, quoted fields included.
+    """
+    if head.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        text = head.decode('utf-16', 'ignore')
+    else:
+        text = head.decode('utf-8', 'ignore')
+    lines = text.splitlines()
+    if len(head) >= HEAD_SIZE:
+        lines = lines[:-1]  # probably cut off
+    lines = [line for line in lines if line.strip()][:20]
+    if len(lines) >= 2:
+        for delimiter, content_type in DELIMITERS.items():
+            counts = Counter(len(row) for row in csv.reader(lines, delimiter=delimiter))
+            fields, lines_agreeing = counts.most_common(1)[0]
+            if fields > 1 and lines_agreeing >= max(2, 0.8 * len(lines)):
+                return content_type
+    return 'text/plain'
+
+
+def sniff_file(path: Path) -> str:
+    """
+    Detect a file's content type.
+
+    Args:
+        path: File to inspect
+
+    Returns:
+        MIME content type (application/octet-stream if unknown or unreadable)
+    """
+    try:
+        with open(path, 'rb') as f:
+            head = f.read(HEAD_SIZE)
+    except OSError:
+        return OCTET_STREAM
+
+    content_type = sniff(head)
+    if content_type == 'application/zip':
+        content_type = _sniff_zip(path)
+    return content_type
+
+
+def _sniff_zip(path: Path) -> str:
+    """Tell Office Open XML packages apart from plain ZIP archives."""
+    try:
+        with zipfile.ZipFile(path) as archive:
+            names = archive.namelist()
+    except (OSError, zipfile.BadZipFile):
+        return 'application/zip'
+    if '[Content_Types].xml' in names:
+        for folder, content_type in OOXML_FOLDERS.items():
+            if any(name.startswith(folder) for name in names):
+                return content_type
+    return 'application/zip'
+
+
+def describe(content_type: str) -> Tuple[str, str]:
+    """
+    Get a (file type, file category) label for a content type.
+
+    Args:
+        content_type: MIME content type
+
+    Returns:
+        Labels in the same form as FilesystemWatcher.EXTENSION_MAP
+    """
+    return CONTENT_TYPES.get(content_type, ('unknown', 'other'))
@@ -0,0 +1,146 @@
+"""
+File hashing for the filesystem watcher.
+
+hashlib releases the GIL while digesting large buffers, so several
+files are hashed in parallel on a thread pool. Files are read in large
+chunks, and big files are memory-mapped and digested in one call.
+"""
+
+import hashlib
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+class FileHasher:
+    """
+    Hashes files with a configurable algorithm on a thread pool.
+
+    Attributes:
+        algorithm: hashlib algorithm name (e.g. 'sha256', 'blake2b')
+        workers: Number of hashing threads (1 hashes inline)
+        chunk_size: Read size for files below mmap_threshold
+        mmap_threshold: Files at least this large are memory-mapped
+    """
+
+    def __init__(
+        self,
+        algorithm: str = 'sha256',
+        workers: int = 4,
+        chunk_size: int = 1024 * 1024,
+        mmap_threshold: int = 64 * 1024 * 1024
+    ):
+        """
+        Initialize the hasher.
+
+        Args:
+            algorithm: hashlib algorithm name
+            workers: Number of hashing threads
+            chunk_size: Read buffer size in bytes
+            mmap_threshold: Size in bytes from which files are memory-mapped
+
+        Raises:
+            ValueError: If the algorithm is not available in hashlib
+        """
+        if algorithm not in hashlib.algorithms_available:
+            raise ValueError(f"Unknown hash algorithm: {algorithm}")
+        self.algorithm = algorithm
+        self.workers = max(1, workers)
+        self.chunk_size = chunk_size
+        self.mmap_threshold = mmap_threshold
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @classmethod
+    def from_env(cls) -> 'FileHasher':
+        """
+        Build a hasher from the environment.
+
+        Recognised variables:
+            FILESYSTEM_HASH_ALGORITHM: hashlib algorithm (default: sha256)
+            FILESYSTEM_HASH_WORKERS: Hashing threads (default: 4)
+
+        Returns:
+            Configured FileHasher
+        """
+        return cls(
+            algorithm=os.getenv('FILESYSTEM_HASH_ALGORITHM', 'sha256').lower(),
+            workers=int(os.getenv('FILESYSTEM_HASH_WORKERS', '4')),
+        )
+
+    def format_digest(self, hexdigest: str) -> str:
+        """
+        Format a digest as a dedup key.
+
+        SHA-256 digests stay bare for compatibility with existing
+        processed stores; other algorithms are prefixed with their name.
+
+        Args:
+            hexdigest: Hex digest
+
+        Returns:
+            Key string
+        """
+        if self.algorithm == 'sha256':
+            return hexdigest
+        return f"{self.algorithm}:{hexdigest}"
+
+    def hash_file(self, filepath: Path) -> str:
+        """
+        Hash a whole file.
+
+        Args:
+            filepath: Path to the file
+
+        Returns:
+            Digest key (see format_digest)
+        """
+        digest = hashlib.new(self.algorithm)
+        with open(filepath, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size >= self.mmap_threshold:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    digest.update(mapped)
+            else:
+                buffer = bytearray(self.chunk_size)
+                view = memoryview(buffer)
+                while True:
+                    read = f.readinto(buffer)
+                    if not read:
+                        break
+                    digest.update(view[:read])
+        return self.format_digest(digest.hexdigest())
+
+    def hash_many(self, paths: Iterable[Path]) -> Dict[Path, str]:
+        """
+        Hash several files in parallel.
+
+        Files that disappear or cannot be read are left out of the result.
+
+        Args:
+            paths: Files to hash
+
+        Returns:
+            Mapping of path to digest key
+        """
+        paths = list(paths)
+        if self.workers == 1 or len(paths) < 2:
+            results = map(self._try_hash, paths)
+        else:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix='fte-hash')
+            results = self._executor.map(self._try_hash, paths)
+        return {path: digest for path, digest in zip(paths, results) if digest is not None}
+
+    def _try_hash(self, filepath: Path) -> Optional[str]:
+        """Hash a file, returning None if it cannot be read."""
+        try:
+            return self.hash_file(filepath)
+        except OSError:
+            return None
+
+    def close(self) -> None:
+        """Shut down the hashing threads."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
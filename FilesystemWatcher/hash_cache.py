@@ -0,0 +1,202 @@
+"""
+Persistent file hash cache for the filesystem watcher.
+
+Hashing every file in the drop folder on every poll reads the whole
+folder from disk. The cache remembers each file's hash together with
+its (device, inode, size, mtime_ns) signature, so a file is only read
+again when that signature changes. Misses are hashed in parallel by a
+FileHasher. The cache is saved as JSON with an atomic rename and
+survives restarts; switching hash algorithms starts it afresh.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .file_hasher import FileHasher
+
+# (st_dev, st_ino, st_size, st_mtime_ns)
+Signature = Tuple[int, int, int, int]
+
+
+def file_signature(stat: os.stat_result) -> Signature:
+    """
+    Build the cache signature of a file from its stat result.
+
+    Args:
+        stat: Result of os.stat()
+
+    Returns:
+        (device, inode, size, mtime_ns) tuple
+    """
+    return (stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+
+class HashCache:
+    """
+    Path -> hash cache, invalidated by the file's stat signature.
+
+    Attributes:
+        path: JSON file the cache is persisted to
+        hasher: FileHasher used on cache misses
+        hits: Lookups answered without reading the file
+        misses: Lookups that had to hash the file
+    """
+
+    def __init__(self, path: Path, hasher: FileHasher):
+        """
+        Load the cache (a missing or corrupt file starts empty).
+
+        Args:
+            path: JSON file to persist to
+            hasher: FileHasher used on cache misses
+        """
+        self.path = Path(path)
+        self.hasher = hasher
+        self.hits = 0
+        self.misses = 0
+
+        self._entries: Dict[str, Tuple[Signature, str]] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        """Read the persisted cache, ignoring malformed entries."""
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return
+
+        if not isinstance(data, dict):
+            return
+        if 'files' not in data:
+            # Flat layout from before the algorithm was configurable
+            data = {'algorithm': 'sha256', 'files': data}
+        if data.get('algorithm') != self.hasher.algorithm:
+            return
+
+        files = data.get('files')
+        for key, value in files.items() if isinstance(files, dict) else ():
+            try:
+                dev, ino, size, mtime_ns, digest = value
+                self._entries[key] = ((int(dev), int(ino), int(size), int(mtime_ns)), str(digest))
+            except (TypeError, ValueError):
+                continue
+
+    def get(self, filepath: Path, stat: Optional[os.stat_result] = None) -> str:
+        """
+        Get a file's hash, hashing it only if it changed since last seen.
+
+        Args:
+            filepath: Path to the file
+            stat: The file's stat result, if the caller already has it
+
+        Returns:
+            Hash hex string
+        """
+        stat = stat or os.stat(filepath)
+        cached = self._lookup(filepath, stat)
+        if cached:
+            return cached
+
+        self.misses += 1
+        digest = self.hasher.hash_file(filepath)
+        self._store(filepath, stat, digest)
+        return digest
+
+    def get_many(self, files: List[Tuple[Path, os.stat_result]]) -> Dict[Path, str]:
+        """
+        Get the hashes of several files, hashing the changed ones in parallel.
+
+        Files that disappear or cannot be read are left out of the result.
+
+        Args:
+            files: (path, stat result) pairs
+
+        Returns:
+            Mapping of path to hash
+        """
+        results: Dict[Path, str] = {}
+        to_hash: Dict[Path, os.stat_result] = {}
+
+        for filepath, stat in files:
+            digest = self._lookup(filepath, stat)
+            if digest is not None:
+                results[filepath] = digest
+                continue
+            self.misses += 1
+            to_hash[filepath] = stat
+
+        for filepath, digest in self.hasher.hash_many(to_hash).items():
+            self._store(filepath, to_hash[filepath], digest)
+            results[filepath] = digest
+
+        return results
+
+    def _lookup(self, filepath: Path, stat: os.stat_result) -> Optional[str]:
+        """Get the cached hash if the file's signature is unchanged."""
+        with self._lock:
+            cached = self._entries.get(str(filepath))
+        if cached and cached[0] == file_signature(stat):
+            self.hits += 1
+            return cached[1]
+        return None
+
+    def _store(self, filepath: Path, stat: os.stat_result, digest: str) -> None:
+        """Cache a file's hash under its current signature."""
+        with self._lock:
+            self._entries[str(filepath)] = (file_signature(stat), digest)
+            self._dirty = True
+
+    def prune(self, live_paths: Iterable[Path]) -> int:
+        """
+        Forget files that are no longer present.
+
+        Args:
+            live_paths: Paths currently in the watched folder
+
+        Returns:
+            Number of entries removed
+        """
+        live = {str(p) for p in live_paths}
+        with self._lock:
+            stale = [key for key in self._entries if key not in live]
+            for key in stale:
+                del self._entries[key]
+            if stale:
+                self._dirty = True
+        return len(stale)
+
+    def discard(self, paths: Iterable[Path]) -> None:
+        """
+        Forget specific files (e.g. reported removed by a snapshot).
+
+        Args:
+            paths: Paths to forget
+        """
+        with self._lock:
+            for path in paths:
+                if self._entries.pop(str(path), None) is not None:
+                    self._dirty = True
+
+    def save(self) -> None:
+        """Persist the cache if it changed (write to a temp file, then rename)."""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {
+                'algorithm': self.hasher.algorithm,
+                'files': {key: [*signature, digest] for key, (signature, digest) in self._entries.items()},
+            }
+            self._dirty = False
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+        tmp_path.write_text(json.dumps(data), encoding='utf-8')
+        os.replace(tmp_path, self.path)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,109 @@
+"""
+Ingestion strategies for moving dropped files into the vault.
+
+Copying every dropped file duplicates it on disk and, for large media,
+takes seconds. The strategies below avoid the data copy where the
+filesystem allows it and fall back automatically when it does not
+(e.g. the drop folder is on another device):
+
+    reflink:  Copy-on-write clone (FICLONE on Btrfs/XFS, otherwise an
+              in-kernel copy_file_range). Behaves exactly like a copy.
+    move:     Rename into the vault; the drop folder is emptied.
+    copy:     Plain shutil.copy2.
+
+There is no hardlink mode: a blob is named by its content hash, and a
+link would let later edits to the dropped file change the blob's bytes
+under that name.
+"""
+
+import errno
+import os
+import shutil
+import sys
+from pathlib import Path
+
+INGEST_MODES = ['reflink', 'move', 'copy']
+
+# Linux ioctl cloning a whole file: _IOW(0x94, 9, int)
+FICLONE = 0x40049409
+
+
+def _reflink(src: Path, dest: Path) -> None:
+    """Clone src to dest with FICLONE, or copy in-kernel with copy_file_range."""
+    if not sys.platform.startswith('linux'):
+        raise OSError(errno.EOPNOTSUPP, 'reflink is only supported on Linux')
+
+    import fcntl
+
+    with open(src, 'rb') as fsrc, open(dest, 'wb') as fdst:
+        try:
+            fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+        except OSError:
+            if not hasattr(os, 'copy_file_range'):
+                raise
+            remaining = os.fstat(fsrc.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+    shutil.copystat(src, dest)
+
+
+def _move(src: Path, dest: Path) -> None:
+    """Rename src to dest (same device only)."""
+    os.rename(src, dest)
+
+
+def _copy(src: Path, dest: Path) -> None:
+    """Copy data and metadata."""
+    shutil.copy2(src, dest)
+
+
+# Strategy -> attempts in order; the last one always works across devices
+_CHAINS = {
+    'reflink': [('reflink', _reflink), ('copy', _copy)],
+    'move': [('move', _move), ('move', shutil.move)],
+    'copy': [('copy', _copy)],
+}
+
+
+def ingest_file(src: Path, dest: Path, mode: str = 'copy') -> str:
+    """
+    Place a dropped file at dest using the cheapest working strategy.
+
+    An existing file at dest is replaced, as shutil.copy2 would.
+
+    Args:
+        src: Dropped file
+        dest: Destination path in the vault
+        mode: One of INGEST_MODES
+
+    Returns:
+        Name of the strategy that succeeded (e.g. 'copy' after a fallback)
+
+    Raises:
+        ValueError: If mode is unknown
+        OSError: If even the last fallback fails
+    """
+    if mode not in _CHAINS:
+        raise ValueError(f"Unknown ingest mode: {mode} (choose from {', '.join(INGEST_MODES)})")
+
+    *fast_paths, (fallback_name, fallback) = _CHAINS[mode]
+    for name, attempt in fast_paths:
+        _clear(dest)
+        try:
+            attempt(src, dest)
+            return name
+        except OSError:
+            continue
+
+    _clear(dest)
+    fallback(src, dest)
+    return fallback_name
+
+
+def _clear(dest: Path) -> None:
+    """Remove dest (or a partial result of a failed attempt) if present."""
+    if os.path.lexists(dest):
+        os.unlink(dest)
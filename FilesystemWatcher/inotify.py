@@ -0,0 +1,197 @@
+"""
+Native Linux inotify backend for the filesystem watcher.
+
+Used when the watchdog package is not installed, so real-time
+monitoring does not degrade to polling. Talks to inotify through ctypes
+and reports only IN_CLOSE_WRITE (a writer closed the file) and
+IN_MOVED_TO (a finished file was renamed or moved in): both mean the
+file is complete, so no settle window is needed. New subdirectories are
+watched as they appear; anything already inside them is reported too.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE_SELF | IN_ONLYDIR
+
+_EVENT = struct.Struct('iIII')
+
+
+def _load_libc() -> Optional[ctypes.CDLL]:
+    """Load libc if it provides inotify (Linux only)."""
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+_libc = _load_libc()
+INOTIFY_AVAILABLE = _libc is not None
+
+
+class InotifyObserver:
+    """
+    Recursive inotify watch on a directory tree.
+
+    Attributes:
+        root: Top of the watched tree
+        on_file: Called with each completed file (on the observer thread)
+        on_overflow: Called when the kernel queue overflowed and events were lost
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        on_file: Callable[[Path], None],
+        on_overflow: Optional[Callable[[], None]] = None
+    ):
+        """
+        Initialize the observer (call start() to begin watching).
+
+        Args:
+            root: Directory to watch recursively
+            on_file: Callback receiving completed files
+            on_overflow: Callback for lost events (e.g. trigger a rescan)
+
+        Raises:
+            OSError: If inotify is unavailable
+        """
+        if not INOTIFY_AVAILABLE:
+            raise OSError('inotify is not available on this platform')
+        self.root = Path(root)
+        self.on_file = on_file
+        self.on_overflow = on_overflow
+
+        self._fd = -1
+        self._watches: Dict[int, Path] = {}
+        self._wake_r, self._wake_w = -1, -1
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Create the inotify instance, watch the tree and start reading events."""
+        self._fd = _libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self._wake_r, self._wake_w = os.pipe()
+        self._watch_tree(self.root, report_files=False)
+
+        self._thread = threading.Thread(target=self._run, name='fte-inotify', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Ask the reader thread to exit."""
+        if self._wake_w >= 0:
+            os.write(self._wake_w, b'x')
+
+    def join(self) -> None:
+        """Wait for the reader thread and release the inotify descriptors."""
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        for fd in (self._fd, self._wake_r, self._wake_w):
+            if fd >= 0:
+                os.close(fd)
+        self._fd = self._wake_r = self._wake_w = -1
+        self._watches.clear()
+
+    def _add_watch(self, directory: Path) -> bool:
+        """Watch one directory; False if it vanished or cannot be watched."""
+        wd = _libc.inotify_add_watch(self._fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            return False
+        self._watches[wd] = directory
+        return True
+
+    def _watch_tree(self, directory: Path, report_files: bool) -> None:
+        """
+        Watch a directory and its visible subdirectories.
+
+        Args:
+            directory: Directory to add
+            report_files: Report files already present (for a directory
+                that appeared while watching; its files raced the watch)
+        """
+        if not self._add_watch(directory):
+            return
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.startswith('.'):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        self._watch_tree(Path(entry.path), report_files)
+                    elif report_files and entry.is_file() and not entry.name.endswith('.tmp'):
+                        self.on_file(Path(entry.path))
+        except OSError:
+            pass
+
+    def _run(self) -> None:
+        """Read and dispatch events until stop() is called."""
+        poller = select.poll()
+        poller.register(self._fd, select.POLLIN)
+        poller.register(self._wake_r, select.POLLIN)
+
+        while True:
+            ready = {fd for fd, _ in poller.poll()}
+            if self._wake_r in ready:
+                return
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                continue
+            self._dispatch(data)
+
+    def _dispatch(self, data: bytes) -> None:
+        """Parse a buffer of inotify_event records and act on each."""
+        offset = 0
+        while offset + _EVENT.size <= len(data):
+            wd, mask, _cookie, length = _EVENT.unpack_from(data, offset)
+            offset += _EVENT.size
+            name = os.fsdecode(data[offset:offset + length].rstrip(b'\0'))
+            offset += length
+
+            if mask & IN_Q_OVERFLOW:
+                if self.on_overflow:
+                    self.on_overflow()
+                continue
+            if mask & (IN_IGNORED | IN_DELETE_SELF):
+                self._watches.pop(wd, None)
+                continue
+
+            directory = self._watches.get(wd)
+            if directory is None or not name or name.startswith('.'):
+                continue
+            path = directory / name
+
+            if mask & IN_ISDIR:
+                # A renamed directory keeps its watch; re-adding updates its path
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    self._watch_tree(path, report_files=True)
+            elif mask & (IN_CLOSE_WRITE | IN_MOVED_TO) and not name.endswith('.tmp'):
+                self.on_file(path)
@@ -18,21 +18,49 @@ Environment Variables:
     VAULT_PATH: Path to Obsidian vault (default: ./vault)
     DRY_RUN: Set to 'false' to enable actual processing
     CHECK_INTERVAL: Seconds between checks (default: 30)
+    FILESYSTEM_HASH_ALGORITHM: hashlib algorithm for file hashes (default: sha256)
+    FILESYSTEM_HASH_WORKERS: Threads hashing files in parallel (default: 4)
+    FILESYSTEM_SETTLE_SECONDS: Quiet period before a watched file counts as written (default: 2)
+    FILESYSTEM_FULL_SCAN_INTERVAL: Seconds between full rescans of the drop tree when polling (default: 3600)
+    FILESYSTEM_WORKERS: Threads processing settled files in watchdog mode (default: 2)
+    FILESYSTEM_QUEUE_SIZE: Settled files waiting for a worker before the debouncer blocks (default: 1000)
+    FILESYSTEM_INGEST_MODE: reflink, move or copy into the blob store (default: reflink)
+    FILESYSTEM_EXTRACT_WORKERS: Processes running metadata extractors (default: 2, 0 disables)
+    FILESYSTEM_EXTRACT_TIMEOUT: Default seconds per extraction (default: 10)
+    FILESYSTEM_EXTRACT_MEMORY_MB: Default memory per extraction in MB (default: 512)
+    FILESYSTEM_EXTRACTOR_PLUGINS: Comma-separated modules registering extra extractors
+    FILESYSTEM_PROFILE_TIMEOUT: Seconds allowed to profile one CSV/text file (default: 5)
+    FILESYSTEM_PROFILE_PREVIEW_LINES: Lines of a dropped text file quoted (default: 10)
+    FILESYSTEM_ARCHIVE_EXTRACT: Comma-separated member extensions ingested from ZIP/tar drops (default: none)
+    FILESYSTEM_ARCHIVE_MAX_MEMBER_MB: Largest archive member ingested, in MB (default: 100)
 """
 
-import hashlib
 import os
-import shutil
 import sys
+import tempfile
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 dry_run = os.getenv('DRY_RUN', 'false').lower() == 'true'
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
 from BaseWatcher import BaseWatcher
+from BaseWatcher.blob_store import BlobStore
+
+from .debouncer import WriteDebouncer
+from .extractors import (
+    ARCHIVE_TYPES, ExtractorPool, describe, extract_members, format_facts, load_plugins, sniff_file
+)
+from .file_hasher import FileHasher
+from .hash_cache import HashCache
+from .inotify import INOTIFY_AVAILABLE, InotifyObserver
+from .ingest import INGEST_MODES, ingest_file
+from .snapshot import DirectorySnapshot
+from .work_queue import WorkQueue
 
 # Watchdog imports (optional, graceful fallback)
 try:
@@ -46,16 +74,35 @@ except ImportError:
         pass
     Observer = None
     print("Watchdog not installed. Install with: pip install watchdog")
-    print("Filesystem watcher will use polling mode instead.\n")
+    print("Filesystem watcher will use native inotify (Linux) or polling instead.\n")
+
+
+def select_backend(use_events: bool) -> str:
+    """
+    Choose how the drop folder is monitored.
+
+    Args:
+        use_events: Prefer real-time events over polling
+
+    Returns:
+        'watchdog', 'inotify' (Linux without watchdog) or 'polling'
+    """
+    if use_events and WATCHDOG_AVAILABLE:
+        return 'watchdog'
+    if use_events and INOTIFY_AVAILABLE:
+        return 'inotify'
+    return 'polling'
 
 
 class DropFolderHandler(FileSystemEventHandler):
     """
     Handles file system events in the drop folder.
+
+    Events only mark paths as active; the watcher's debouncer hands a
+    path to processing once its writes have settled.
     
     Attributes:
         watcher: Parent FilesystemWatcher instance
-        processed_files: Set of processed file hashes
     """
 
     def __init__(self, watcher: 'FilesystemWatcher'):
@@ -67,7 +114,15 @@ class DropFolderHandler(FileSystemEventHandler):
         """
         super().__init__()
         self.watcher = watcher
-        self.processed_files: set = set()
+
+    def _is_candidate(self, path: Path) -> bool:
+        """Check whether a path is a file the watcher should pick up."""
+        try:
+            parts = Path(os.path.abspath(path)).relative_to(self.watcher.drop_folder.absolute()).parts
+        except ValueError:
+            return False
+        # Skip temp files and anything in or under a hidden name, as polling does
+        return not any(part.startswith('.') for part in parts) and not path.suffix.endswith('.tmp')
 
     def on_created(self, event):
         """
@@ -80,30 +135,102 @@ class DropFolderHandler(FileSystemEventHandler):
             return
         
         source_path = Path(event.src_path)
-        
-        # Skip hidden files and temp files
-        if source_path.name.startswith('.') or source_path.suffix.endswith('.tmp'):
+        if self._is_candidate(source_path):
+            self.watcher.logger.debug(f"File created: {source_path}")
+            self.watcher.debouncer.touch(source_path)
+
+    def on_modified(self, event):
+        """
+        Handle file modification events (a copy still in progress).
+
+        Args:
+            event: File system event
+        """
+        if event.is_directory:
             return
-        
-        self.watcher.logger.info(f"File created: {source_path}")
-        self.watcher.process_file(source_path)
+
+        source_path = Path(event.src_path)
+        if self._is_candidate(source_path):
+            self.watcher.debouncer.touch(source_path)
+
+    def on_moved(self, event):
+        """
+        Handle renames, e.g. a download finishing as 'file.pdf.tmp' -> 'file.pdf'.
+
+        Args:
+            event: File system event
+        """
+        if event.is_directory:
+            return
+
+        self.watcher.debouncer.forget(Path(event.src_path))
+        dest_path = Path(event.dest_path)
+        if self._is_candidate(dest_path):
+            self.watcher.logger.debug(f"File moved in: {dest_path}")
+            self.watcher.debouncer.touch(dest_path)
+
+    def on_deleted(self, event):
+        """
+        Handle deletions of files that had not settled yet.
+
+        Args:
+            event: File system event
+        """
+        if not event.is_directory:
+            self.watcher.debouncer.forget(Path(event.src_path))
 
 
 class FilesystemWatcher(BaseWatcher):
     """
-    Watches a drop folder for new files and creates action files.
+    Watches a drop folder (including subfolders) for new files and creates action files.
     
     Attributes:
         drop_folder: Path to the monitored drop folder
-        observer: Watchdog Observer instance (if available)
+        backend: 'watchdog', 'inotify' or 'polling'
+        observer: Running watchdog Observer or InotifyObserver (None when polling)
+        hasher: Parallel file hasher (algorithm from FILESYSTEM_HASH_ALGORITHM)
+        hash_cache: Persistent file hash cache keyed by stat signature
+        snapshot: Incremental stat index of the drop tree (polling mode)
+        debouncer: Releases watchdog paths once their writes have settled
+        work_queue: Priority queue of settled paths served by worker threads
+        blob_store: Content-addressed store for ingested files (<vault>/.blobs)
+        ingest_mode: How dropped files are placed in the blob store (see ingest.py)
     """
 
+    WATCHER_NAME = 'filesystem'
+    LEGACY_PROCESSED_FILES = ['filesystem_processed_hashes.txt']
+
+    # Extension -> (file type, file category)
+    EXTENSION_MAP = {
+        '.pdf': ('PDF Document', 'document'),
+        '.doc': ('Word Document', 'document'),
+        '.docx': ('Word Document', 'document'),
+        '.txt': ('Text File', 'document'),
+        '.md': ('Markdown File', 'document'),
+        '.xls': ('Excel Spreadsheet', 'spreadsheet'),
+        '.xlsx': ('Excel Spreadsheet', 'spreadsheet'),
+        '.csv': ('CSV File', 'spreadsheet'),
+        '.jpg': ('JPEG Image', 'image'),
+        '.jpeg': ('JPEG Image', 'image'),
+        '.png': ('PNG Image', 'image'),
+        '.gif': ('GIF Image', 'image'),
+        '.zip': ('ZIP Archive', 'archive'),
+        '.rar': ('RAR Archive', 'archive'),
+        '.7z': ('7-Zip Archive', 'archive'),
+        '.mp3': ('MP3 Audio', 'media'),
+        '.mp4': ('MP4 Video', 'media'),
+        '.wav': ('WAV Audio', 'media'),
+    }
+
     def __init__(
         self,
         vault_path: str,
         drop_folder: Optional[str] = None,
         check_interval: int = 30,
-        use_watchdog: bool = True
+        use_watchdog: bool = True,
+        min_interval: Optional[float] = None,
+        max_interval: Optional[float] = None,
+        adaptive: Optional[bool] = None
     ):
         """
         Initialize the filesystem watcher.
@@ -112,9 +239,12 @@ class FilesystemWatcher(BaseWatcher):
             vault_path: Path to the Obsidian vault
             drop_folder: Path to the drop folder (default: vault/Inbox/Drop)
             check_interval: Seconds between checks (default: 30)
-            use_watchdog: Use watchdog for real-time monitoring (default: True)
+            use_watchdog: Use real-time events (watchdog, else inotify) (default: True)
+            min_interval: Fastest adaptive polling interval
+            max_interval: Slowest adaptive polling interval
+            adaptive: Enable adaptive polling
         """
-        super().__init__(vault_path, check_interval)
+        super().__init__(vault_path, check_interval, min_interval, max_interval, adaptive)
 
         # Set up drop folder
         if drop_folder:
@@ -125,97 +255,145 @@ class FilesystemWatcher(BaseWatcher):
         # Ensure drop folder exists
         self.drop_folder.mkdir(parents=True, exist_ok=True)
         
-        # Use watchdog if available and requested
-        self.use_watchdog = use_watchdog and WATCHDOG_AVAILABLE
+        # Real-time events if requested: watchdog, else native inotify, else polling
+        self.backend = select_backend(use_watchdog)
+        self.use_watchdog = self.backend == 'watchdog'
         self.observer = None
-        
-        # Track processed files by hash
-        self.processed_files: set = set()
-        self._load_processed_files()
-
-    def _load_processed_files(self) -> None:
-        """Load previously processed file hashes from disk."""
-        cache_file = self.logs / 'filesystem_processed_hashes.txt'
-        if cache_file.exists():
-            try:
-                with open(cache_file, 'r') as f:
-                    self.processed_files = set(line.strip() for line in f if line.strip())
-                self.logger.info(f"Loaded {len(self.processed_files)} previously processed file hashes")
-            except Exception as e:
-                self.logger.warning(f"Could not load processed hashes: {e}")
-                self.processed_files = set()
-        else:
-            self.processed_files = set()
 
-    def _save_processed_files(self) -> None:
-        """Save processed file hashes to disk."""
-        cache_file = self.logs / 'filesystem_processed_hashes.txt'
-        try:
-            with open(cache_file, 'w') as f:
-                for file_hash in self.processed_files:
-                    f.write(f"{file_hash}\n")
-            self.logger.debug(f"Saved {len(self.processed_files)} processed file hashes")
-        except Exception as e:
-            self.logger.error(f"Could not save processed hashes: {e}")
+        # Files are only re-hashed when their stat signature changes
+        self.hasher = FileHasher.from_env()
+        self.hash_cache = HashCache(self.logs / 'filesystem_hash_cache.json', self.hasher)
+
+        # Polling lists only directories whose mtime changed
+        settle_seconds = float(os.getenv('FILESYSTEM_SETTLE_SECONDS', '2'))
+        self.snapshot = DirectorySnapshot(
+            self.drop_folder,
+            settle_seconds=settle_seconds,
+            full_scan_interval=float(os.getenv('FILESYSTEM_FULL_SCAN_INTERVAL', '3600'))
+        )
+        # Files found by polling that are not processed yet, with their hashes
+        self._unprocessed: Dict[Path, str] = {}
+        self._cache_pruned = False
+        # Scans may overlap in event mode (startup catch-up, inotify overflow)
+        self._scan_lock = threading.Lock()
+        self._catch_up_thread: Optional[threading.Thread] = None
+        self._catch_up_stop = threading.Event()
+
+        # Watchdog events are coalesced until the file stops changing,
+        # then processed off the observer thread by a pool of workers
+        self.debouncer = WriteDebouncer(self.enqueue_path, settle_seconds=settle_seconds)
+        self.work_queue = WorkQueue(
+            self.ingest_path,
+            workers=int(os.getenv('FILESYSTEM_WORKERS', '2')),
+            max_size=int(os.getenv('FILESYSTEM_QUEUE_SIZE', '1000'))
+        )
+
+        # Dropped files are stored once per content hash
+        self.blob_store = BlobStore(self.vault_path)
+
+        # Zero-copy placement into the blob store where the filesystem allows it
+        self.ingest_mode = os.getenv('FILESYSTEM_INGEST_MODE', 'reflink').lower()
+        if self.ingest_mode not in INGEST_MODES:
+            self.logger.warning(f"Unknown FILESYSTEM_INGEST_MODE '{self.ingest_mode}', using copy")
+            self.ingest_mode = 'copy'
+
+        # Facts about each file (by sniffed content type) for the action file front matter
+        self.extractors = ExtractorPool.from_env()
+        for error in load_plugins(os.getenv('FILESYSTEM_EXTRACTOR_PLUGINS', '').split(',')):
+            self.logger.warning(f"Could not load extractor plugin {error}")
+
+        # Archive members of these types are ingested as child items of the archive
+        self.archive_extract = {
+            ext if ext.startswith('.') else f'.{ext}'
+            for ext in (part.strip().lower() for part in os.getenv('FILESYSTEM_ARCHIVE_EXTRACT', '').split(','))
+            if ext
+        }
+        self.archive_max_member_bytes = int(os.getenv('FILESYSTEM_ARCHIVE_MAX_MEMBER_MB', '100')) * 1024 * 1024
+
+        # Hashes being processed right now, so two copies of a file are not both ingested
+        self._in_flight: Set[str] = set()
+        self._in_flight_lock = threading.Lock()
 
     def _calculate_file_hash(self, filepath: Path) -> str:
         """
-        Calculate SHA256 hash of a file.
+        Calculate the hash of a file, bypassing the cache.
         
         Args:
             filepath: Path to the file
             
         Returns:
-            SHA256 hash hex string
+            Hash key (bare hex for SHA256, 'algorithm:hex' otherwise)
+        """
+        return self.hasher.hash_file(filepath)
+
+    def _file_hash(self, filepath: Path, stat: Optional[os.stat_result] = None) -> str:
+        """
+        Get a file's hash from the cache, hashing it only if it changed.
+
+        Args:
+            filepath: Path to the file
+            stat: The file's stat result, if already known
+
+        Returns:
+            Hash key (see _calculate_file_hash)
         """
-        sha256_hash = hashlib.sha256()
-        with open(filepath, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
-        return sha256_hash.hexdigest()
+        return self.hash_cache.get(filepath, stat)
 
-    def _get_file_metadata(self, filepath: Path) -> Dict[str, Any]:
+    def _save_hash_cache(self) -> None:
+        """Persist the hash cache, logging (not raising) on failure."""
+        try:
+            self.hash_cache.save()
+        except OSError as e:
+            self.logger.warning(f"Could not save hash cache: {e}")
+
+    def _claim(self, file_hash: str) -> bool:
+        """
+        Reserve a hash for processing (thread-safe dedup).
+
+        Args:
+            file_hash: Hash of the file about to be processed
+
+        Returns:
+            False if the hash was already processed or is being processed
+        """
+        with self._in_flight_lock:
+            if file_hash in self._in_flight or self.is_processed(file_hash):
+                return False
+            self._in_flight.add(file_hash)
+            return True
+
+    def _release(self, file_hash: str) -> None:
+        """
+        Release a hash reserved with _claim().
+
+        Args:
+            file_hash: Hash of the processed file
+        """
+        with self._in_flight_lock:
+            self._in_flight.discard(file_hash)
+
+    def _get_file_metadata(self, filepath: Path, file_hash: Optional[str] = None) -> Dict[str, Any]:
         """
         Get metadata about a file.
         
         Args:
             filepath: Path to the file
+            file_hash: The file's hash, if already computed
             
         Returns:
             Dictionary of file metadata
         """
         stat = filepath.stat()
+        content_type = sniff_file(filepath)
         
-        # File type categories
-        file_type = "unknown"
-        file_category = "other"
-        
-        extension_map = {
-            '.pdf': ('PDF Document', 'document'),
-            '.doc': ('Word Document', 'document'),
-            '.docx': ('Word Document', 'document'),
-            '.txt': ('Text File', 'document'),
-            '.md': ('Markdown File', 'document'),
-            '.xls': ('Excel Spreadsheet', 'spreadsheet'),
-            '.xlsx': ('Excel Spreadsheet', 'spreadsheet'),
-            '.csv': ('CSV File', 'spreadsheet'),
-            '.jpg': ('JPEG Image', 'image'),
-            '.jpeg': ('JPEG Image', 'image'),
-            '.png': ('PNG Image', 'image'),
-            '.gif': ('GIF Image', 'image'),
-            '.zip': ('ZIP Archive', 'archive'),
-            '.rar': ('RAR Archive', 'archive'),
-            '.7z': ('7-Zip Archive', 'archive'),
-            '.mp3': ('MP3 Audio', 'media'),
-            '.mp4': ('MP4 Video', 'media'),
-            '.wav': ('WAV Audio', 'media'),
-        }
-        
-        if filepath.suffix.lower() in extension_map:
-            file_type, file_category = extension_map[filepath.suffix.lower()]
+        # File type categories (from the content when the extension is unknown)
+        file_type, file_category = self.EXTENSION_MAP.get(
+            filepath.suffix.lower(), describe(content_type)
+        )
         
         return {
             'name': filepath.name,
+            'drop_path': self._drop_path(filepath),
             'size': stat.st_size,
             'size_human': self._format_size(stat.st_size),
             'created': datetime.fromtimestamp(stat.st_ctime).isoformat(),
@@ -223,9 +401,38 @@ class FilesystemWatcher(BaseWatcher):
             'extension': filepath.suffix.lower(),
             'file_type': file_type,
             'file_category': file_category,
-            'hash': self._calculate_file_hash(filepath)
+            'content_type': content_type,
+            'hash': file_hash or self._file_hash(filepath, stat)
         }
 
+    def _drop_path(self, filepath: Path) -> str:
+        """
+        Get a file's path relative to the drop folder (e.g. 'project/a.pdf').
+
+        Args:
+            filepath: Path to the file
+
+        Returns:
+            Relative POSIX path, or the file name if outside the drop folder
+        """
+        try:
+            return filepath.relative_to(self.drop_folder).as_posix()
+        except ValueError:
+            return filepath.name
+
+    def item_priority(self, filepath: Path) -> str:
+        """
+        Determine a dropped file's priority from its name and file type.
+
+        Args:
+            filepath: Path to the file
+
+        Returns:
+            Priority level: 'critical', 'high', 'normal', or 'low'
+        """
+        file_type = self.EXTENSION_MAP.get(filepath.suffix.lower(), ("unknown", "other"))[0]
+        return self.get_priority(f"{filepath.name} {file_type}")
+
     def _format_size(self, size_bytes: int) -> str:
         """
         Format file size in human-readable format.
@@ -244,26 +451,47 @@ class FilesystemWatcher(BaseWatcher):
 
     def check_for_updates(self) -> List[Path]:
         """
-        Check drop folder for new files (polling method).
+        Check the drop tree for new files (polling method, and the
+        startup catch-up scan in event mode).
+
+        Only new or changed files from the snapshot are hashed; files
+        found earlier but not processed yet are offered again.
 
         Returns:
             List of new file paths
         """
-        new_files = []
-
         try:
-            for filepath in self.drop_folder.iterdir():
-                if filepath.is_file() and not filepath.name.startswith('.'):
-                    file_hash = self._calculate_file_hash(filepath)
-                    if file_hash not in self.processed_files:
-                        new_files.append(filepath)
-
-            return new_files
-
+            with self._scan_lock:
+                return self._scan_drop_folder()
         except Exception as e:
             self.logger.error(f"Error checking drop folder: {e}")
             return []
 
+    def _scan_drop_folder(self) -> List[Path]:
+        """Refresh the snapshot and hash new files (see check_for_updates)."""
+        changed, removed = self.snapshot.scan()
+
+        if not self._cache_pruned:
+            # Forget files that disappeared while the watcher was down
+            self.hash_cache.prune(self.snapshot.paths())
+            self._cache_pruned = True
+        self.hash_cache.discard(removed)
+        for filepath in removed:
+            self._unprocessed.pop(filepath, None)
+
+        # Drop files processed since the last cycle
+        for filepath, file_hash in list(self._unprocessed.items()):
+            if self.processed_store.seen(file_hash):
+                del self._unprocessed[filepath]
+
+        # Changed files are hashed in parallel; unchanged ones come from the cache
+        for filepath, file_hash in self.hash_cache.get_many(changed).items():
+            if self.is_processed(file_hash):
+                self._unprocessed.pop(filepath, None)
+            else:
+                self._unprocessed[filepath] = file_hash
+        return list(self._unprocessed)
+
     def create_action_file(self, filepath: Path) -> Optional[Path]:
         """
         Create a markdown action file for a dropped file.
@@ -279,48 +507,77 @@ class FilesystemWatcher(BaseWatcher):
         """
         return self.process_file(filepath)
 
-    def process_file(self, filepath: Path) -> Optional[Path]:
+    def process_file(self, filepath: Path, parent: Optional[Dict[str, Any]] = None) -> Optional[Path]:
         """
         Process a single file and create an action file.
         
         Args:
             filepath: Path to the file
+            parent: For a member extracted from an archive: {'archive': drop
+                path of the archive, 'member': name inside it, 'action':
+                the archive's action filename, 'children': list to which
+                (member, action filename) is appended}
             
         Returns:
-            Path to created action file, or None if failed
+            Path to created action file, or None if already processed,
+            failed or in dry run
         """
+        file_hash = None
         try:
-            # Calculate hash and check if already processed
-            file_hash = self._calculate_file_hash(filepath)
-            if file_hash in self.processed_files:
+            # Hash once (cached) and check if already processed or in progress
+            file_hash = self._file_hash(filepath)
+            if not self._claim(file_hash):
                 self.logger.debug(f"File already processed: {filepath}")
+                file_hash = None
                 return None
             
             # Get metadata
-            metadata = self._get_file_metadata(filepath)
+            metadata = self._get_file_metadata(filepath, file_hash)
+            source = f"`{filepath}`"
+            lineage = ''
+            if parent:
+                metadata['drop_path'] = f"{parent['archive']}/{parent['member']}"
+                source = f"`{parent['member']}` in [[{Path(parent['action']).stem}]]"
+                lineage = '\n'.join(format_facts(
+                    {'parent_action': parent['action'], 'archive_member': parent['member']}, indent=0
+                )) + '\n'
             
             # Determine priority based on file type and name
-            priority = self.get_priority(f"{filepath.name} {metadata['file_type']}")
+            priority = self.item_priority(filepath)
+
+            # Structured facts, so the file need not be opened to understand it
+            facts = self.extractors.extract(filepath, metadata['content_type'])
+            if facts and 'error' in facts:
+                self.logger.warning(f"Metadata extraction failed for {filepath}: {facts['error']}")
+            extracted = '\n'.join(['extracted:', *format_facts(facts)]) + '\n' if facts else ''
+
+            # Content-addressed location of the file inside the vault
+            dest_path = self.blob_store.path_for(file_hash)
+            blob_ref = self.blob_store.relative(dest_path)
             
             # Sanitize filename
             safe_name = self.sanitize_filename(filepath.stem)
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            action_filename = f"FILE_{safe_name}_{timestamp}.md"
+            # Hash fragment keeps same-named drops in the same second apart
+            action_filename = f"FILE_{safe_name}_{timestamp}_{file_hash.rpartition(':')[2][:8]}.md"
             
             # Create content
             content = f"""---
 type: file_drop
 original_name: {metadata['name']}
+drop_path: {metadata['drop_path']}
 file_type: {metadata['file_type']}
 file_category: {metadata['file_category']}
 size: {metadata['size_human']} ({metadata['size']} bytes)
 extension: {metadata['extension']}
+content_type: {metadata['content_type']}
 created: {metadata['created']}
 modified: {metadata['modified']}
 priority: {priority}
 status: pending
 file_hash: {file_hash}
----
+blob: {blob_ref}
+{lineage}{extracted}---
 
 # File Drop: {metadata['name']}
 
@@ -341,9 +598,9 @@ file_hash: {file_hash}
 
 ## Location
 
-**Source:** `{filepath}`
+**Source:** {source}
 
-**Copied to:** `{self.needs_action / filepath.name}`
+**Stored at:** [{blob_ref}](../{blob_ref})
 
 ---
 
@@ -391,11 +648,8 @@ _Add your notes here_
 
 """
             
-            # Copy file to needs_action folder
-            dest_path = self.needs_action / filepath.name
-            
             if self.dry_run:
-                self.logger.info(f"[DRY RUN] Would copy: {filepath} -> {dest_path}")
+                self.logger.info(f"[DRY RUN] Would {self.ingest_mode}: {filepath} -> {dest_path}")
                 self.logger.info(f"[DRY RUN] Would create: {self.needs_action / action_filename}")
                 self.log_action('file_detected', {
                     'name': metadata['name'],
@@ -404,57 +658,214 @@ _Add your notes here_
                     'priority': priority
                 })
             else:
-                # Copy file
-                shutil.copy2(filepath, dest_path)
-                self.logger.info(f"Copied file: {filepath} -> {dest_path}")
+                # Store content by hash (falls back to a copy across filesystems)
+                dest_path, method = self.blob_store.put_file(
+                    filepath, file_hash, lambda src, dst: ingest_file(src, dst, self.ingest_mode)
+                )
+                if method:
+                    self.logger.info(f"Stored blob ({method}): {filepath} -> {dest_path}")
+                else:
+                    self.logger.info(f"Content already stored, reusing blob: {dest_path}")
                 
                 # Write action file
                 action_path = self.needs_action / action_filename
                 action_path.write_text(content, encoding='utf-8')
-                self.logger.info(f"Created action file: {action_path}")
                 
                 # Mark as processed
-                self.processed_files.add(file_hash)
-                self._save_processed_files()
+                self.mark_processed(file_hash)
+
+                if parent is not None:
+                    parent['children'].append((parent['member'], action_filename))
+                elif self.archive_extract and metadata['content_type'] in ARCHIVE_TYPES:
+                    # The drop is gone in move mode; the stored blob holds the same bytes
+                    self._ingest_archive_members(filepath, dest_path, action_path, metadata['content_type'], facts)
                 
                 self.log_action('file_action_created', {
                     'name': metadata['name'],
                     'type': metadata['file_type'],
                     'size': metadata['size_human'],
                     'priority': priority,
+                    'ingest': method or 'existing_blob',
+                    'blob': blob_ref,
                     'filepath': str(action_path)
                 })
                 
                 # Optionally remove original from drop folder
                 # filepath.unlink()  # Uncomment to auto-clean drop folder
-            
-            return dest_path
+                return action_path
+
+            return None
             
         except Exception as e:
+            self.metrics.inc('errors')
             self.logger.error(f"Error processing file: {e}")
             return None
+        finally:
+            if file_hash:
+                self._release(file_hash)
 
-    def start_observer(self) -> None:
+    def _ingest_archive_members(
+        self,
+        filepath: Path,
+        blob_path: Path,
+        action_path: Path,
+        content_type: str,
+        facts: Optional[Dict[str, Any]]
+    ) -> None:
         """
-        Start the watchdog observer for real-time monitoring.
+        Ingest selected archive members as child items of the archive.
+
+        Members are streamed one at a time into a staging folder in the
+        blob store (outside the drop folder, so no watcher sees them, and
+        on the blob store's filesystem for reflink/move),
+        processed like dropped files, and listed in the archive's action
+        file.
+
+        Args:
+            filepath: Archive file as dropped (for lineage and logs)
+            blob_path: Stored copy of the archive, which members are read from
+            action_path: The archive's action file
+            content_type: Sniffed content type of the archive
+            facts: The archive listing (members are not extracted if it
+                failed or flagged the archive as suspicious)
         """
-        if not self.use_watchdog:
-            self.logger.warning("Watchdog not available, using polling mode")
+        if not facts or 'error' in facts or facts.get('tar') is False:
             return
-        
-        if not WATCHDOG_AVAILABLE:
-            self.logger.warning("Watchdog library not installed, using polling mode")
-            self.use_watchdog = False
+        if facts.get('suspicious'):
+            self.logger.warning(
+                f"Not extracting members of suspicious archive {filepath}: {'; '.join(facts['suspicious'])}"
+            )
             return
 
+        parent = {'archive': self._drop_path(filepath), 'action': action_path.name, 'children': []}
+        try:
+            self.blob_store.root.mkdir(parents=True, exist_ok=True)
+            with tempfile.TemporaryDirectory(prefix='.extract-', dir=self.blob_store.root) as staging:
+                for member, staged in extract_members(
+                    blob_path, content_type, self.archive_extract, self.archive_max_member_bytes, Path(staging)
+                ):
+                    self.process_file(staged, parent=dict(parent, member=member))
+        except Exception as e:
+            self.logger.warning(f"Could not extract members of {filepath}: {e}")
+
+        if parent['children']:
+            links = '\n'.join(f"- `{member}` → [[{Path(name).stem}]]" for member, name in parent['children'])
+            content = action_path.read_text(encoding='utf-8')
+            content = content.replace('\n## Notes\n', f"\n## Ingested Members\n\n{links}\n\n---\n\n## Notes\n", 1)
+            action_path.write_text(content, encoding='utf-8')
+            self.logger.info(f"Ingested {len(parent['children'])} member(s) of {filepath}")
+
+    def enqueue_path(self, filepath: Path, timeout: Optional[float] = None) -> bool:
+        """
+        Queue a settled file for the workers, urgent and small files first.
+
+        Args:
+            filepath: Path to the settled file
+            timeout: Seconds to wait for room in the queue (None waits indefinitely)
+
+        Returns:
+            True if queued, False if it vanished, was already queued or the queue stayed full
+        """
         try:
-            event_handler = DropFolderHandler(self)
-            self.observer = Observer()
-            self.observer.schedule(event_handler, str(self.drop_folder), recursive=False)
+            size = filepath.stat().st_size
+        except OSError:
+            return False
+        return self.work_queue.put(filepath, self.item_priority(filepath), size, timeout)
+
+    def _catch_up(self) -> None:
+        """
+        Queue files that arrived while the watcher was down.
+
+        Runs on its own thread after the observer has started, so
+        nothing dropped in between is missed. The scan reuses the
+        persisted hash cache (only new or changed files are hashed, in
+        parallel). Files still inside the settle window are not reported
+        by a scan, and their last write may predate the observer, so the
+        scan is repeated until none are left. A file also reported by
+        the observer is processed once: the work queue skips paths
+        already waiting or in progress, and process_file() claims each
+        hash before ingesting it.
+        """
+        started = time.monotonic()
+        tick = max(0.05, min(self.snapshot.settle_seconds / 2, 0.5))
+        offered: Set[Path] = set()
+        queued = 0
+        while True:
+            for filepath in self.check_for_updates():
+                if filepath in offered:
+                    continue
+                offered.add(filepath)
+                # Wait for room without blocking stop_observer()
+                while not self._catch_up_stop.is_set():
+                    if self.enqueue_path(filepath, timeout=WorkQueue.POLL_SECONDS):
+                        queued += 1
+                        break
+                    if filepath in self.work_queue or not filepath.exists():
+                        break
+                if self._catch_up_stop.is_set():
+                    return
+
+            if not self.snapshot.unsettled():
+                break
+            if self._catch_up_stop.wait(tick):
+                return
+        self.logger.info(
+            f"Catch-up scan queued {queued} file(s) missed while stopped ({time.monotonic() - started:.2f}s)"
+        )
+
+    def ingest_path(self, filepath: Path) -> None:
+        """
+        Process a settled file on a worker thread.
+
+        Args:
+            filepath: Path to the settled file
+        """
+        self.logger.info(f"File ready: {filepath}")
+        self.metrics.inc('items_found')
+        try:
+            for item in self._apply_backpressure([filepath]):
+                action_path = self._write_action_file(item)
+                if action_path:
+                    self.logger.info(f"Created action file: {action_path}")
+        except Exception as e:
+            self.metrics.inc('errors')
+            self.logger.error(f"Error ingesting {filepath}: {e}", exc_info=True)
+
+    def _rescan_into_queue(self) -> None:
+        """Queue unprocessed files found by a scan (after inotify lost events)."""
+        self.logger.warning("inotify event queue overflowed, rescanning drop folder")
+        for filepath in self.check_for_updates():
+            self.enqueue_path(filepath)
+
+    def start_observer(self) -> None:
+        """
+        Start real-time monitoring (watchdog, or native inotify without it).
+        """
+        if self.backend == 'polling':
+            self.logger.warning("No event backend available, using polling mode")
+            return
+
+        try:
+            self.work_queue.start()
+            if self.backend == 'watchdog':
+                self.debouncer.start()
+                self.observer = Observer()
+                self.observer.schedule(DropFolderHandler(self), str(self.drop_folder), recursive=True)
+            else:
+                # IN_CLOSE_WRITE / IN_MOVED_TO mean the file is complete: no debouncing
+                self.observer = InotifyObserver(self.drop_folder, self.enqueue_path, self._rescan_into_queue)
             self.observer.start()
-            self.logger.info(f"Watchdog observer started for: {self.drop_folder}")
+            self.logger.info(f"{self.backend} observer started for: {self.drop_folder}")
+
+            # Reconcile with files dropped while stopped, alongside live events
+            self._catch_up_stop.clear()
+            self._catch_up_thread = threading.Thread(target=self._catch_up, name='fte-fs-catch-up', daemon=True)
+            self._catch_up_thread.start()
         except Exception as e:
-            self.logger.error(f"Could not start watchdog observer: {e}")
+            self.logger.error(f"Could not start {self.backend} observer, using polling mode: {e}")
+            self.observer = None
+            self.work_queue.stop()
+            self.backend = 'polling'
             self.use_watchdog = False
 
     def stop_observer(self) -> None:
@@ -464,32 +875,82 @@ _Add your notes here_
         if self.observer:
             self.observer.stop()
             self.observer.join()
-            self.logger.info("Watchdog observer stopped")
+            self.logger.info(f"{self.backend} observer stopped")
+            self.observer = None
+
+        if self._catch_up_thread is not None:
+            self._catch_up_stop.set()
+            self._catch_up_thread.join()
+            self._catch_up_thread = None
+
+        unsettled = self.debouncer.stop()
+        if unsettled:
+            self.logger.warning(f"{unsettled} file(s) were still being written and were not processed")
+        waiting = self.work_queue.stop()
+        if waiting:
+            self.logger.warning(f"{waiting} queued file(s) were not processed")
+
+    def setup(self) -> None:
+        """Start the event observer when hosted by a scheduler."""
+        if self.backend != 'polling':
+            self.start_observer()
+
+    def teardown(self) -> None:
+        """Stop the event observer when hosted by a scheduler."""
+        self.stop_observer()
+        self._save_hash_cache()
+        self.hasher.close()
+        self.extractors.close()
+
+    def run_once(self) -> int:
+        """
+        Run a single polling cycle.
+
+        With an event backend files are delivered through the worker
+        queue, so there is nothing to poll; files deferred by backpressure are
+        released once the backlog recovers and the metrics snapshot is
+        refreshed.
+
+        Returns:
+            Number of files processed in this cycle
+        """
+        try:
+            if self.observer:
+                released = list(self._apply_backpressure([]))
+                for filepath in released:
+                    action_path = self._write_action_file(filepath)
+                    if action_path:
+                        self.logger.info(f"Created action file: {action_path}")
+                self._maybe_write_snapshot()
+                return len(released)
+            return super().run_once()
+        finally:
+            self._save_hash_cache()
 
     def run(self) -> None:
         """
         Main run loop for the filesystem watcher.
         
-        Uses watchdog for real-time monitoring if available,
-        otherwise falls back to polling.
+        Uses watchdog (or native inotify) for real-time monitoring if
+        available, otherwise falls back to polling.
         """
         self.logger.info(f"Starting {self.__class__.__name__}")
         self.logger.info(f"Vault path: {self.vault_path}")
         self.logger.info(f"Drop folder: {self.drop_folder}")
-        self.logger.info(f"Check interval: {self.check_interval}s")
+        self.logger.info(f"Check interval: {self.poll_schedule.describe()}")
         self.logger.info(f"Dry run mode: {self.dry_run}")
-        self.logger.info(f"Use watchdog: {self.use_watchdog}")
+        self.logger.info(f"Monitoring: {self.backend}")
         
-        # Start watchdog observer if available
-        if self.use_watchdog:
+        # Start event observer if available
+        if self.backend != 'polling':
             self.start_observer()
         
         try:
-            if self.use_watchdog:
-                # Watchdog mode - just keep running
+            if self.observer:
+                # Event mode - just keep running
                 while True:
-                    import time
                     time.sleep(self.check_interval)
+                    self.run_once()
             else:
                 # Polling mode - use parent implementation
                 super().run()
@@ -498,6 +959,9 @@ _Add your notes here_
             self.logger.info(f"{self.__class__.__name__} stopped by user")
         finally:
             self.stop_observer()
+            self._save_hash_cache()
+            self.hasher.close()
+            self.extractors.close()
 
 
 def main():
@@ -523,10 +987,28 @@ def main():
         default=int(os.getenv('CHECK_INTERVAL', '30')),
         help='Check interval in seconds'
     )
+    parser.add_argument(
+        '--min-interval',
+        type=float,
+        default=None,
+        help='Fastest adaptive check interval in seconds (env: FILESYSTEM_MIN_INTERVAL)'
+    )
+    parser.add_argument(
+        '--max-interval',
+        type=float,
+        default=None,
+        help='Slowest adaptive check interval in seconds (env: FILESYSTEM_MAX_INTERVAL)'
+    )
+    parser.add_argument(
+        '--adaptive',
+        action='store_true',
+        default=None,
+        help='Poll faster while items arrive and back off when idle'
+    )
     parser.add_argument(
         '--no-watchdog',
         action='store_true',
-        help='Disable watchdog even if available'
+        help='Disable real-time events (watchdog/inotify) and poll instead'
     )
     
     args = parser.parse_args()
@@ -537,7 +1019,7 @@ def main():
     print(f"Drop folder: {args.drop_folder or './vault/Inbox/Drop'}")
     print(f"Check interval: {args.interval}s")
     print(f"Dry run: {dry_run}")
-    print(f"Watchdog: {not args.no_watchdog and WATCHDOG_AVAILABLE}")
+    print(f"Monitoring: {select_backend(not args.no_watchdog)}")
     print("\nStarting watcher... (Press Ctrl+C to stop)\n")
     print(f"Drop files into: {Path(args.vault) / 'Inbox' / 'Drop'}\n")
     
@@ -546,7 +1028,10 @@ def main():
             vault_path=args.vault,
             drop_folder=args.drop_folder,
             check_interval=args.interval,
-            use_watchdog=not args.no_watchdog
+            use_watchdog=not args.no_watchdog,
+            min_interval=args.min_interval,
+            max_interval=args.max_interval,
+            adaptive=args.adaptive
         )
         watcher.run()
     except KeyboardInterrupt:
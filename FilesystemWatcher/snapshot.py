@@ -0,0 +1,184 @@
+"""
+Incremental snapshot of a drop tree for polling mode.
+
+A directory's mtime changes whenever an entry is added, removed or
+renamed in it, so a poll only needs one stat() per directory: unchanged
+directories reuse the stat info gathered by the last os.scandir(), and
+only changed directories are listed again. Files whose mtime is still
+within the settle window are re-stat'ed on every poll (an append does
+not touch the directory) and reported once they stop changing. A full
+rescan every full_scan_interval seconds catches in-place edits that no
+directory mtime reveals.
+"""
+
+import os
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .hash_cache import file_signature
+
+FileStat = Tuple[Path, os.stat_result]
+
+
+class _DirState:
+    """What the last listing of one directory found."""
+
+    __slots__ = ('mtime_ns', 'files', 'subdirs')
+
+    def __init__(self, mtime_ns: int):
+        self.mtime_ns = mtime_ns
+        self.files: Dict[str, os.stat_result] = {}
+        self.subdirs: List[str] = []
+
+
+class DirectorySnapshot:
+    """
+    Stat index of every file below a root, refreshed incrementally.
+
+    Hidden files and directories (leading '.') are ignored.
+
+    Attributes:
+        root: Top of the watched tree
+        settle_seconds: Files modified more recently than this are not reported yet
+        full_scan_interval: Seconds between full rescans (0 disables)
+    """
+
+    def __init__(self, root: Path, settle_seconds: float = 2.0, full_scan_interval: float = 3600.0):
+        """
+        Initialize an empty snapshot (the first scan() lists everything).
+
+        Args:
+            root: Directory to index
+            settle_seconds: Minimum age of a file's mtime before it is reported
+            full_scan_interval: Seconds between full rescans
+        """
+        self.root = Path(root)
+        self.settle_seconds = settle_seconds
+        self.full_scan_interval = full_scan_interval
+
+        self._dirs: Dict[str, _DirState] = {}
+        self._unsettled: Dict[str, str] = {}  # file path -> parent directory path
+        self._next_full_scan = 0.0
+
+    def __len__(self) -> int:
+        return sum(len(state.files) for state in self._dirs.values())
+
+    def paths(self) -> Iterator[Path]:
+        """Iterate over every indexed file."""
+        for dirpath, state in self._dirs.items():
+            for name in state.files:
+                yield Path(dirpath, name)
+
+    def unsettled(self) -> List[Path]:
+        """Get the files found by a scan that were still being written."""
+        return [Path(filepath) for filepath in self._unsettled]
+
+    def scan(self) -> Tuple[List[FileStat], List[Path]]:
+        """
+        Refresh the snapshot.
+
+        Returns:
+            (new or changed files that have settled, files that disappeared)
+        """
+        now = time.monotonic()
+        full = self.full_scan_interval > 0 and now >= self._next_full_scan
+        if full:
+            self._next_full_scan = now + self.full_scan_interval
+
+        changed: List[FileStat] = []
+        removed: List[Path] = []
+        seen_dirs = set()
+        stack = [str(self.root)]
+
+        while stack:
+            dirpath = stack.pop()
+            try:
+                mtime_ns = os.stat(dirpath).st_mtime_ns
+            except OSError:
+                continue
+            seen_dirs.add(dirpath)
+
+            state = self._dirs.get(dirpath)
+            if state is None or full or state.mtime_ns != mtime_ns:
+                state = self._relist(dirpath, mtime_ns, state, changed, removed)
+            stack.extend(os.path.join(dirpath, name) for name in state.subdirs)
+
+        # Directories that vanished take their files with them
+        for dirpath in [d for d in self._dirs if d not in seen_dirs]:
+            state = self._dirs.pop(dirpath)
+            removed.extend(Path(dirpath, name) for name in state.files)
+            for name in state.files:
+                self._unsettled.pop(os.path.join(dirpath, name), None)
+
+        self._recheck_unsettled(changed, removed)
+        return changed, removed
+
+    def _relist(
+        self,
+        dirpath: str,
+        mtime_ns: int,
+        previous: Optional[_DirState],
+        changed: List[FileStat],
+        removed: List[Path]
+    ) -> _DirState:
+        """List one directory and diff it against its previous listing."""
+        state = _DirState(mtime_ns)
+        old_files = previous.files if previous else {}
+
+        try:
+            with os.scandir(dirpath) as entries:
+                for entry in entries:
+                    if entry.name.startswith('.'):
+                        continue
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            state.subdirs.append(entry.name)
+                            continue
+                        if not entry.is_file():
+                            continue
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+
+                    state.files[entry.name] = stat
+                    old = old_files.get(entry.name)
+                    if old is None or file_signature(old) != file_signature(stat):
+                        self._offer(Path(entry.path), dirpath, stat, changed)
+        except OSError:
+            return previous or state
+
+        removed.extend(Path(dirpath, name) for name in old_files if name not in state.files)
+        for name in old_files:
+            if name not in state.files:
+                self._unsettled.pop(os.path.join(dirpath, name), None)
+
+        self._dirs[dirpath] = state
+        return state
+
+    def _offer(self, path: Path, dirpath: str, stat: os.stat_result, changed: List[FileStat]) -> None:
+        """Report a new/changed file, or park it until its writes settle."""
+        if time.time() - stat.st_mtime < self.settle_seconds:
+            self._unsettled[str(path)] = dirpath
+        else:
+            self._unsettled.pop(str(path), None)
+            changed.append((path, stat))
+
+    def _recheck_unsettled(self, changed: List[FileStat], removed: List[Path]) -> None:
+        """Re-stat files that were still being written at the last scan."""
+        reported = {str(path) for path, _ in changed}
+        for filepath, dirpath in list(self._unsettled.items()):
+            if filepath in reported:
+                continue
+            state = self._dirs.get(dirpath)
+            name = os.path.basename(filepath)
+            try:
+                stat = os.stat(filepath)
+            except OSError:
+                self._unsettled.pop(filepath, None)
+                if state and state.files.pop(name, None) is not None:
+                    removed.append(Path(filepath))
+                continue
+            if state is not None:
+                state.files[name] = stat
+            self._offer(Path(filepath), dirpath, stat, changed)
@@ -0,0 +1,134 @@
+"""
+Bounded work queue for files settled in watchdog mode.
+
+Hashing and copying a large file must not block the observer thread or
+hold up small files dropped right after it. Settled paths are queued by
+(priority, size), so an urgent or small file overtakes big ones still
+waiting, and a pool of worker threads processes them concurrently.
+"""
+
+import itertools
+import queue
+import threading
+from pathlib import Path
+from typing import Callable, List, Optional, Set
+
+# Queue order for the classifier's priority levels (lower runs first)
+PRIORITY_RANK = {'critical': 0, 'high': 1, 'normal': 2, 'low': 3}
+
+
+class WorkQueue:
+    """
+    Priority queue of paths consumed by a pool of worker threads.
+
+    A path is queued at most once at a time; putting a path that is
+    already waiting or being processed is a no-op.
+
+    Attributes:
+        handler: Called with each path on a worker thread
+        workers: Number of worker threads
+        max_size: Maximum number of waiting paths (put() blocks beyond it)
+    """
+
+    # How often idle workers check for stop()
+    POLL_SECONDS = 0.5
+
+    def __init__(self, handler: Callable[[Path], None], workers: int = 2, max_size: int = 1000):
+        """
+        Initialize the queue (call start() to launch the workers).
+
+        Args:
+            handler: Callback processing one path
+            workers: Number of worker threads
+            max_size: Queue bound
+        """
+        self.handler = handler
+        self.workers = max(1, workers)
+        self.max_size = max_size
+
+        self._queue: 'queue.PriorityQueue' = queue.PriorityQueue(max_size)
+        self._order = itertools.count()
+        self._active: Set[Path] = set()
+        self._lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+        self._stopping = threading.Event()
+
+    def put(self, path: Path, priority: str = 'normal', size: int = 0, timeout: Optional[float] = None) -> bool:
+        """
+        Queue a path, smaller and more urgent files first.
+
+        Args:
+            path: File to process
+            priority: Priority level of the file
+            size: File size in bytes
+            timeout: Seconds to wait for room (None waits indefinitely)
+
+        Returns:
+            True if queued, False if already queued or the queue stayed full
+        """
+        with self._lock:
+            if path in self._active:
+                return False
+            self._active.add(path)
+
+        rank = PRIORITY_RANK.get(priority, PRIORITY_RANK['normal'])
+        try:
+            self._queue.put((rank, size, next(self._order), path), timeout=timeout)
+        except queue.Full:
+            with self._lock:
+                self._active.discard(path)
+            return False
+        return True
+
+    def start(self) -> None:
+        """Launch the worker threads."""
+        if self._threads:
+            return
+        self._stopping.clear()
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._work, name=f'fte-fs-worker-{i}', daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self) -> int:
+        """
+        Stop the workers after their current file.
+
+        Returns:
+            Number of paths that were still waiting (not processed)
+        """
+        self._stopping.set()
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+        waiting = 0
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+            waiting += 1
+        with self._lock:
+            self._active.clear()
+        return waiting
+
+    def __len__(self) -> int:
+        return self._queue.qsize()
+
+    def __contains__(self, path: Path) -> bool:
+        with self._lock:
+            return path in self._active
+
+    def _work(self) -> None:
+        """Worker loop: process paths until stop() is called."""
+        while not self._stopping.is_set():
+            try:
+                path = self._queue.get(timeout=self.POLL_SECONDS)[3]
+            except queue.Empty:
+                continue
+            try:
+                self.handler(path)
+            finally:
+                with self._lock:
+                    self._active.discard(path)
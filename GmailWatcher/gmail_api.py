@@ -0,0 +1,256 @@
+"""
+Shared Gmail data access for the Gmail watcher and the email MCP server.
+
+Message metadata is fetched with batch requests (BatchHttpRequest) of up
+to GMAIL_BATCH_SIZE messages.get calls each, instead of one round trip
+per message. Each call carries a fields= mask, so the response holds
+only the id, threadId, snippet and the From/To/Subject/Date headers.
+
+A sub-request answered with 429 or 5xx is retried on its own, in a
+smaller batch of just the failed calls, with exponential backoff; the
+calls that succeeded are not repeated. Messages that no longer exist
+(404) are left out of the result.
+
+iter_message_pages() walks messages.list page by page, following
+nextPageToken, so callers can fetch and process one page before listing
+the next, and stop (and later resume from the page token) at any page.
+
+Only the service object is used, so importing this module does not
+import the Google client libraries.
+
+Environment Variables:
+    GMAIL_BATCH_SIZE: Sub-requests per batch request (default: 100, max: 100)
+    GMAIL_BATCH_RETRIES: Retries of a throttled sub-request (default: 4)
+"""
+
+import os
+import random
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+METADATA_HEADERS = ['From', 'To', 'Subject', 'Date']
+METADATA_FIELDS = 'id,threadId,snippet,payload/headers(name,value)'
+
+# The batch endpoint accepts at most 100 calls per request
+BATCH_SIZE = max(1, min(100, int(os.getenv('GMAIL_BATCH_SIZE', '100'))))
+MAX_RETRIES = int(os.getenv('GMAIL_BATCH_RETRIES', '4'))
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 32.0
+
+# Largest page messages.list returns
+PAGE_SIZE = 500
+
+
+def http_status(error: Exception) -> Optional[int]:
+    """
+    Get the HTTP status of a googleapiclient HttpError.
+
+    Args:
+        error: Exception raised by a request
+
+    Returns:
+        The status code, or None for other errors
+    """
+    return getattr(getattr(error, 'resp', None), 'status', None)
+
+
+def _backoff(attempt: int) -> None:
+    """Sleep before a retry: exponential with full jitter."""
+    time.sleep(random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt)))
+
+
+def _execute_batch(service: Any, message_ids: List[str], results: Dict[str, Dict[str, Any]]) -> Dict[str, Exception]:
+    """
+    Fetch one batch of messages.get calls.
+
+    Args:
+        service: Gmail API service
+        message_ids: At most BATCH_SIZE unique message IDs
+        results: Filled with message ID -> message resource
+
+    Returns:
+        Message ID -> error, for the sub-requests that failed
+    """
+    errors: Dict[str, Exception] = {}
+
+    def collect(request_id: str, response: Dict[str, Any], exception: Optional[Exception]) -> None:
+        if exception is not None:
+            errors[request_id] = exception
+        else:
+            results[request_id] = response
+
+    batch = service.new_batch_http_request(callback=collect)
+    for msg_id in message_ids:
+        batch.add(
+            service.users().messages().get(
+                userId='me',
+                id=msg_id,
+                format='metadata',
+                metadataHeaders=METADATA_HEADERS,
+                fields=METADATA_FIELDS
+            ),
+            request_id=msg_id
+        )
+
+    try:
+        batch.execute()
+    except Exception as e:
+        # The batch request itself failed: every call in it is retryable or fatal
+        if http_status(e) not in RETRY_STATUSES:
+            raise
+        errors.update((msg_id, e) for msg_id in message_ids if msg_id not in results)
+    return errors
+
+
+def _fetch_batch(service: Any, message_ids: List[str], max_retries: int) -> List[Dict[str, Any]]:
+    """
+    Fetch one batch of messages, retrying throttled sub-requests.
+
+    Args:
+        service: Gmail API service
+        message_ids: At most BATCH_SIZE unique message IDs
+        max_retries: Retries of a 429/5xx sub-request before giving up
+
+    Returns:
+        Message resources in the order of message_ids
+    """
+    results: Dict[str, Dict[str, Any]] = {}
+
+    pending = message_ids
+    for attempt in range(max_retries + 1):
+        errors = _execute_batch(service, pending, results)
+
+        pending = []
+        for msg_id, error in errors.items():
+            status = http_status(error)
+            if status == 404:
+                continue
+            if status not in RETRY_STATUSES or attempt == max_retries:
+                raise error
+            pending.append(msg_id)
+
+        if not pending:
+            break
+        _backoff(attempt)
+
+    return [results[msg_id] for msg_id in message_ids if msg_id in results]
+
+
+def iter_metadata_batches(
+    service: Any,
+    message_ids: Iterable[str],
+    batch_size: int = BATCH_SIZE,
+    max_retries: int = MAX_RETRIES
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Fetch the metadata of many messages, one batch request at a time.
+
+    Message IDs are read lazily, so only one batch is held in memory.
+
+    Args:
+        service: Gmail API service
+        message_ids: Messages to fetch (duplicates are fetched once)
+        batch_size: Sub-requests per batch request
+        max_retries: Retries of a 429/5xx sub-request before giving up
+
+    Yields:
+        Message resources (id, threadId, snippet, payload.headers) of
+        each batch, in the order of message_ids, without messages that
+        no longer exist
+
+    Raises:
+        The first non-retryable error, or the last error of a
+        sub-request that kept failing
+    """
+    seen = set()
+    batch: List[str] = []
+    for msg_id in message_ids:
+        if msg_id in seen:
+            continue
+        seen.add(msg_id)
+        batch.append(msg_id)
+        if len(batch) == batch_size:
+            yield _fetch_batch(service, batch, max_retries)
+            batch = []
+    if batch:
+        yield _fetch_batch(service, batch, max_retries)
+
+
+def fetch_metadata(
+    service: Any,
+    message_ids: Iterable[str],
+    batch_size: int = BATCH_SIZE,
+    max_retries: int = MAX_RETRIES
+) -> List[Dict[str, Any]]:
+    """
+    Fetch the metadata of many messages in batch requests.
+
+    Args:
+        service: Gmail API service
+        message_ids: Messages to fetch (duplicates are fetched once)
+        batch_size: Sub-requests per batch request
+        max_retries: Retries of a 429/5xx sub-request before giving up
+
+    Returns:
+        Message resources in the order of message_ids (see
+        iter_metadata_batches)
+    """
+    return [
+        message
+        for batch in iter_metadata_batches(service, message_ids, batch_size, max_retries)
+        for message in batch
+    ]
+
+
+def iter_message_pages(
+    service: Any,
+    query: str,
+    limit: Optional[int] = None,
+    page_token: Optional[str] = None,
+    page_size: int = PAGE_SIZE
+) -> Iterator[Tuple[List[str], Optional[str]]]:
+    """
+    List the messages matching a query, one messages.list page at a time.
+
+    The next page is requested only when the caller asks for it.
+
+    Args:
+        service: Gmail API service
+        query: Gmail search query
+        limit: Stop after this many messages (None for all)
+        page_token: nextPageToken to resume a listing from
+        page_size: Messages per page (at most PAGE_SIZE)
+
+    Yields:
+        (message IDs on the page, token of the next page or None at the end)
+    """
+    listed = 0
+    while limit is None or listed < limit:
+        size = page_size if limit is None else min(page_size, limit - listed)
+        response = service.users().messages().list(
+            userId='me',
+            q=query,
+            maxResults=size,
+            pageToken=page_token
+        ).execute()
+
+        ids = [message['id'] for message in response.get('messages', [])]
+        listed += len(ids)
+        page_token = response.get('nextPageToken')
+        yield ids, page_token
+        if not page_token:
+            return
+
+
+def headers_of(message: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Get a message's headers as a name -> value dict.
+
+    Args:
+        message: Message resource from fetch_metadata
+
+    Returns:
+        Header values by name
+    """
+    return {h['name']: h['value'] for h in message.get('payload', {}).get('headers', [])}
@@ -1,5 +1,7 @@
-from .process_ids import LoadProcessedIds , SaveProcessedIds
 from .authenticate import Authenticate
 from .create_action_files import CreateActionFiles
 from .mark_as_read import MarkAsRead
-from .check_for_updates import CheckForUpdates
\ No newline at end of file
+from .check_for_updates import CheckForUpdates
+from .sync_history import (
+    DrainPending, FetchMessages, FullSync, RefeedDeferred, SaveSyncState, SyncHistory, TrackDeferred
+)
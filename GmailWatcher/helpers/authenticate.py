@@ -1,24 +1,26 @@
-# Gmail API imports (optional, graceful fallback)
-try:
-    from google.oauth2.credentials import Credentials
-    from google_auth_oauthlib.flow import InstalledAppFlow
-    from googleapiclient.discovery import build
-    from google.auth.transport.requests import Request
-    from google.auth.exceptions import RefreshError
-    GMAIL_AVAILABLE = True
-except ImportError:
-    GMAIL_AVAILABLE = False
-    print("Gmail API libraries not installed. Install with:")
-    print("  pip install google-api-python-client google-auth-httplib2 google-auth-oauthlib")
-
-
 def Authenticate(self) -> bool:
     """
     Authenticate with Gmail API.
+
+    The Google client libraries are imported here rather than at module
+    import, so --help and dry-run paths never load them.
     
     Returns:
         True if authentication successful, False otherwise
     """
+    try:
+        from google.oauth2.credentials import Credentials
+        from google_auth_oauthlib.flow import InstalledAppFlow
+        from googleapiclient.discovery import build
+        from google.auth.transport.requests import Request
+        from google.auth.exceptions import RefreshError
+    except ImportError as e:
+        self.logger.error(
+            f"Gmail API libraries not installed ({e}). Install with: "
+            "pip install google-api-python-client google-auth-httplib2 google-auth-oauthlib"
+        )
+        return False
+
     creds = None
     
     # Load existing token
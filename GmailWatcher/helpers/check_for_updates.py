@@ -1,55 +1,76 @@
-from typing import List , Dict , Any
+from typing import Iterator , Dict , Any , Optional
 
-def CheckForUpdates(self) -> List[Dict[str, Any]]:
+from .sync_history import DrainPending, FullSync, RefeedDeferred, SaveSyncState, SyncHistory
+
+def CheckForUpdates(self) -> Iterator[Dict[str, Any]]:
         """
         Check Gmail for new unread messages.
-        
+
+        Only changes since the stored historyId are fetched (History API);
+        the first run, or one whose historyId has expired, lists every
+        matching message page by page instead.
+
+        Messages are fetched lazily, one batch request at a time, as the
+        caller consumes them, and at most max_per_cycle are taken per
+        cycle. The rest of a listing (its page token) or of a history
+        delta (its message IDs) is saved and taken first next cycle.
+        Messages deferred by backpressure are kept in the sync state
+        until written (see TrackDeferred).
+
         Returns:
-            List of message dictionaries with id, snippet, headers
+            Iterator of message dictionaries with id, snippet, headers
         """
         if not self.service:
             if not self._authenticate():
-                return []
-        
+                return iter(())
+
+        return StreamUpdates(self)
+
+
+def StreamUpdates(self) -> Iterator[Dict[str, Any]]:
+        """
+        Generator behind CheckForUpdates; an error ends the cycle early.
+
+        Yields:
+            Message dictionaries with id, snippet, headers, priority
+        """
+        yielded = set()
         try:
-            # Build query for unread, important messages
-            query = 'is:unread'
-            if 'IMPORTANT' in self.label_ids:
-                query += ' is:important'
-            
-            # Fetch messages
-            results = self.service.users().messages().list(
-                userId='me',
-                q=query,
-                maxResults=10  # Limit to 10 at a time
-            ).execute()
-            
-            messages = results.get('messages', [])
-            
-            # Filter out already processed
-            new_messages = []
-            for msg in messages:
-                msg_id = msg['id']
-                if msg_id not in self.processed_ids:
-                    # Fetch full message
-                    full_msg = self.service.users().messages().get(
-                        userId='me',
-                        id=msg_id,
-                        format='metadata',
-                        metadataHeaders=['From', 'To', 'Subject', 'Date']
-                    ).execute()
-                    
-                    new_messages.append({
-                        'id': msg_id,
-                        'snippet': full_msg.get('snippet', ''),
-                        'headers': {
-                            h['name']: h['value']
-                            for h in full_msg['payload']['headers']
-                        }
-                    })
-            
-            return new_messages
-            
+            for message in SyncSources(self, self.max_per_cycle or None):
+                # A re-fed deferred message may also be in this cycle's changes
+                if message['id'] not in yielded:
+                    yielded.add(message['id'])
+                    yield message
+
         except Exception as e:
+            self.metrics.inc('errors')
             self.logger.error(f"Error checking Gmail: {e}")
-            return []
\ No newline at end of file
+
+
+def SyncSources(self, limit: Optional[int]) -> Iterator[Dict[str, Any]]:
+        """
+        Yield re-fed deferred messages, then the history delta or full listing.
+
+        Args:
+            limit: Most messages taken from the delta or listing (None for all)
+
+        Yields:
+            Message dictionaries with id, snippet, headers, priority
+        """
+        yield from RefeedDeferred(self)
+
+        history_id = self.sync_state.get('history_id')
+        if history_id and not self.sync_state.get('full_sync'):
+            delta = SyncHistory(self, history_id)
+            if delta is not None:
+                message_ids, history_id = delta
+                pending = list(dict.fromkeys(self.sync_state.get('pending', []) + message_ids))
+                self.sync_state.update(history_id=history_id, pending=pending or None)
+                SaveSyncState(self)
+                yield from DrainPending(self, pending, limit)
+                return
+
+            self.logger.warning(f"Gmail history {history_id} expired, running a full sync")
+            self.sync_state.update(history_id=None, pending=None)
+
+        yield from FullSync(self, limit)
@@ -19,8 +19,8 @@ def CreateActionFiles(self, item: Dict[str, Any]) -> Optional[Path]:
             date = headers.get('Date', datetime.now().isoformat())
             to_addr = headers.get('To', '')
             
-            # Determine priority
-            priority = self.get_priority(f"{subject} {item['snippet']}")
+            # Determine priority (pre-computed per cycle by CheckForUpdates)
+            priority = item.get('priority') or self.get_priority(f"{subject} {item['snippet']}")
             
             # Sanitize filename
             safe_subject = self.sanitize_filename(subject[:50])
@@ -93,8 +93,7 @@ _Add your notes here_
                 })
             else:
                 filepath.write_text(content, encoding='utf-8')
-                self.processed_ids.add(item['id'])
-                self._save_processed_ids()
+                self.mark_processed(item['id'])
                 
                 self.logger.info(f"Created action file: {filepath}")
                 self.log_action('email_action_created', {
@@ -107,5 +106,6 @@ _Add your notes here_
             return filepath
             
         except Exception as e:
+            self.metrics.inc('errors')
             self.logger.error(f"Error creating action file: {e}")
             return None
\ No newline at end of file
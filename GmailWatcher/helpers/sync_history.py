@@ -0,0 +1,222 @@
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ..gmail_api import BATCH_SIZE, headers_of, http_status, iter_message_pages, iter_metadata_batches
+
+# Changes that can make a message start or stop matching the watched labels
+HISTORY_TYPES = ['messageAdded', 'labelAdded', 'labelRemoved']
+
+# Largest page history.list returns
+PAGE_SIZE = 500
+
+
+def SearchQuery(self) -> str:
+    """
+    Build the messages.list query for the watched labels.
+
+    Returns:
+        Gmail search query
+    """
+    query = 'is:unread'
+    if 'IMPORTANT' in self.label_ids:
+        query += ' is:important'
+    return query
+
+
+def MatchesLabels(self, label_ids: Optional[List[str]]) -> bool:
+    """
+    Check whether a message's labels make it a watched (unread) message.
+
+    Args:
+        label_ids: The message's labelIds
+
+    Returns:
+        True if the message carries UNREAD and every watched label
+    """
+    return {'UNREAD', *self.label_ids}.issubset(label_ids or ())
+
+
+def SyncHistory(self, start_history_id: str) -> Optional[Tuple[List[str], str]]:
+    """
+    Fetch mailbox changes since a history ID with users.history.list.
+
+    Only the delta is transferred, so an idle mailbox costs one request
+    per cycle. Every page is read.
+
+    Args:
+        start_history_id: historyId the last sync ended at
+
+    Returns:
+        (IDs that now match the watched labels, historyId to resume
+        from), or None if start_history_id is too old and a full
+        resync is needed
+    """
+    matching: Dict[str, None] = {}
+    history_id = start_history_id
+    page_token = None
+
+    while True:
+        try:
+            response = self.service.users().history().list(
+                userId='me',
+                startHistoryId=start_history_id,
+                historyTypes=HISTORY_TYPES,
+                maxResults=PAGE_SIZE,
+                pageToken=page_token
+            ).execute()
+        except Exception as e:
+            # History IDs stay valid for about a week; older ones return 404
+            if http_status(e) == 404:
+                return None
+            raise
+
+        # Records are in order, so a message's last change wins: one
+        # added and then read before this sync is never surfaced
+        for record in response.get('history', []):
+            changes = record.get('messagesAdded', []) + record.get('labelsAdded', []) + record.get('labelsRemoved', [])
+            for change in changes:
+                message = change['message']
+                if MatchesLabels(self, message.get('labelIds')):
+                    matching[message['id']] = None
+                else:
+                    matching.pop(message['id'], None)
+
+        history_id = response.get('historyId', history_id)
+        page_token = response.get('nextPageToken')
+        if not page_token:
+            return list(matching), history_id
+
+
+def SaveSyncState(self) -> None:
+    """
+    Persist the sync cursor, except in dry run.
+
+    A dry run writes no action files, so the messages it saw must still
+    be ahead of the saved cursor when a live run starts.
+    """
+    if not self.dry_run:
+        self.sync_state.save()
+
+
+def TrackDeferred(self, message_ids: List[str]) -> None:
+    """
+    Record messages held back by backpressure in the sync state.
+
+    The cursor has already moved past them, so the in-memory holding
+    queue is not enough: an item it drops when full, or holds at a
+    restart, would never be listed again. Their IDs stay under
+    'deferred' until RefeedDeferred finds them processed or gone.
+
+    Args:
+        message_ids: IDs of the messages deferred this cycle
+    """
+    deferred = list(dict.fromkeys(self.sync_state.get('deferred', []) + message_ids))
+    self.sync_state.update(deferred=deferred)
+    SaveSyncState(self)
+
+
+def RefeedDeferred(self) -> Iterator[Dict[str, Any]]:
+    """
+    Fetch deferred messages that are no longer in the holding queue.
+
+    These were dropped from the queue or lost with a restart. They are
+    fetched again once the backlog is no longer throttling polling.
+
+    Yields:
+        Message dictionaries (see FetchMessages)
+    """
+    deferred = self.sync_state.get('deferred', [])
+    missing = [msg_id for msg_id in deferred if msg_id not in self.holding]
+    if not missing or self.poll_schedule.throttled:
+        return
+
+    kept = [msg_id for msg_id in deferred if msg_id in self.holding]
+    for message in FetchMessages(self, missing):
+        kept.append(message['id'])
+        yield message
+
+    # The rest were processed meanwhile or no longer exist
+    self.sync_state.update(deferred=kept or None)
+    SaveSyncState(self)
+
+
+def FetchMessages(self, message_ids: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    """
+    Fetch and classify the unprocessed messages, one batch request at a time.
+
+    Args:
+        message_ids: Candidate message IDs (read lazily)
+
+    Yields:
+        Message dictionaries with id, snippet, headers, priority
+    """
+    new_ids = (msg_id for msg_id in message_ids if not self.is_processed(msg_id))
+    for batch in iter_metadata_batches(self.service, new_ids):
+        messages = [
+            {
+                'id': message['id'],
+                'snippet': message.get('snippet', ''),
+                'headers': headers_of(message)
+            }
+            for message in batch
+        ]
+
+        # Score the whole batch in one classifier pass
+        results = self.classifier.classify_batch([
+            f"{m['headers'].get('Subject', '')} {m['snippet']}" for m in messages
+        ])
+        for message, result in zip(messages, results):
+            message['priority'] = result.priority
+            message['matched_terms'] = result.matches
+        yield from messages
+
+
+def DrainPending(self, pending: List[str], limit: Optional[int]) -> Iterator[Dict[str, Any]]:
+    """
+    Fetch messages found by a history sync, saving progress per batch.
+
+    Args:
+        pending: Message IDs still to fetch (already saved as 'pending')
+        limit: Most IDs to take this cycle (None for all); the rest stay pending
+
+    Yields:
+        Message dictionaries (see FetchMessages)
+    """
+    taken = pending[:limit] if limit else pending
+    for start in range(0, len(taken), BATCH_SIZE):
+        chunk = taken[start:start + BATCH_SIZE]
+        yield from FetchMessages(self, chunk)
+
+        # The chunk's action files are written once the consumer asks for more
+        self.sync_state.update(pending=pending[start + len(chunk):] or None)
+        SaveSyncState(self)
+
+
+def FullSync(self, limit: Optional[int]) -> Iterator[Dict[str, Any]]:
+    """
+    List every watched message page by page, resuming an unfinished listing.
+
+    The profile's historyId is read before listing, so changes made
+    while listing are replayed by the next SyncHistory instead of lost.
+    After each page the next page token is saved; once the last page is
+    done, the historyId becomes the cursor for SyncHistory.
+
+    Args:
+        limit: Most messages to list this cycle (None for all)
+
+    Yields:
+        Message dictionaries (see FetchMessages)
+    """
+    progress = self.sync_state.get('full_sync')
+    if not progress:
+        profile = self.service.users().getProfile(userId='me').execute()
+        progress = {'history_id': profile['historyId']}
+
+    pages = iter_message_pages(self.service, SearchQuery(self), limit=limit, page_token=progress.get('page_token'))
+    for message_ids, page_token in pages:
+        yield from FetchMessages(self, message_ids)
+
+        if page_token:
+            self.sync_state.update(full_sync={'history_id': progress['history_id'], 'page_token': page_token})
+        else:
+            self.sync_state.update(full_sync=None, pending=None, history_id=progress['history_id'])
+        SaveSyncState(self)
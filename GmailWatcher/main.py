@@ -18,12 +18,25 @@ Environment Variables:
     GMAIL_TOKEN_PATH: Path to token.json (default: ~/.gmail/token.json)
     VAULT_PATH: Path to Obsidian vault (default: ./vault)
     DRY_RUN: Set to 'false' to enable actual processing
+    GMAIL_MAX_PER_CYCLE: Most messages taken per check, the rest next check (default: 100, 0: no limit)
+
+Sync:
+    After the first full listing, each check fetches only the mailbox
+    changes since the last one (users.history.list). The historyId is kept
+    in /Logs/gmail_sync_state.json, so a restart resumes where it left off;
+    if it has expired (about a week idle), the watcher lists everything again.
+    Listings are read page by page and message metadata is fetched in
+    batch requests as action files are written (see gmail_api.py,
+    GMAIL_BATCH_SIZE and GMAIL_BATCH_RETRIES), so a large backlog drains
+    in bounded memory. A check stops after GMAIL_MAX_PER_CYCLE messages;
+    the unfinished listing's page token is saved and resumed next check.
 """
 
 import os
 import sys
+from importlib.util import find_spec
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 dry_run = os.getenv('DRY_RUN', 'false').lower() == 'true'
 
@@ -31,23 +44,20 @@ dry_run = os.getenv('DRY_RUN', 'false').lower() == 'true'
 sys.path.insert(0, str(Path(__file__).parent))
 
 from BaseWatcher import BaseWatcher
+from BaseWatcher.sync_state import SyncState
 
-# Gmail API imports (optional, graceful fallback)
-try:
-    import google.oauth2.credentials
-    import google_auth_oauthlib.flow
-    import googleapiclient.discovery
-    import google.auth.transport.requests
-    import google.auth.exceptions  
-    GMAIL_AVAILABLE = True
-except ImportError:
-    GMAIL_AVAILABLE = False
+# Gmail API libraries (optional, imported lazily on authentication)
+GMAIL_AVAILABLE = all(
+    find_spec(name) is not None
+    for name in ('googleapiclient', 'google_auth_oauthlib', 'google.oauth2', 'google.auth')
+)
+if not GMAIL_AVAILABLE:
     print("Gmail API libraries not installed. Install with:")
     print("  pip install google-api-python-client google-auth-httplib2 google-auth-oauthlib")
 
 ## Helper utililties :
 from .helpers import (
-    Authenticate , LoadProcessedIds , CreateActionFiles , MarkAsRead , SaveProcessedIds , CheckForUpdates
+    Authenticate , CreateActionFiles , MarkAsRead , CheckForUpdates , TrackDeferred
 )
 class GmailWatcher(BaseWatcher):
     """
@@ -56,9 +66,14 @@ class GmailWatcher(BaseWatcher):
     Attributes:
         credentials_path: Path to Gmail credentials.json
         token_path: Path to OAuth token.json
-        processed_ids: Set of already processed message IDs
+        processed_store: Durable store of already processed message IDs
+        sync_state: Persisted Gmail historyId the next check resumes from
+        max_per_cycle: Most messages taken per check (0: no limit)
     """
 
+    WATCHER_NAME = 'gmail'
+    LEGACY_PROCESSED_FILES = ['gmail_processed_ids.txt']
+
     # Scopes required for Gmail API
     SCOPES = ['https://www.googleapis.com/auth/gmail.readonly', 'https://www.googleapis.com/auth/gmail.compose' , "https://www.googleapis.com/auth/gmail.modify"]
 
@@ -68,7 +83,10 @@ class GmailWatcher(BaseWatcher):
         credentials_path: Optional[str] = None,
         token_path: Optional[str] = None,
         check_interval: int = 120,
-        label_ids: Optional[List[str]] = None
+        label_ids: Optional[List[str]] = None,
+        min_interval: Optional[float] = None,
+        max_interval: Optional[float] = None,
+        adaptive: Optional[bool] = None
     ):
         """
         Initialize the Gmail watcher.
@@ -79,6 +97,9 @@ class GmailWatcher(BaseWatcher):
             token_path: Path to OAuth token.json
             check_interval: Seconds between checks (default: 120)
             label_ids: Gmail label IDs to filter (default: ['UNREAD', 'IMPORTANT'])
+            min_interval: Fastest adaptive polling interval
+            max_interval: Slowest adaptive polling interval
+            adaptive: Enable adaptive polling
         """
         if not GMAIL_AVAILABLE:
             raise ImportError(
@@ -87,7 +108,7 @@ class GmailWatcher(BaseWatcher):
                 "google-auth-httplib2 google-auth-oauthlib"
             )
 
-        super().__init__(vault_path, check_interval)
+        super().__init__(vault_path, check_interval, min_interval, max_interval, adaptive)
 
         # Default paths
         home = Path.home()
@@ -102,12 +123,11 @@ class GmailWatcher(BaseWatcher):
         
         # Gmail service (initialized on first use)
         self.service = None
-        
-        # Load previously processed message IDs
-        self._load_processed_ids()
 
-    def _load_processed_ids(self) -> None:
-        return LoadProcessedIds(self)
+        # History API cursor, kept across restarts
+        self.sync_state = SyncState(self.logs / 'gmail_sync_state.json')
+        # One batch request per check keeps a backlog within the per-user quota
+        self.max_per_cycle = int(os.getenv('GMAIL_MAX_PER_CYCLE', '100'))
 
     def _authenticate(self) -> bool:
         return Authenticate(self)
@@ -117,12 +137,12 @@ class GmailWatcher(BaseWatcher):
 
     def mark_as_read(self, message_id: str) -> bool:
        return MarkAsRead(self , message_id)
-    
-    def _save_processed_ids(self) -> None:
-       return SaveProcessedIds(self)
 
-    def check_for_updates(self) -> List[Dict[str, Any]]:
-        return CheckForUpdates(self)       
+    def check_for_updates(self) -> Iterator[Dict[str, Any]]:
+        return CheckForUpdates(self)
+
+    def on_deferred(self, keys: List[str]) -> None:
+        TrackDeferred(self, keys)       
 
 def main():
     """Main entry point for Gmail watcher."""
@@ -152,6 +172,24 @@ def main():
         default=120,
         help='Check interval in seconds'
     )
+    parser.add_argument(
+        '--min-interval',
+        type=float,
+        default=None,
+        help='Fastest adaptive check interval in seconds (env: GMAIL_MIN_INTERVAL)'
+    )
+    parser.add_argument(
+        '--max-interval',
+        type=float,
+        default=None,
+        help='Slowest adaptive check interval in seconds (env: GMAIL_MAX_INTERVAL)'
+    )
+    parser.add_argument(
+        '--adaptive',
+        action='store_true',
+        default=None,
+        help='Poll faster while items arrive and back off when idle'
+    )
     
     args = parser.parse_args()
     
@@ -195,7 +233,10 @@ def main():
         watcher = GmailWatcher(
             vault_path=args.vault,
             credentials_path=args.credentials,
-            check_interval=args.interval
+            check_interval=args.interval,
+            min_interval=args.min_interval,
+            max_interval=args.max_interval,
+            adaptive=args.adaptive
         )
         watcher.run()
     except KeyboardInterrupt:
@@ -4,6 +4,7 @@ from .count_files import CountFiles
 from .find_qwen_executable import FindQwenExecutable
 from .update_dashboard import UpdateDashboard
 from .start_watcher import StartWatcher
+from .host_watchers import HostWatchers
 from .stop_watcher import StopWatcher
 from .start_mcp_server import StartMcpServer
 from .stop_mcp_server import StopMcpServer
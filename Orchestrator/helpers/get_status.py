@@ -1,6 +1,29 @@
+import json
 from datetime import datetime
 
 from typing import Any, Dict
+
+
+def LoadWatcherMetrics(self) -> Dict[str, Any]:
+    """
+    Load the metrics snapshots watchers write to /Logs/metrics_<name>.json.
+
+    Args:
+        self: Orchestrator instance
+
+    Returns:
+        Dictionary of watcher name -> snapshot (unreadable files are skipped)
+    """
+    snapshots = {}
+    for path in sorted(self.logs.glob('metrics_*.json')):
+        try:
+            snapshot = json.loads(path.read_text(encoding='utf-8'))
+            snapshots[snapshot.get('watcher', path.stem[len('metrics_'):])] = snapshot
+        except (OSError, ValueError):
+            continue
+    return snapshots
+
+
 def GetStatus(self) -> Dict[str, Any]:
     """
     Get current system status.
@@ -28,6 +51,7 @@ def GetStatus(self) -> Dict[str, Any]:
             'approved': self._count_files(self.approved),
             'done': self._count_files(self.done),
         },
+        'metrics': LoadWatcherMetrics(self),
         'dashboard': 'exists' if self.dashboard.exists() else 'missing',
         'timestamp': datetime.now().isoformat()
     }
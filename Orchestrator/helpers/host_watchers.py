@@ -0,0 +1,75 @@
+import importlib
+from typing import List
+
+# Watcher name -> (module, class), imported only when hosted
+WATCHER_CLASSES = {
+    'gmail': ('GmailWatcher.main', 'GmailWatcher'),
+    'filesystem': ('FilesystemWatcher.main', 'FilesystemWatcher'),
+    'whatsapp': ('WhatsappWatcher.main', 'WhatsAppWatcher'),
+}
+
+# Seconds between dashboard refreshes while hosting
+DASHBOARD_INTERVAL = 60
+
+
+def HostWatchers(self, watcher_names: List[str]) -> int:
+    """
+    Run watchers inside this process instead of one subprocess each.
+
+    Every watcher gets its own thread in a shared WatcherScheduler with
+    isolated error handling and restart-with-backoff, so the fleet pays
+    for one interpreter and one set of imports. Blocks until Ctrl+C.
+
+    Args:
+        self: Orchestrator instance
+        watcher_names: Names of the watchers to host
+
+    Returns:
+        Number of watchers that were hosted
+    """
+    import asyncio
+
+    from BaseWatcher import WatcherScheduler
+
+    scheduler = WatcherScheduler(logger=self.logger)
+
+    for watcher_name in watcher_names:
+        if watcher_name not in WATCHER_CLASSES:
+            self.logger.error(f"Unknown watcher: {watcher_name}")
+            continue
+
+        module_name, class_name = WATCHER_CLASSES[watcher_name]
+        try:
+            watcher_class = getattr(importlib.import_module(module_name), class_name)
+            watcher = watcher_class(vault_path=str(self.vault_path))
+        except Exception as e:
+            # Missing optional dependencies must not take down the other watchers
+            self.logger.error(f"Could not load {watcher_name} watcher: {e}")
+            continue
+
+        watcher.dry_run = self.dry_run
+        scheduler.add(watcher)
+        self.logger.info(f"Hosting {watcher_name} watcher in-process")
+
+    if not scheduler.watchers:
+        self.logger.error("No watchers could be loaded")
+        return 0
+
+    async def refresh_dashboard() -> None:
+        while True:
+            await asyncio.to_thread(self.update_dashboard)
+            await asyncio.sleep(DASHBOARD_INTERVAL)
+
+    async def host() -> None:
+        dashboard_task = asyncio.create_task(refresh_dashboard())
+        try:
+            await scheduler.run()
+        finally:
+            dashboard_task.cancel()
+
+    try:
+        asyncio.run(host())
+    except KeyboardInterrupt:
+        self.logger.info("Hosted watchers stopped by user")
+
+    return len(scheduler.watchers)
@@ -1,5 +1,4 @@
 import sys
-from rich import print
 
 def PrintStatus(self) -> None:
     """
@@ -59,6 +58,21 @@ def PrintStatus(self) -> None:
     else:
         print("  (none running)")
 
+    if status.get('metrics'):
+        print(f"\n{icons['chart']} Watcher Metrics:")
+        for watcher, snapshot in status['metrics'].items():
+            counters = snapshot.get('counters', {})
+            cycle = snapshot.get('histograms', {}).get('cycle_duration_seconds', {})
+            avg = cycle['sum'] / cycle['count'] if cycle.get('count') else 0.0
+            print(
+                f"  {watcher}: {counters.get('cycles', 0)} cycles "
+                f"(avg {avg:.2f}s, p95 <= {cycle.get('p95')}s), "
+                f"{counters.get('items_found', 0)} found, "
+                f"{counters.get('items_written', 0)} written, "
+                f"{counters.get('dedup_hits', 0)} dedup hits, "
+                f"{counters.get('errors', 0)} errors"
+            )
+
     print(f"\n{icons['server']} MCP Servers:")
     if status['mcp_servers']:
         for server, state in status['mcp_servers'].items():
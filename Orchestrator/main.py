@@ -6,6 +6,7 @@ and implements the Ralph Wiggum persistence loop for autonomous operation.
 
 Features:
 - Start/stop all watchers (Gmail, WhatsApp, Filesystem)
+- Host all watchers in a single supervised process
 - Start/stop MCP servers (Email, LinkedIn)
 - Trigger qwen code processing on demand
 - Ralph Wiggum loop for multi-step task completion
@@ -17,6 +18,9 @@ Usage:
     # Start all watchers
     uv run python scripts/Orchesterator/main.py start
 
+    # Run watchers in this process (one interpreter for the whole fleet)
+    uv run python scripts/Orchesterator/main.py host --watchers filesystem gmail whatsapp
+
     # Start MCP servers
     uv run python scripts/Orchesterator/main.py start-mcp
 
@@ -44,11 +48,10 @@ import subprocess
 import sys
 import time
 from datetime import datetime
+from importlib.util import find_spec
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from rich import print
-
 from .helpers import (
     EnsureDirectories,
     SetupLogging,
@@ -56,6 +59,7 @@ from .helpers import (
     FindQwenExecutable,
     UpdateDashboard,
     StartWatcher,
+    HostWatchers,
     StopWatcher,
     StartMcpServer,
     StopMcpServer,
@@ -74,6 +78,12 @@ from .helpers import (
 dry_run = os.getenv('DRY_RUN', 'false').lower() == 'true'
 
 
+def print(*args: Any, **kwargs: Any) -> None:
+    """Print with rich, imported on first use so --help and status stay fast."""
+    from rich import print as rich_print
+    rich_print(*args, **kwargs)
+
+
 class Orchestrator:
     """
     Main orchestrator for the Digital FTE system.
@@ -148,6 +158,9 @@ class Orchestrator:
     def stop_watcher(self, watcher_name: str) -> bool:
         return StopWatcher(self, watcher_name)
 
+    def host_watchers(self, watcher_names: List[str]) -> int:
+        return HostWatchers(self, watcher_names)
+
     def start_mcp_server(self, server_name: str) -> bool:
         return StartMcpServer(self, server_name)
 
@@ -169,10 +182,9 @@ class Orchestrator:
         self.start_watcher('filesystem')
 
         # Start WhatsApp watcher (if Playwright available)
-        try:
-            from playwright.sync_api import sync_playwright
+        if find_spec('playwright') is not None:
             self.start_watcher('whatsapp')
-        except ImportError:
+        else:
             self.logger.info("Playwright not available, skipping WhatsApp watcher")
 
         # Update dashboard
@@ -266,7 +278,7 @@ def main():
     parser.add_argument(
         'command',
         nargs='?',
-        choices=['start', 'stop', 'start-mcp', 'stop-mcp', 'process', 'process-approvals', 'ralph-loop', 'status'],
+        choices=['start', 'host', 'stop', 'start-mcp', 'stop-mcp', 'process', 'process-approvals', 'ralph-loop', 'status'],
         help='Command to run'
     )
     parser.add_argument(
@@ -325,6 +337,13 @@ def main():
             print("\n\n👋 Stopping watchers...")
             orchestrator.stop_all_watchers()
 
+    elif args.command == 'host':
+        print("🚀 Hosting Digital FTE watchers in one process...\n")
+        print(f"Watchers: {', '.join(args.watchers)}")
+        print("Press Ctrl+C to stop.\n")
+        if not orchestrator.host_watchers(args.watchers):
+            sys.exit(1)
+
     elif args.command == 'stop':
         print("🛑 Stopping Digital FTE...\n")
         orchestrator.stop_all_watchers()
@@ -1,7 +1,5 @@
 from .close_browser import CloseBrowser
-from .load_processed_messages import LoadProcessedMessages
 from .check_for_updates import CheckForUpdates, ExtractMessageData, IsBrowserAlive
-from .save_processed_messages import SaveProcessedMessages
 from .initialize_browser import InitializeBrowser
 from .create_action_file import CreateActionFile
 from .run_watcher import RunWatcher
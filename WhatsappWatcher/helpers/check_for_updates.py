@@ -1,6 +1,6 @@
 from typing import List, Dict, Any
 import time
-import datetime
+from datetime import datetime
 
 def CheckForUpdates(self) -> List[Dict[str, Any]]:
     """
@@ -53,6 +53,7 @@ def CheckForUpdates(self) -> List[Dict[str, Any]]:
 
             self.logger.info(f"Found {len(chat_items)} chat items in chat list")
 
+            unread = []
             for idx, chat in enumerate(chat_items[:50]):  # Limit to first 50 chats
                 try:
                     message_data = self._extract_message_data(chat)
@@ -69,34 +70,41 @@ def CheckForUpdates(self) -> List[Dict[str, Any]]:
                             self.logger.info(
                                 f"🔔 Unread message detected from '{message_data['chat_name']}'"
                             )
-
-                            # Check for keywords in the message
-                            message_lower = message_data['message_text'].lower()
-                            matched_keywords = [kw for kw in self.keywords if kw in message_lower]
-
-                            if matched_keywords:
-                                # Create unique message ID
-                                msg_id = f"{message_data['chat_name']}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-
-                                if msg_id not in self.processed_messages:
-                                    message_data['id'] = msg_id
-                                    message_data['matched_keywords'] = matched_keywords
-                                    message_data['timestamp'] = datetime.now().isoformat()
-                                    messages.append(message_data)
-
-                                    self.logger.info(
-                                        f"📩 MATCHING message from '{message_data['chat_name']}' " +
-                                        f"(keywords: {', '.join(matched_keywords)})"
-                                    )
-                            else:
-                                self.logger.debug(
-                                    f"  Unread but no keyword match. Keywords monitored: {self.keywords}"
-                                )
+                            unread.append(message_data)
 
                 except Exception as e:
                     self.logger.debug(f"Error processing chat {idx}: {e}")
                     continue
 
+            # Keyword match and priority for all unread chats in one classifier pass
+            results = self.keyword_classifier.classify_batch(
+                [message_data['message_text'] for message_data in unread]
+            )
+
+            for message_data, result in zip(unread, results):
+                matched_keywords = [term for term in result.matches if term in self.keyword_set]
+
+                if not matched_keywords:
+                    self.logger.debug(
+                        f"  Unread but no keyword match. Keywords monitored: {self.keywords}"
+                    )
+                    continue
+
+                # Create unique message ID
+                msg_id = f"{message_data['chat_name']}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+
+                if not self.is_processed(msg_id):
+                    message_data['id'] = msg_id
+                    message_data['matched_keywords'] = matched_keywords
+                    message_data['priority'] = result.priority
+                    message_data['timestamp'] = datetime.now().isoformat()
+                    messages.append(message_data)
+
+                    self.logger.info(
+                        f"📩 MATCHING message from '{message_data['chat_name']}' " +
+                        f"(keywords: {', '.join(matched_keywords)})"
+                    )
+
         except Exception as e:
             self.logger.debug(f"Error finding chat list: {e}")
 
@@ -109,6 +117,7 @@ def CheckForUpdates(self) -> List[Dict[str, Any]]:
         return messages
 
     except Exception as e:
+        self.metrics.inc('errors')
         self.logger.error(f"Error checking WhatsApp messages: {e}")
         # Don't close browser on error - just return empty and try again next cycle
         return []
@@ -18,7 +18,7 @@ def CreateActionFile(self, item: Dict[str, Any]) -> Optional[Path]:
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         filename = f"WHATSAPP_{chat_name}_{timestamp}.md"
 
-        priority = 'high' if 'urgent' in item['matched_keywords'] or 'asap' in item['matched_keywords'] else 'normal'
+        priority = item.get('priority') or self.get_priority(item['message_text'])
 
         content = f"""---
 type: whatsapp_message
@@ -84,8 +84,7 @@ _Write your reply here. Move to /Approved when ready to send._
             })
         else:
             filepath.write_text(content, encoding='utf-8')
-            self.processed_messages.add(item['id'])
-            self._save_processed_messages()
+            self.mark_processed(item['id'])
 
             self.logger.info(f"Created action file: {filepath}")
             self.log_action('whatsapp_action_created', {
@@ -98,5 +97,6 @@ _Write your reply here. Move to /Approved when ready to send._
         return filepath
 
     except Exception as e:
+        self.metrics.inc('errors')
         self.logger.error(f"Error creating action file: {e}")
         return None
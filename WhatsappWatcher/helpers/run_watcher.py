@@ -14,7 +14,7 @@ def RunWatcher(self) -> None:
     self.logger.info(f"Starting {self.__class__.__name__}")
     self.logger.info(f"Vault path: {self.vault_path}")
     self.logger.info(f"Session path: {self.session_path}")
-    self.logger.info(f"Check interval: {self.check_interval}s")
+    self.logger.info(f"Check interval: {self.poll_schedule.describe()}")
     self.logger.info(f"Dry run mode: {self.dry_run}")
     self.logger.info(f"Keywords: {self.keywords}")
     self.logger.info("=" * 60)
@@ -39,9 +39,11 @@ def RunWatcher(self) -> None:
             cycle_count += 1
             self.logger.debug(f"--- Check cycle {cycle_count} ---")
             
+            items = []
+            started = time.perf_counter()
             try:
                 # Check for new messages (no page reload - real-time updates)
-                items = self.check_for_updates()
+                items = list(self._apply_backpressure(self._timed_check() or []))
 
                 if items:
                     self.logger.info(f"📬 Found {len(items)} new message(s) matching keywords")
@@ -53,22 +55,25 @@ def RunWatcher(self) -> None:
                                 f"{item['message_text'][:50]}..."
                             )
                         else:
-                            filepath = self.create_action_file(item)
+                            filepath = self._write_action_file(item)
                             if filepath:
                                 self.logger.info(f"  ✅ Created: {filepath.name}")
                 else:
                     self.logger.debug("No new matching messages")
 
             except Exception as e:
+                self.metrics.inc('errors')
                 self.logger.error(f"Error in check cycle: {e}")
                 # Don't immediately reinitialize - wait for next cycle
                 # The check_for_updates will handle browser health checks
+            finally:
+                self._record_cycle(started)
             
             # Wait before next check
             if cycle_count % 10 == 0:
                 self.logger.info(f"Still monitoring... ({cycle_count} cycles completed)")
             
-            time.sleep(self.check_interval)
+            time.sleep(self.poll_schedule.next_delay(len(items)))
 
     except KeyboardInterrupt:
         self.logger.info(f"\n👋 {self.__class__.__name__} stopped by user")
@@ -19,14 +19,13 @@ Note: Be aware of WhatsApp's terms of service when using automation.
 
 import os
 import sys
+from importlib.util import find_spec
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 from .helpers import (
     CloseBrowser,
-    LoadProcessedMessages,
     CheckForUpdates,
-    SaveProcessedMessages,
-    # InitializeBrowser,
+    InitializeBrowser,
     CreateActionFile,
     RunWatcher,
     IsBrowserAlive,
@@ -47,12 +46,12 @@ dry_run = os.getenv('DRY_RUN', 'false').lower() == 'true'
 
 from BaseWatcher.base_watcher import BaseWatcher
 
-# Playwright imports
-try:
-    from playwright.sync_api import sync_playwright, BrowserContext, Page
-    PLAYWRIGHT_AVAILABLE = True
-except ImportError:
-    PLAYWRIGHT_AVAILABLE = False
+# Playwright (imported lazily when the browser starts)
+if TYPE_CHECKING:
+    from playwright.sync_api import BrowserContext, Page
+
+PLAYWRIGHT_AVAILABLE = find_spec('playwright') is not None
+if not PLAYWRIGHT_AVAILABLE:
     print("Playwright not installed. Install with: uv add playwright")
 
 
@@ -66,6 +65,9 @@ class WhatsAppWatcher(BaseWatcher):
         browser_context: Persistent browser context
     """
 
+    WATCHER_NAME = 'whatsapp'
+    LEGACY_PROCESSED_FILES = ['whatsapp_processed_messages.json']
+
     DEFAULT_KEYWORDS = ['urgent', 'asap', 'invoice', 'payment', 'help', 'important']
 
     def __init__(
@@ -73,7 +75,10 @@ class WhatsAppWatcher(BaseWatcher):
         vault_path: str,
         session_path: Optional[str] = None,
         check_interval: int = 30,
-        keywords: Optional[List[str]] = None
+        keywords: Optional[List[str]] = None,
+        min_interval: Optional[float] = None,
+        max_interval: Optional[float] = None,
+        adaptive: Optional[bool] = None
     ):
         """
         Initialize the WhatsApp watcher.
@@ -83,13 +88,16 @@ class WhatsAppWatcher(BaseWatcher):
             session_path: Path to browser session storage
             check_interval: Seconds between checks
             keywords: Keywords to monitor in messages
+            min_interval: Fastest adaptive polling interval
+            max_interval: Slowest adaptive polling interval
+            adaptive: Enable adaptive polling
         """
         if not PLAYWRIGHT_AVAILABLE:
             raise ImportError(
                 "Playwright not installed. Install with: uv add playwright"
             )
 
-        super().__init__(vault_path, check_interval)
+        super().__init__(vault_path, check_interval, min_interval, max_interval, adaptive)
 
         # Session path
         if session_path:
@@ -111,14 +119,14 @@ class WhatsAppWatcher(BaseWatcher):
 
         self.logger.info(f"Monitoring keywords: {self.keywords}")
 
+        # Shared priority rules plus the monitored keywords, matched in one pass
+        self.keyword_set = {k.strip().lower() for k in self.keywords}
+        self.keyword_classifier = self.classifier.with_terms(self.keywords)
+
         # Browser state
         self.playwright = None
-        self.browser_context: Optional[BrowserContext] = None
-        self.page: Optional[Page] = None
-
-        # Track processed messages
-        self.processed_messages: set = set()
-        self._load_processed_messages()
+        self.browser_context: Optional['BrowserContext'] = None
+        self.page: Optional['Page'] = None
 
     def _close_browser(self) -> None:
         return CloseBrowser(self)
@@ -127,14 +135,8 @@ class WhatsAppWatcher(BaseWatcher):
     def check_for_updates(self) -> List[Dict[str, Any]]:
         return CheckForUpdates(self)
 
-    def _load_processed_messages(self) -> None:
-        return LoadProcessedMessages(self)
-
-    def _save_processed_messages(self) -> None:
-       return SaveProcessedMessages(self)
-
-    # def _init_browser(self) -> bool:
-    #     return InitializeBrowser(self)
+    def _init_browser(self) -> bool:
+        return InitializeBrowser(self)
 
     def _is_browser_alive(self) -> bool:
         """Check if browser is still responsive."""
@@ -151,6 +153,15 @@ class WhatsAppWatcher(BaseWatcher):
     def create_action_file(self, item: Dict[str, Any]) -> Optional[Path]:
         return CreateActionFile(self, item)
 
+    def setup(self) -> None:
+        """Launch the browser once when hosted by a scheduler."""
+        if not self._init_browser():
+            raise RuntimeError("Failed to initialize WhatsApp Web browser")
+
+    def teardown(self) -> None:
+        """Close the browser when hosted by a scheduler."""
+        self._close_browser()
+
     def run(self) -> None:
         return RunWatcher(self)
 
@@ -178,6 +189,24 @@ def main():
         default=int(os.getenv('CHECK_INTERVAL', '30')),
         help='Check interval in seconds'
     )
+    parser.add_argument(
+        '--min-interval',
+        type=float,
+        default=None,
+        help='Fastest adaptive check interval in seconds (env: WHATSAPP_MIN_INTERVAL)'
+    )
+    parser.add_argument(
+        '--max-interval',
+        type=float,
+        default=None,
+        help='Slowest adaptive check interval in seconds (env: WHATSAPP_MAX_INTERVAL)'
+    )
+    parser.add_argument(
+        '--adaptive',
+        action='store_true',
+        default=None,
+        help='Poll faster while items arrive and back off when idle'
+    )
     parser.add_argument(
         '--keywords',
         type=str,
@@ -210,7 +239,10 @@ def main():
             vault_path=args.vault,
             session_path=args.session_path,
             check_interval=args.interval,
-            keywords=keywords
+            keywords=keywords,
+            min_interval=args.min_interval,
+            max_interval=args.max_interval,
+            adaptive=args.adaptive
         )
         watcher.run()
     except KeyboardInterrupt:
@@ -0,0 +1,475 @@
+"""
+Synthetic sources for the watcher benchmarks.
+
+- FakeGmailService: drop-in for the googleapiclient ``service`` object,
+  backed by an in-memory mailbox of N generated messages
+- generate_drop_folder: N files of configurable sizes for FilesystemWatcher
+- generate_whatsapp_snapshots: WhatsApp Web chat-list DOM snapshots, one
+  HTML file per cycle, loaded by Playwright from file://
+"""
+
+import html
+import os
+import random
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+# Words mixed into generated text so the priority classifier has work to do
+KEYWORDS = ['urgent', 'invoice', 'payment', 'asap', 'newsletter', 'deadline', 'help', 'offer']
+FILLER = (
+    'please review the attached notes before our call tomorrow and let me know '
+    'if anything needs to change in the plan for next quarter'
+).split()
+
+
+def synthetic_text(rng: random.Random, words: int = 24, keyword_ratio: float = 0.5) -> str:
+    """
+    Build a sentence of filler words, sometimes containing a keyword.
+
+    Args:
+        rng: Random source (seeded for reproducible runs)
+        words: Number of words
+        keyword_ratio: Probability that the text contains a keyword
+
+    Returns:
+        Generated text
+    """
+    parts = [rng.choice(FILLER) for _ in range(words)]
+    if rng.random() < keyword_ratio:
+        parts.insert(rng.randrange(len(parts)), rng.choice(KEYWORDS))
+    return ' '.join(parts)
+
+
+# ===========================================
+# Gmail
+# ===========================================
+
+class _Request:
+    """Mimics googleapiclient's HttpRequest: work happens on execute()."""
+
+    def __init__(self, service: 'FakeGmailService', handler, **kwargs: Any):
+        self._service = service
+        self._handler = handler
+        self._kwargs = kwargs
+
+    def execute(self) -> Dict[str, Any]:
+        self._service.api_calls += 1
+        if self._service.latency:
+            time.sleep(self._service.latency)
+        return self._handler(**self._kwargs)
+
+
+class FakeHttpError(Exception):
+    """Mimics googleapiclient's HttpError: the status is on .resp.status."""
+
+    def __init__(self, status: int, reason: str):
+        super().__init__(f'<HttpError {status}: {reason}>')
+        self.resp = type('Response', (), {'status': status})()
+
+
+class _BatchRequest:
+    """Mimics googleapiclient's BatchHttpRequest: one round trip for all calls."""
+
+    def __init__(self, service: 'FakeGmailService', callback=None):
+        self._service = service
+        self._callback = callback
+        self._calls: List[Any] = []
+
+    def add(self, request: _Request, callback=None, request_id: Optional[str] = None) -> None:
+        request_id = request_id or str(len(self._calls) + 1)
+        self._calls.append((request, callback or self._callback, request_id))
+
+    def execute(self) -> None:
+        self._service.api_calls += 1
+        if self._service.latency:
+            time.sleep(self._service.latency)
+        if len(self._calls) > 100:
+            raise FakeHttpError(400, 'Too many requests in batch.')
+        for request, callback, request_id in self._calls:
+            try:
+                response = request._handler(**request._kwargs)
+            except FakeHttpError as e:
+                callback(request_id, None, e)
+            else:
+                callback(request_id, response, None)
+
+
+class _Messages:
+    def __init__(self, service: 'FakeGmailService'):
+        self._service = service
+
+    def list(self, **kwargs: Any) -> _Request:
+        return _Request(self._service, self._service._list, **kwargs)
+
+    def get(self, **kwargs: Any) -> _Request:
+        return _Request(self._service, self._service._get, **kwargs)
+
+    def modify(self, **kwargs: Any) -> _Request:
+        return _Request(self._service, self._service._modify, **kwargs)
+
+
+class _History:
+    def __init__(self, service: 'FakeGmailService'):
+        self._service = service
+
+    def list(self, **kwargs: Any) -> _Request:
+        return _Request(self._service, self._service._history_list, **kwargs)
+
+
+class _Users:
+    def __init__(self, service: 'FakeGmailService'):
+        self._service = service
+
+    def messages(self) -> _Messages:
+        return _Messages(self._service)
+
+    def history(self) -> _History:
+        return _History(self._service)
+
+    def getProfile(self, **kwargs: Any) -> _Request:
+        return _Request(self._service, self._service._profile, **kwargs)
+
+
+def _top_level_fields(fields: str) -> List[str]:
+    """Top-level names of a fields= mask ('id,payload/headers(name)' -> id, payload)."""
+    names, depth, current = [], 0, ''
+    for char in fields + ',':
+        if char == ',' and depth == 0:
+            names.append(current.split('/')[0].strip())
+            current = ''
+            continue
+        depth += (char == '(') - (char == ')')
+        current += char
+    return names
+
+
+class FakeGmailService:
+    """
+    In-memory stand-in for ``build('gmail', 'v1', ...)``.
+
+    Supports users().messages().list/get/modify, users().history().list
+    and users().getProfile(), with pageToken paging, fields= masks on get
+    and new_batch_http_request(). Messages stay unread until modify()
+    removes the UNREAD label or the harness calls mark_read(); both, and
+    deliver(), are recorded as history.
+
+    Attributes:
+        messages: Message ID -> Gmail API message resource
+        unread: IDs still carrying the UNREAD label, in mailbox order
+        api_calls: Number of HTTP round trips (a batch request counts once)
+        latency: Simulated round-trip time per request in seconds
+        history_id: Current mailbox historyId
+    """
+
+    def __init__(self, count: int, seed: int = 0, latency: float = 0.0):
+        """
+        Generate a mailbox.
+
+        Args:
+            count: Number of unread messages
+            seed: Random seed for reproducible content
+            latency: Simulated round-trip time per request in seconds
+        """
+        self._rng = random.Random(seed)
+        self.messages: Dict[str, Dict[str, Any]] = {}
+        self.unread: List[str] = []
+        self.api_calls = 0
+        self.latency = latency
+
+        # History records after the oldest historyId still accepted
+        self.history_id = 1000
+        self._history: List[Dict[str, Any]] = []
+        self._history_floor = self.history_id
+        self._add_messages(count)
+
+        # Message ID -> remaining get() calls answered with 429
+        self._throttled: Dict[str, int] = {}
+
+    def users(self) -> _Users:
+        return _Users(self)
+
+    def new_batch_http_request(self, callback=None) -> _BatchRequest:
+        return _BatchRequest(self, callback)
+
+    def throttle(self, message_ids: Iterable[str], times: int = 1) -> None:
+        """
+        Answer the next get() calls for messages with 429 (rate limited).
+
+        Args:
+            message_ids: Messages to throttle
+            times: Number of calls per message to reject
+        """
+        for msg_id in message_ids:
+            self._throttled[msg_id] = times
+
+    def _add_messages(self, count: int) -> List[str]:
+        added = []
+        for i in range(len(self.messages), len(self.messages) + count):
+            msg_id = f'{i:016x}'
+            self.messages[msg_id] = {
+                'id': msg_id,
+                'threadId': msg_id,
+                'labelIds': ['UNREAD', 'IMPORTANT', 'INBOX'],
+                'snippet': synthetic_text(self._rng),
+                'payload': {'headers': [
+                    {'name': 'From', 'value': f'Sender {i % 97} <sender{i % 97}@example.com>'},
+                    {'name': 'To', 'value': 'me@example.com'},
+                    {'name': 'Subject', 'value': f'Message {i}: {synthetic_text(self._rng, words=6)}'},
+                    {'name': 'Date', 'value': 'Mon, 1 Jan 2024 09:00:00 +0000'},
+                ]},
+            }
+            added.append(msg_id)
+        self.unread.extend(added)
+        return added
+
+    def _record(self, kind: str, message_ids: Iterable[str]) -> None:
+        for msg_id in message_ids:
+            self.history_id += 1
+            message = self.messages[msg_id]
+            self._history.append({
+                'id': str(self.history_id),
+                kind: [{'message': {
+                    'id': msg_id,
+                    'threadId': message['threadId'],
+                    'labelIds': list(message['labelIds']),
+                }}],
+            })
+
+    def deliver(self, count: int) -> List[str]:
+        """
+        Add new unread messages, as if they had just arrived.
+
+        Args:
+            count: Number of messages
+
+        Returns:
+            IDs of the new messages
+        """
+        added = self._add_messages(count)
+        self._record('messagesAdded', added)
+        return added
+
+    def expire_history(self) -> None:
+        """Make every historyId handed out so far too old for history().list()."""
+        # The mailbox moves on, so the historyId handed out next is valid again
+        self.history_id += 1
+        self._history_floor = self.history_id
+        self._history = []
+
+    def mark_read(self, message_ids: Iterable[str]) -> None:
+        """
+        Remove the UNREAD label from messages (as a human triaging them would).
+
+        Args:
+            message_ids: Messages to mark read
+        """
+        done = [m for m in dict.fromkeys(message_ids) if 'UNREAD' in self.messages[m]['labelIds']]
+        removed = set(done)
+        self.unread = [m for m in self.unread if m not in removed]
+        for msg_id in done:
+            self.messages[msg_id]['labelIds'].remove('UNREAD')
+        self._record('labelsRemoved', done)
+
+    def _profile(self, userId: str, **_: Any) -> Dict[str, Any]:
+        return {
+            'emailAddress': 'me@example.com',
+            'messagesTotal': len(self.messages),
+            'historyId': str(self.history_id),
+        }
+
+    def _history_list(self, userId: str, startHistoryId: str, maxResults: int = 100,
+                      pageToken: Optional[str] = None, **_: Any) -> Dict[str, Any]:
+        if int(startHistoryId) < self._history_floor:
+            raise FakeHttpError(404, 'Requested entity was not found.')
+        records = [r for r in self._history if int(r['id']) > int(startHistoryId)]
+        start = int(pageToken) if pageToken else 0
+        result: Dict[str, Any] = {'historyId': str(self.history_id)}
+        if records[start:start + maxResults]:
+            result['history'] = records[start:start + maxResults]
+        if start + maxResults < len(records):
+            result['nextPageToken'] = str(start + maxResults)
+        return result
+
+    def _list(self, userId: str, q: str = '', maxResults: int = 100,
+              pageToken: Optional[str] = None, **_: Any) -> Dict[str, Any]:
+        ids = self.unread if 'is:unread' in q else list(self.messages)
+        start = int(pageToken) if pageToken else 0
+        page = ids[start:start + maxResults]
+        result: Dict[str, Any] = {
+            'messages': [{'id': m, 'threadId': m} for m in page],
+            'resultSizeEstimate': len(ids),
+        }
+        if start + maxResults < len(ids):
+            result['nextPageToken'] = str(start + maxResults)
+        return result
+
+    def _get(self, userId: str, id: str, format: str = 'full',
+             metadataHeaders: Optional[Sequence[str]] = None, fields: Optional[str] = None,
+             **_: Any) -> Dict[str, Any]:
+        if id not in self.messages:
+            raise FakeHttpError(404, 'Requested entity was not found.')
+        if self._throttled.get(id):
+            self._throttled[id] -= 1
+            raise FakeHttpError(429, 'Rate Limit Exceeded')
+        message = self.messages[id]
+        headers = message['payload']['headers']
+        if metadataHeaders:
+            headers = [h for h in headers if h['name'] in metadataHeaders]
+        message = {**message, 'payload': {'headers': headers}}
+        if fields:
+            message = {k: v for k, v in message.items() if k in _top_level_fields(fields)}
+        return message
+
+    def _modify(self, userId: str, id: str, body: Dict[str, Any], **_: Any) -> Dict[str, Any]:
+        if 'UNREAD' in body.get('removeLabelIds', []):
+            self.mark_read([id])
+        return self.messages[id]
+
+
+# ===========================================
+# Filesystem
+# ===========================================
+
+def parse_size(text: str) -> int:
+    """
+    Parse a size such as '512', '64k' or '10m' into bytes.
+
+    Args:
+        text: Size string
+
+    Returns:
+        Size in bytes
+    """
+    text = text.strip().lower()
+    units = {'k': 1024, 'm': 1024 ** 2, 'g': 1024 ** 3}
+    if text and text[-1] in units:
+        return int(float(text[:-1]) * units[text[-1]])
+    return int(text)
+
+
+def generate_drop_folder(folder: Path, count: int, sizes: Sequence[int], seed: int = 0) -> int:
+    """
+    Fill a drop folder with files of distinct content.
+
+    Sizes are used round-robin. Every file starts with a unique header,
+    so no two files share a hash.
+
+    Args:
+        folder: Drop folder to fill
+        count: Number of files
+        sizes: File sizes in bytes
+        seed: Random seed for reproducible content
+
+    Returns:
+        Total bytes written
+    """
+    rng = random.Random(seed)
+    extensions = ['.pdf', '.txt', '.csv', '.docx', '.png', '.zip']
+    folder.mkdir(parents=True, exist_ok=True)
+    block = rng.randbytes(64 * 1024)
+
+    total = 0
+    for i in range(count):
+        size = sizes[i % len(sizes)]
+        name = f'{rng.choice(KEYWORDS)}_{i:06d}{extensions[i % len(extensions)]}'
+        header = f'file {i}\n'.encode()
+        with open(folder / name, 'wb') as f:
+            f.write(header)
+            remaining = max(0, size - len(header))
+            while remaining > 0:
+                chunk = block[:remaining]
+                f.write(chunk)
+                remaining -= len(chunk)
+        total += max(size, len(header))
+    return total
+
+
+# ===========================================
+# WhatsApp
+# ===========================================
+
+_CHAT_TEMPLATE = """
+      <div role="listitem" aria-label="{name}, {unread_label}">
+        <span title="{name}">{name}</span>
+        <span>10:{minute:02d}</span>
+        <span data-testid="last-message" dir="auto">{text}</span>
+        {badge}
+      </div>"""
+
+_PAGE_TEMPLATE = """<!DOCTYPE html>
+<html>
+  <head><title>WhatsApp</title></head>
+  <body>
+    <div id="pane-side">
+      <div data-testid="chat-list" role="list" style="height: 600px; overflow-y: auto">{chats}
+      </div>
+    </div>
+  </body>
+</html>
+"""
+
+
+def generate_whatsapp_snapshots(
+    folder: Path,
+    count: int,
+    chats_per_page: int = 50,
+    unread_ratio: float = 0.8,
+    seed: int = 0
+) -> List[Path]:
+    """
+    Write WhatsApp Web chat-list snapshots using the selectors the watcher reads.
+
+    Each snapshot holds up to chats_per_page chats with unique names, so one
+    snapshot is one watcher cycle.
+
+    Args:
+        folder: Output folder
+        count: Total number of chats across all snapshots
+        chats_per_page: Chats per snapshot (the watcher reads at most 50)
+        unread_ratio: Fraction of chats with an unread badge
+        seed: Random seed for reproducible content
+
+    Returns:
+        Snapshot paths in cycle order
+    """
+    rng = random.Random(seed)
+    folder.mkdir(parents=True, exist_ok=True)
+
+    paths = []
+    for page_index, start in enumerate(range(0, count, chats_per_page)):
+        chats = []
+        for i in range(start, min(count, start + chats_per_page)):
+            unread = rng.random() < unread_ratio
+            chats.append(_CHAT_TEMPLATE.format(
+                name=f'Contact {i:06d}',
+                unread_label='1 unread message' if unread else 'read',
+                minute=i % 60,
+                text=html.escape(synthetic_text(rng, words=12, keyword_ratio=0.7)),
+                badge='<span aria-label="1 unread message" class="unread-badge">1</span>' if unread else '',
+            ))
+        path = folder / f'whatsapp_snapshot_{page_index:04d}.html'
+        path.write_text(_PAGE_TEMPLATE.format(chats=''.join(chats)), encoding='utf-8')
+        paths.append(path)
+    return paths
+
+
+def snapshot_paths(folder_or_file: str) -> List[Path]:
+    """
+    Resolve user-supplied snapshots (a saved .html file or a folder of them).
+
+    Args:
+        folder_or_file: Path to a snapshot or a folder of snapshots
+
+    Returns:
+        Sorted snapshot paths
+    """
+    path = Path(folder_or_file)
+    if path.is_dir():
+        return sorted(p for p in path.iterdir() if p.suffix.lower() in ('.html', '.htm'))
+    return [path] if path.exists() else []
+
+
+def file_url(path: Path) -> str:
+    """Get the file:// URL for a local path."""
+    return Path(os.path.abspath(path)).as_uri()
@@ -0,0 +1,166 @@
+"""
+Shared measurement helpers for the watcher benchmarks.
+"""
+
+import logging
+import math
+import resource
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+
+def percentile(values: Sequence[float], q: float) -> Optional[float]:
+    """
+    Nearest-rank percentile.
+
+    Args:
+        values: Observations
+        q: Percentile between 0 and 100
+
+    Returns:
+        The percentile, or None for no observations
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def latency_summary(seconds: Sequence[float]) -> Dict[str, Optional[float]]:
+    """
+    Summarise latencies in milliseconds.
+
+    Args:
+        seconds: Latencies in seconds
+
+    Returns:
+        Dictionary with count, mean, p50, p90, p99 and max (ms)
+    """
+    ms = [s * 1000 for s in seconds]
+
+    def rounded(value: Optional[float]) -> Optional[float]:
+        return round(value, 3) if value is not None else None
+
+    return {
+        'count': len(ms),
+        'mean_ms': rounded(sum(ms) / len(ms)) if ms else None,
+        'p50_ms': rounded(percentile(ms, 50)),
+        'p90_ms': rounded(percentile(ms, 90)),
+        'p99_ms': rounded(percentile(ms, 99)),
+        'max_ms': rounded(max(ms)) if ms else None,
+    }
+
+
+def peak_rss_mb() -> float:
+    """Get the peak resident set size of this process in MiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes
+    divisor = 1024 * 1024 if sys.platform == 'darwin' else 1024
+    return round(peak / divisor, 1)
+
+
+def quiet_watcher_logs(watcher: Any) -> None:
+    """Keep per-item INFO logging out of the measurements."""
+    watcher.logger.setLevel(logging.WARNING)
+
+
+class ItemTimer:
+    """
+    Wraps a watcher's create_action_file to time every item.
+
+    Attributes:
+        durations: Seconds spent per create_action_file call
+        items: Items passed to create_action_file
+    """
+
+    def __init__(self, watcher: Any):
+        """
+        Install the wrapper on a watcher instance.
+
+        Args:
+            watcher: Watcher whose create_action_file is timed
+        """
+        self.durations: List[float] = []
+        self.items: List[Any] = []
+        original: Callable[[Any], Any] = watcher.create_action_file
+
+        def timed(item: Any) -> Any:
+            started = time.perf_counter()
+            try:
+                return original(item)
+            finally:
+                self.durations.append(time.perf_counter() - started)
+                self.items.append(item)
+
+        watcher.create_action_file = timed
+
+
+def drive(watcher: Any, expected: int, max_cycles: int,
+          after_cycle: Optional[Callable[[], None]] = None) -> Dict[str, Any]:
+    """
+    Run watcher.run_once until expected items were found or progress stops.
+
+    Args:
+        watcher: Watcher under test
+        expected: Number of items the source holds
+        max_cycles: Safety limit on cycles
+        after_cycle: Called after every cycle (e.g. to advance a fake source)
+
+    Returns:
+        Dictionary with items found, cycles, wall time and per-cycle durations
+    """
+    found = 0
+    cycles: List[float] = []
+    started = time.perf_counter()
+
+    while found < expected and len(cycles) < max_cycles:
+        cycle_started = time.perf_counter()
+        count = watcher.run_once()
+        cycles.append(time.perf_counter() - cycle_started)
+        if after_cycle:
+            after_cycle()
+        if not count:
+            break
+        found += count
+
+    return {
+        'found': found,
+        'cycles': cycles,
+        'wall_seconds': time.perf_counter() - started,
+    }
+
+
+def report(name: str, params: Dict[str, Any], run: Dict[str, Any],
+           timer: ItemTimer, extra: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Build the JSON result for one scenario.
+
+    Args:
+        name: Scenario name
+        params: Scenario parameters
+        run: Result of drive()
+        timer: Per-item timings
+        extra: Scenario-specific figures
+
+    Returns:
+        JSON-serialisable result
+    """
+    wall = run['wall_seconds']
+    written = len(timer.durations)
+    result = {
+        'scenario': name,
+        'params': params,
+        'items_found': run['found'],
+        'items_written': written,
+        'cycles': len(run['cycles']),
+        'wall_seconds': round(wall, 4),
+        'items_per_sec': round(written / wall, 2) if wall > 0 else None,
+        'item_latency': latency_summary(timer.durations),
+        'cycle_latency': latency_summary(run['cycles']),
+        'peak_rss_mb': peak_rss_mb(),
+    }
+    if extra:
+        result.update(extra)
+    return result
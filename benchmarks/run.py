@@ -0,0 +1,160 @@
+"""
+Watcher Benchmarks for Digital FTE
+
+Measures watcher throughput without real Gmail, WhatsApp or a human
+dropping files. Each scenario drives the watcher's check_for_updates ->
+create_action_file path against a synthetic source in a fresh process
+(so peak RSS is per scenario) and the combined results are printed as
+JSON for comparing releases.
+
+Usage:
+    # All scenarios with defaults
+    uv run python -m benchmarks.run
+
+    # Bigger runs, saved for comparison
+    uv run python -m benchmarks.run --count 2000 --output bench_output.json
+
+    # Filesystem only, with large files
+    uv run python -m benchmarks.run filesystem --sizes 1m,16m --count 100
+
+    # Gmail with 40 ms simulated API round trips
+    uv run python -m benchmarks.run gmail --api-latency-ms 40
+
+    # WhatsApp against saved WhatsApp Web DOM snapshots
+    uv run python -m benchmarks.run whatsapp --snapshots ./snapshots
+
+Result fields:
+    items_per_sec, item_latency (create_action_file, ms percentiles),
+    cycle_latency (run_once, ms percentiles), peak_rss_mb, plus
+    scenario-specific figures (api_calls, mb_per_sec, idle_cycle_ms)
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict
+
+SCENARIOS = ['gmail', 'filesystem', 'whatsapp']
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def run_scenario(args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    Run one scenario in this process.
+
+    Args:
+        args: Parsed command line (args.scenarios holds exactly one name)
+
+    Returns:
+        Scenario result
+    """
+    from .scenarios import bench_filesystem, bench_gmail, bench_whatsapp
+
+    name = args.scenarios[0]
+    workdir = Path(args.workdir)
+    if name == 'gmail':
+        return bench_gmail(workdir, args.count, args.api_latency_ms, args.seed)
+    if name == 'filesystem':
+        return bench_filesystem(workdir, args.count, args.sizes, args.seed)
+    return bench_whatsapp(workdir, args.count, args.snapshots, args.seed)
+
+
+def spawn_scenario(name: str, args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    Run one scenario in a fresh interpreter with an isolated HOME and vault.
+
+    Args:
+        name: Scenario name
+        args: Parsed command line
+
+    Returns:
+        Scenario result (or an 'error' entry if the child failed)
+    """
+    with tempfile.TemporaryDirectory(prefix=f'fte_bench_{name}_') as workdir:
+        result_file = Path(workdir) / 'result.json'
+        cmd = [
+            sys.executable, '-m', 'benchmarks.run', name,
+            '--child', '--workdir', workdir, '--result-file', str(result_file),
+            '--count', str(args.count), '--seed', str(args.seed),
+            '--sizes', args.sizes, '--api-latency-ms', str(args.api_latency_ms),
+            '--snapshots', args.snapshots,
+        ]
+        env = {
+            **os.environ,
+            'HOME': workdir,
+            'DRY_RUN': 'false',
+            'METRICS_SNAPSHOT_INTERVAL': '0',
+        }
+        env.pop('METRICS_PORT', None)
+
+        proc = subprocess.run(cmd, cwd=REPO_ROOT, env=env, capture_output=True, text=True)
+        if proc.returncode != 0 or not result_file.exists():
+            return {'scenario': name, 'error': (proc.stderr or proc.stdout).strip().splitlines()[-20:]}
+        return json.loads(result_file.read_text(encoding='utf-8'))
+
+
+def main():
+    """Main entry point for the benchmark runner."""
+    parser = argparse.ArgumentParser(description='Digital FTE watcher benchmarks')
+    parser.add_argument(
+        'scenarios',
+        nargs='*',
+        default=[],
+        help=f'Scenarios to run (default: all of {", ".join(SCENARIOS)})'
+    )
+    parser.add_argument('--count', type=int, default=500, help='Items per scenario')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed for synthetic content')
+    parser.add_argument(
+        '--sizes',
+        default='4k,64k,1m',
+        help='Filesystem: comma-separated file sizes, used round-robin'
+    )
+    parser.add_argument(
+        '--api-latency-ms',
+        type=float,
+        default=0.0,
+        help='Gmail: simulated round-trip time per API request'
+    )
+    parser.add_argument(
+        '--snapshots',
+        default='',
+        help='WhatsApp: saved DOM snapshot (.html) or folder of snapshots'
+    )
+    parser.add_argument('--output', help='Also write the JSON results to this file')
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--workdir', help=argparse.SUPPRESS)
+    parser.add_argument('--result-file', help=argparse.SUPPRESS)
+
+    args = parser.parse_args()
+
+    unknown = [name for name in args.scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)} (choose from {', '.join(SCENARIOS)})")
+
+    if args.child:
+        result = run_scenario(args)
+        Path(args.result_file).write_text(json.dumps(result), encoding='utf-8')
+        return
+
+    results = {
+        'timestamp': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': [spawn_scenario(name, args) for name in (args.scenarios or SCENARIOS)],
+    }
+
+    output = json.dumps(results, indent=2)
+    print(output)
+    if args.output:
+        Path(args.output).write_text(output + '\n', encoding='utf-8')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""
+Benchmark scenarios: one function per watcher.
+
+Each scenario builds a throwaway vault under workdir, points a real
+watcher at a synthetic source, drives check_for_updates ->
+create_action_file through run_once and returns a JSON-serialisable
+result (see harness.report).
+"""
+
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+from .fakes import (
+    FakeGmailService,
+    file_url,
+    generate_drop_folder,
+    generate_whatsapp_snapshots,
+    parse_size,
+    snapshot_paths,
+)
+from .harness import ItemTimer, drive, quiet_watcher_logs, report
+
+
+def bench_gmail(workdir: Path, count: int, api_latency_ms: float = 0.0, seed: int = 0) -> Dict[str, Any]:
+    """
+    Drive GmailWatcher against a stubbed Gmail service holding count messages.
+
+    The watcher never marks messages read, so after every cycle the
+    harness marks the processed messages read, as a human triaging the
+    inbox would; otherwise the unread window would never advance.
+
+    Args:
+        workdir: Scratch directory
+        count: Number of unread messages
+        api_latency_ms: Simulated round-trip time per API request
+        seed: Random seed
+
+    Returns:
+        Scenario result
+    """
+    import GmailWatcher.main as gmail_main
+
+    # The stub replaces the Google client entirely
+    gmail_main.GMAIL_AVAILABLE = True
+
+    service = FakeGmailService(count, seed=seed, latency=api_latency_ms / 1000)
+    watcher = gmail_main.GmailWatcher(
+        vault_path=str(workdir / 'vault'),
+        credentials_path=str(workdir / 'credentials.json'),
+        token_path=str(workdir / 'token.json'),
+    )
+    watcher.service = service
+    quiet_watcher_logs(watcher)
+    timer = ItemTimer(watcher)
+
+    def triage() -> None:
+        service.mark_read(item['id'] for item in timer.items)
+
+    run = drive(watcher, count, max_cycles=count + 10, after_cycle=triage)
+    params = {'count': count, 'api_latency_ms': api_latency_ms, 'seed': seed}
+    return report('gmail', params, run, timer, {'api_calls': service.api_calls})
+
+
+def bench_filesystem(workdir: Path, count: int, sizes: str = '4k,64k,1m', seed: int = 0) -> Dict[str, Any]:
+    """
+    Drive FilesystemWatcher (polling mode) over a generated drop folder.
+
+    After all files are ingested one more cycle is timed, showing the
+    steady-state cost of re-scanning a drop folder with nothing new.
+
+    Args:
+        workdir: Scratch directory
+        count: Number of files
+        sizes: Comma-separated file sizes, used round-robin (e.g. '4k,1m')
+        seed: Random seed
+
+    Returns:
+        Scenario result
+    """
+    from FilesystemWatcher.main import FilesystemWatcher
+
+    drop = workdir / 'drop'
+    size_list = [parse_size(s) for s in sizes.split(',') if s.strip()]
+    total_bytes = generate_drop_folder(drop, count, size_list, seed=seed)
+
+    watcher = FilesystemWatcher(
+        vault_path=str(workdir / 'vault'),
+        drop_folder=str(drop),
+        use_watchdog=False,
+    )
+    # Generated files are complete; don't wait out the settle window
+    watcher.snapshot.settle_seconds = 0
+    quiet_watcher_logs(watcher)
+    timer = ItemTimer(watcher)
+
+    run = drive(watcher, count, max_cycles=10)
+
+    idle_started = time.perf_counter()
+    watcher.run_once()
+    idle_ms = (time.perf_counter() - idle_started) * 1000
+
+    wall = run['wall_seconds']
+    params = {'count': count, 'sizes': sizes, 'seed': seed}
+    return report('filesystem', params, run, timer, {
+        'input_bytes': total_bytes,
+        'mb_per_sec': round(total_bytes / wall / 1024 ** 2, 2) if wall > 0 else None,
+        'idle_cycle_ms': round(idle_ms, 3),
+    })
+
+
+def bench_whatsapp(workdir: Path, count: int, snapshots: str = '', seed: int = 0) -> Dict[str, Any]:
+    """
+    Drive WhatsAppWatcher against chat-list snapshots loaded from file://.
+
+    Each cycle loads the next snapshot into a headless Chromium page, so
+    nothing talks to web.whatsapp.com. Saved real DOM snapshots can be
+    passed instead of generated ones.
+
+    Args:
+        workdir: Scratch directory
+        count: Number of chats to generate (ignored with snapshots)
+        snapshots: Saved snapshot file or folder (default: generate)
+        seed: Random seed
+
+    Returns:
+        Scenario result (or a 'skipped' reason without Playwright)
+    """
+    from importlib.util import find_spec
+
+    if find_spec('playwright') is None:
+        return {'scenario': 'whatsapp', 'skipped': 'playwright not installed'}
+
+    from playwright.sync_api import sync_playwright
+    from WhatsappWatcher.main import WhatsAppWatcher
+
+    if snapshots:
+        pages = snapshot_paths(snapshots)
+    else:
+        pages = generate_whatsapp_snapshots(workdir / 'snapshots', count, seed=seed)
+    if not pages:
+        return {'scenario': 'whatsapp', 'skipped': f'no snapshots found at {snapshots}'}
+
+    watcher = WhatsAppWatcher(
+        vault_path=str(workdir / 'vault'),
+        session_path=str(workdir / 'session'),
+    )
+    quiet_watcher_logs(watcher)
+    timer = ItemTimer(watcher)
+
+    playwright = sync_playwright().start()
+    browser = playwright.chromium.launch(headless=True)
+    try:
+        watcher.playwright = playwright
+        watcher.browser_context = browser.new_context()
+        watcher.page = watcher.browser_context.new_page()
+
+        remaining = list(pages)
+
+        def next_snapshot() -> None:
+            if remaining:
+                watcher.page.goto(file_url(remaining.pop(0)))
+
+        next_snapshot()
+        run = drive(watcher, expected=10 ** 9, max_cycles=len(pages), after_cycle=next_snapshot)
+    finally:
+        watcher.browser_context = None
+        watcher.playwright = None
+        browser.close()
+        playwright.stop()
+
+    params = {'count': count, 'snapshots': snapshots or 'generated', 'seed': seed}
+    return report('whatsapp', params, run, timer, {'snapshot_pages': len(pages)})
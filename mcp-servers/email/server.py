@@ -18,6 +18,7 @@ Environment Variables:
 """
 
 import os
+import sys
 import base64
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
@@ -26,12 +27,12 @@ from typing import Optional, List, Dict, Any
 
 from fastmcp import FastMCP
 
-# Gmail API imports
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
+# Shared Gmail data access (batched metadata fetches) lives in GmailWatcher
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from GmailWatcher.gmail_api import fetch_metadata, headers_of, iter_message_pages
+
+# Gmail API libraries are imported lazily (see authenticate_gmail and
+# _http_error) so starting the server and dry-run calls stay cheap
 # from config import dry_run
 import os
 dry_run = os.getenv('DRY_RUN', 'false').lower() == 'true'
@@ -76,6 +77,15 @@ def authenticate_gmail() -> Optional[Any]:
     
     if _gmail_service is not None:
         return _gmail_service
+
+    try:
+        from google.oauth2.credentials import Credentials
+        from google_auth_oauthlib.flow import InstalledAppFlow
+        from google.auth.transport.requests import Request
+        from googleapiclient.discovery import build
+    except ImportError as e:
+        print(f"Gmail API libraries not installed: {e}")
+        return None
     
     creds_path, token_path = get_credentials_path()
     SCOPES = ['https://www.googleapis.com/auth/gmail.send', 'https://www.googleapis.com/auth/gmail.readonly', 'https://www.googleapis.com/auth/gmail.modify']
@@ -126,6 +136,23 @@ def authenticate_gmail() -> Optional[Any]:
         return None
 
 
+def _http_error() -> Any:
+    """
+    Get googleapiclient's HttpError for use in except clauses.
+
+    Only evaluated once an exception is being handled, so the client
+    library is never imported on the happy path of dry-run calls.
+
+    Returns:
+        The HttpError class, or an empty tuple (matches nothing) if unavailable
+    """
+    try:
+        from googleapiclient.errors import HttpError
+        return HttpError
+    except ImportError:
+        return ()
+
+
 # ===========================================
 # MCP Tools
 # ===========================================
@@ -209,7 +236,7 @@ def send_email(
             'thread_id': sent_message['threadId']
         }
         
-    except HttpError as error:
+    except _http_error() as error:
         return {
             'status': 'error',
             'message': f'Gmail API error: {error}',
@@ -286,7 +313,7 @@ def draft_email(
             'action': 'draft_created_awaiting_review'
         }
         
-    except HttpError as error:
+    except _http_error() as error:
         return {
             'status': 'error',
             'message': f'Gmail API error: {error}',
@@ -324,16 +351,14 @@ def search_emails(
         }
     
     try:
-        # Search
-        results = service.users().messages().list(
-            userId='me',
-            q=query,
-            maxResults=max_results
-        ).execute()
+        # Search (following nextPageToken up to max_results)
+        message_ids = [
+            msg_id
+            for page, _ in iter_message_pages(service, query, limit=max_results)
+            for msg_id in page
+        ]
         
-        messages = results.get('messages', [])
-        
-        if not messages:
+        if not message_ids:
             return {
                 'status': 'success',
                 'count': 0,
@@ -341,20 +366,13 @@ def search_emails(
                 'message': 'No emails found'
             }
         
-        # Fetch details for each message
+        # Fetch details for all messages in batch requests
         emails = []
-        for msg in messages:
-            full_msg = service.users().messages().get(
-                userId='me',
-                id=msg['id'],
-                format='metadata',
-                metadataHeaders=['From', 'To', 'Subject', 'Date']
-            ).execute()
-            
-            headers = {h['name']: h['value'] for h in full_msg['payload']['headers']}
-            
+        for full_msg in fetch_metadata(service, message_ids):
+            headers = headers_of(full_msg)
+
             emails.append({
-                'id': msg['id'],
+                'id': full_msg['id'],
                 'thread_id': full_msg['threadId'],
                 'from': headers.get('From', ''),
                 'to': headers.get('To', ''),
@@ -369,7 +387,7 @@ def search_emails(
             'emails': emails
         }
         
-    except HttpError as error:
+    except _http_error() as error:
         return {
             'status': 'error',
             'message': f'Gmail API error: {error}',
@@ -450,7 +468,7 @@ def get_email_content(
             'attachments': attachments
         }
         
-    except HttpError as error:
+    except _http_error() as error:
         return {
             'status': 'error',
             'message': f'Gmail API error: {error}',
@@ -495,7 +513,7 @@ def mark_as_read(message_id: str) -> Dict[str, Any]:
             'message': f'Message {message_id} marked as read'
         }
         
-    except HttpError as error:
+    except _http_error() as error:
         return {
             'status': 'error',
             'message': f'Gmail API error: {error}',
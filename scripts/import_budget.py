@@ -0,0 +1,155 @@
+"""
+Import-Time Budget Check for Digital FTE
+
+Imports each entry point in a fresh interpreter with `python -X importtime`
+and fails when its cold import cost exceeds the budget, or when it pulls
+in a heavy optional stack (Google client, Playwright, rich) that should
+only be loaded lazily.
+
+Usage:
+    # Check all entry points (exit code 1 on any regression)
+    uv run python scripts/import_budget.py
+
+    # Show the slowest modules for each entry point
+    uv run python scripts/import_budget.py --top 10
+
+    # Loosen every budget on a slow machine
+    uv run python scripts/import_budget.py --scale 2
+
+Environment Variables:
+    IMPORT_BUDGET_SCALE: Multiplier applied to every budget (default: 1.0)
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Set, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Entry point -> (import statement, budget in ms, modules that must stay unloaded)
+ENTRY_POINTS: Dict[str, Tuple[str, float, List[str]]] = {
+    'Orchestrator.main': (
+        'import Orchestrator.main',
+        75.0,
+        ['rich', 'playwright', 'googleapiclient', 'BaseWatcher'],
+    ),
+    'FilesystemWatcher.main': (
+        'import FilesystemWatcher.main',
+        120.0,
+        ['playwright', 'googleapiclient'],
+    ),
+    'GmailWatcher.main': (
+        'import GmailWatcher.main',
+        100.0,
+        ['googleapiclient', 'google_auth_oauthlib', 'google.oauth2'],
+    ),
+    'WhatsappWatcher.main': (
+        'import WhatsappWatcher.main',
+        100.0,
+        ['playwright'],
+    ),
+    'mcp-servers/email/server.py': (
+        'import runpy; runpy.run_path("mcp-servers/email/server.py", run_name="email_server")',
+        1500.0,
+        ['googleapiclient', 'google_auth_oauthlib', 'google.oauth2'],
+    ),
+}
+
+# "import time: self [us] | cumulative | imported package"
+_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)')
+
+
+def measure(statement: str, baseline: Set[str] = frozenset()) -> Tuple[float, List[Tuple[float, str]], str]:
+    """
+    Import an entry point in a fresh interpreter and total its import time.
+
+    Args:
+        statement: Python code performing the import
+        baseline: Modules the bare interpreter loads anyway (not counted)
+
+    Returns:
+        (total milliseconds, [(self ms, module)], error output if it failed)
+    """
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        env={**os.environ, 'PYTHONDONTWRITEBYTECODE': '1'},
+    )
+
+    modules = []
+    other = []
+    for line in proc.stderr.splitlines():
+        match = _LINE.match(line)
+        if match and match.group(4) not in baseline:
+            modules.append((int(match.group(1)) / 1000, match.group(4)))
+        elif not line.startswith('import time:'):
+            other.append(line)
+
+    error = '\n'.join(other) if proc.returncode else ''
+    return sum(ms for ms, _ in modules), modules, error
+
+
+def check(scale: float, top: int) -> bool:
+    """
+    Check every entry point against its budget.
+
+    Args:
+        scale: Multiplier applied to every budget
+        top: Number of slowest modules to print per entry point
+
+    Returns:
+        True if every entry point is within budget
+    """
+    ok = True
+    _, startup, _ = measure('pass')
+    baseline = {module for _, module in startup}
+
+    for name, (statement, budget, forbidden) in ENTRY_POINTS.items():
+        total, modules, error = measure(statement, baseline)
+        if error:
+            print(f"SKIP {name}: import failed\n  {error.splitlines()[-1]}")
+            continue
+
+        loaded = {module for _, module in modules}
+        leaked = [m for m in forbidden if m in loaded]
+        limit = budget * scale
+        passed = total <= limit and not leaked
+        ok = ok and passed
+
+        print(f"{'PASS' if passed else 'FAIL'} {name}: {total:.1f} ms (budget {limit:.0f} ms)")
+        if leaked:
+            print(f"  eagerly imports: {', '.join(leaked)}")
+        for ms, module in sorted(modules, reverse=True)[:top]:
+            print(f"  {ms:8.1f} ms  {module}")
+
+    return ok
+
+
+def main():
+    """Main entry point for the import budget check."""
+    parser = argparse.ArgumentParser(description='Check cold import time of Digital FTE entry points')
+    parser.add_argument(
+        '--scale',
+        type=float,
+        default=float(os.getenv('IMPORT_BUDGET_SCALE', '1.0')),
+        help='Multiplier applied to every budget'
+    )
+    parser.add_argument(
+        '--top',
+        type=int,
+        default=0,
+        help='Show the N slowest modules per entry point'
+    )
+
+    args = parser.parse_args()
+    sys.exit(0 if check(args.scale, args.top) else 1)
+
+
+if __name__ == "__main__":
+    main()
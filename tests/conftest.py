@@ -0,0 +1,61 @@
+"""Shared fixtures for the watcher tests."""
+
+import logging
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture
+def quiet():
+    """Silence a watcher's console logging."""
+    def silence(watcher):
+        watcher.logger.setLevel(logging.ERROR)
+        return watcher
+    return silence
+
+
+@pytest.fixture
+def make_fs_watcher(tmp_path: Path, quiet):
+    """Build polling FilesystemWatchers over tmp_path/drop (closed after the test)."""
+    from FilesystemWatcher.main import FilesystemWatcher
+
+    watchers = []
+
+    def make(**kwargs):
+        watcher = FilesystemWatcher(
+            vault_path=str(tmp_path / 'vault'),
+            drop_folder=str(tmp_path / 'drop'),
+            use_watchdog=False,
+            **kwargs
+        )
+        # Test files are complete when written
+        watcher.snapshot.settle_seconds = 0
+        watchers.append(watcher)
+        return quiet(watcher)
+
+    yield make
+    for watcher in watchers:
+        watcher.extractors.close()
+
+
+@pytest.fixture
+def make_gmail_watcher(tmp_path: Path, monkeypatch, quiet):
+    """Build GmailWatchers on a shared vault, talking to a FakeGmailService."""
+    import GmailWatcher.main as gmail_main
+
+    # The fake replaces the Google client entirely
+    monkeypatch.setattr(gmail_main, 'GMAIL_AVAILABLE', True)
+
+    def make(service, **attributes):
+        watcher = gmail_main.GmailWatcher(
+            vault_path=str(tmp_path / 'vault'),
+            credentials_path=str(tmp_path / 'credentials.json'),
+            token_path=str(tmp_path / 'token.json'),
+        )
+        watcher.service = service
+        for name, value in attributes.items():
+            setattr(watcher, name, value)
+        return quiet(watcher)
+
+    return make
@@ -0,0 +1,17 @@
+"""Extractor plugin used by the extractor pool tests (importable by the workers)."""
+
+import time
+
+from FilesystemWatcher.extractors import register
+
+
+@register('application/x-test-slow', timeout=0.5)
+def slow(path):
+    time.sleep(30)
+    return {'done': True}
+
+
+@register('application/x-test-size')
+def size(path):
+    with open(path, 'rb') as f:
+        return {'bytes': len(f.read())}
@@ -0,0 +1,62 @@
+"""Archive introspection tests."""
+
+import io
+import tarfile
+import zipfile
+
+from FilesystemWatcher.extractors.archives import tar_listing, zip_listing
+
+
+def make_zip(path, members):
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+    return str(path)
+
+
+def test_an_honest_zip_is_listed_without_flags(tmp_path):
+    facts = zip_listing(make_zip(tmp_path / 'ok.zip', {'a.csv': 'x,y\n1,2\n', 'docs/b.txt': 'hello\n'}))
+
+    assert facts['members'] == 2 and facts['directories'] == 0
+    assert facts['extensions'] == {'.csv': 1, '.txt': 1}
+    assert 'suspicious' not in facts
+
+
+def test_decompression_bombs_and_escaping_paths_are_flagged(tmp_path):
+    bomb = zip_listing(make_zip(tmp_path / 'bomb.zip', {'zeros.bin': b'\0' * (20 * 1024 * 1024)}))
+    assert bomb['compression_ratio'] > 100
+    assert any(flag.startswith('compression ratio') for flag in bomb['suspicious'])
+
+    escaping = zip_listing(make_zip(tmp_path / 'slip.zip', {'../../etc/cron.d/job': 'x\n'}))
+    assert escaping['suspicious'] == ['1 member path(s) outside the archive root']
+
+
+def test_tar_links_outside_the_archive_are_flagged(tmp_path):
+    path = tmp_path / 'links.tar.gz'
+    with tarfile.open(path, 'w:gz') as archive:
+        data = b'report\n'
+        info = tarfile.TarInfo('report.txt')
+        info.size = len(data)
+        archive.addfile(info, io.BytesIO(data))
+        link = tarfile.TarInfo('passwd')
+        link.type = tarfile.SYMTYPE
+        link.linkname = '/etc/passwd'
+        archive.addfile(link)
+
+    facts = tar_listing(str(path))
+    assert facts['members'] == 1
+    assert facts['suspicious'] == ['passwd: link outside the archive root']
+
+
+def test_members_of_a_suspicious_archive_are_not_ingested(tmp_path, monkeypatch, make_fs_watcher):
+    monkeypatch.setenv('FILESYSTEM_ARCHIVE_EXTRACT', '.txt')
+    drop = tmp_path / 'drop'
+    drop.mkdir()
+    make_zip(drop / 'bomb.zip', {'notes.txt': 'hi\n', 'zeros.txt': '\0' * (20 * 1024 * 1024)})
+
+    watcher = make_fs_watcher()
+    assert watcher.run_once() == 1
+
+    actions = list(watcher.needs_action.glob('*.md'))
+    assert len(actions) == 1
+    assert 'suspicious' in actions[0].read_text(encoding='utf-8')
@@ -0,0 +1,48 @@
+"""Audit and watcher log routing tests."""
+
+import json
+import time
+
+from BaseWatcher.audit_log import vault_logger
+
+
+def read_when_written(folder, pattern, expected, timeout=5.0):
+    """Read every matching file once the background writer has written expected."""
+    deadline = time.monotonic() + timeout
+    while True:
+        text = ''.join(path.read_text(encoding='utf-8') for path in sorted(folder.glob(pattern)))
+        if expected in text or time.monotonic() >= deadline:
+            return text
+        time.sleep(0.02)
+
+
+def test_same_watcher_class_logs_to_each_vault(tmp_path, make_fs_watcher):
+    from FilesystemWatcher.main import FilesystemWatcher
+
+    first = make_fs_watcher()
+    second = FilesystemWatcher(
+        vault_path=str(tmp_path / 'other_vault'), drop_folder=str(tmp_path / 'other_drop'), use_watchdog=False
+    )
+    try:
+        first.log_action('first_vault_action', {'n': 1})
+        second.log_action('second_vault_action', {'n': 2})
+        second.logger.error('second vault only')
+    finally:
+        second.extractors.close()
+
+    first_audit = read_when_written(first.logs, 'audit-*.jsonl', 'first_vault_action')
+    second_audit = read_when_written(second.logs, 'audit-*.jsonl', 'second_vault_action')
+    assert [json.loads(line)['action_type'] for line in first_audit.splitlines()] == ['first_vault_action']
+    assert [json.loads(line)['action_type'] for line in second_audit.splitlines()] == ['second_vault_action']
+
+    assert 'second vault only' in read_when_written(second.logs, 'watcher_*.log', 'second vault only')
+    assert 'second vault only' not in ''.join(p.read_text() for p in first.logs.glob('watcher_*.log'))
+
+
+def test_vault_loggers_report_under_the_class_name(tmp_path, caplog):
+    logger = vault_logger('SomeWatcher', tmp_path)
+    assert logger is vault_logger('SomeWatcher', tmp_path)
+    assert logger is not vault_logger('SomeWatcher', tmp_path / 'elsewhere')
+
+    logger.warning('hello')
+    assert [(r.name, r.getMessage()) for r in caplog.records] == [('SomeWatcher', 'hello')]
@@ -0,0 +1,62 @@
+"""Needs_Action backpressure tests."""
+
+import pytest
+
+from benchmarks.fakes import FakeGmailService
+from tests.test_gmail_sync import action_ids
+
+
+class Killed(BaseException):
+    """Stands in for the process being killed mid-cycle."""
+
+
+def test_cursor_never_runs_ahead_of_written_action_files(make_gmail_watcher, monkeypatch):
+    monkeypatch.setenv('GMAIL_BACKLOG_THRESHOLD', '1000')
+    service = FakeGmailService(250)
+
+    watcher = make_gmail_watcher(service, max_per_cycle=0)
+    create_action_file = watcher.create_action_file
+    written = []
+
+    def die_after_150(item):
+        if len(written) == 150:
+            raise Killed()
+        written.append(item['id'])
+        return create_action_file(item)
+
+    monkeypatch.setattr(watcher, 'create_action_file', die_after_150)
+    with pytest.raises(Killed):
+        watcher.run_once()
+    assert len(action_ids(watcher)) == 150
+
+    restarted = make_gmail_watcher(service, max_per_cycle=0)
+    assert restarted.run_once() == 100
+    assert action_ids(restarted) == set(service.messages)
+
+
+def test_deferred_items_are_released_once_the_backlog_recovers(make_gmail_watcher, monkeypatch):
+    monkeypatch.setenv('GMAIL_BACKLOG_THRESHOLD', '2')
+    monkeypatch.setenv('BACKLOG_ADMIT_PRIORITIES', 'critical')
+    service = FakeGmailService(5)
+
+    watcher = make_gmail_watcher(service)
+    backlog = [watcher.needs_action / f'PENDING_{i}.md' for i in range(2)]
+    for path in backlog:
+        path.write_text('pending\n', encoding='utf-8')
+
+    watcher.run_once()
+    assert watcher.poll_schedule.throttled
+    held = len(watcher.holding)
+    assert held > 0 and held + len(action_ids(watcher)) == 5
+
+    # A human works through /Needs_Action; held messages come out in order
+    for _ in range(5):
+        for path in backlog + list(watcher.needs_action.glob('EMAIL_*.md')):
+            path.unlink(missing_ok=True)
+        backlog = []
+        watcher.run_once()
+        if not len(watcher.holding):
+            break
+
+    assert not len(watcher.holding) and not watcher.poll_schedule.throttled
+    assert all(watcher.processed_store.seen(msg_id) for msg_id in service.messages)
@@ -0,0 +1,56 @@
+"""Synthetic source tests for the benchmark harness."""
+
+import hashlib
+
+import pytest
+
+from benchmarks.fakes import FakeGmailService, FakeHttpError, generate_drop_folder, parse_size
+
+
+def test_history_replays_deliveries_and_reads():
+    service = FakeGmailService(3)
+    start = service.users().getProfile(userId='me').execute()['historyId']
+
+    added = service.deliver(2)
+    service.mark_read(added[:1])
+    history = service.users().history().list(userId='me', startHistoryId=start).execute()
+
+    kinds = [next(k for k in record if k != 'id') for record in history['history']]
+    assert kinds == ['messagesAdded', 'messagesAdded', 'labelsRemoved']
+    assert history['historyId'] == str(service.history_id)
+    assert service.unread[-1] == added[1] and len(service.unread) == 4
+
+
+def test_expired_history_is_rejected_until_a_fresh_id_is_read():
+    service = FakeGmailService(1)
+    old = service.users().getProfile(userId='me').execute()['historyId']
+    service.expire_history()
+
+    with pytest.raises(FakeHttpError) as raised:
+        service.users().history().list(userId='me', startHistoryId=old).execute()
+    assert raised.value.resp.status == 404
+
+    fresh = service.users().getProfile(userId='me').execute()['historyId']
+    assert service.users().history().list(userId='me', startHistoryId=fresh).execute() == {'historyId': fresh}
+
+
+def test_list_pages_and_counts_round_trips():
+    service = FakeGmailService(7)
+    first = service.users().messages().list(userId='me', q='is:unread', maxResults=5).execute()
+    rest = service.users().messages().list(
+        userId='me', q='is:unread', maxResults=5, pageToken=first['nextPageToken']
+    ).execute()
+
+    ids = [m['id'] for m in first['messages'] + rest['messages']]
+    assert ids == service.unread and 'nextPageToken' not in rest
+    assert service.api_calls == 2
+
+
+def test_drop_folder_files_have_distinct_content(tmp_path):
+    total = generate_drop_folder(tmp_path, 6, [parse_size('1k'), 10])
+    files = sorted(tmp_path.iterdir())
+
+    assert len(files) == 6
+    assert total == sum(p.stat().st_size for p in files)
+    assert len({hashlib.sha256(p.read_bytes()).hexdigest() for p in files}) == 6
+    assert parse_size('64k') == 65536 and parse_size('2m') == 2 * 1024 ** 2
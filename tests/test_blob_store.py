@@ -0,0 +1,50 @@
+"""Content-addressed blob store tests."""
+
+import hashlib
+
+from BaseWatcher.blob_store import BlobStore
+
+
+def test_content_is_stored_once_under_its_hash(tmp_path):
+    store = BlobStore(tmp_path / 'vault')
+    first = tmp_path / 'a.txt'
+    first.write_bytes(b'same bytes\n')
+    second = tmp_path / 'b.txt'
+    second.write_bytes(b'same bytes\n')
+    digest = hashlib.sha256(b'same bytes\n').hexdigest()
+
+    blob, method = store.put_file(first, digest)
+    assert method == 'copy'
+    assert blob == store.root / digest[:2] / digest[2:]
+    assert store.relative(blob) == f'.blobs/{digest[:2]}/{digest[2:]}'
+
+    again, method = store.put_file(second, digest)
+    assert again == blob and method is None
+    assert [p for p in store.root.rglob('*') if p.is_file()] == [blob]
+
+
+def test_prefixed_digests_get_their_own_subtree(tmp_path):
+    store = BlobStore(tmp_path)
+    assert store.path_for('blake2b:abcdef') == tmp_path / '.blobs' / 'blake2b' / 'ab' / 'cdef'
+
+
+def test_identical_drops_share_one_blob(tmp_path, make_fs_watcher):
+    drop = tmp_path / 'drop'
+    drop.mkdir()
+    (drop / 'report.pdf').write_bytes(b'%PDF-1.4 same\n')
+    (drop / 'report copy.pdf').write_bytes(b'%PDF-1.4 same\n')
+
+    watcher = make_fs_watcher()
+    watcher.run_once()
+
+    assert len(list(watcher.needs_action.glob('FILE_*.md'))) == 1
+    assert len([p for p in watcher.blob_store.root.rglob('*') if p.is_file()]) == 1
+
+
+def test_other_watchers_have_no_blob_store(tmp_path, make_gmail_watcher):
+    from benchmarks.fakes import FakeGmailService
+
+    watcher = make_gmail_watcher(FakeGmailService(1))
+    watcher.run_once()
+    assert not hasattr(watcher, 'blob_store')
+    assert not (tmp_path / 'vault' / '.blobs').exists()
@@ -0,0 +1,56 @@
+"""WriteDebouncer tests."""
+
+import threading
+import time
+
+from FilesystemWatcher.debouncer import WriteDebouncer
+
+
+def test_a_growing_file_is_released_once_after_it_settles(tmp_path):
+    released = []
+    ready = threading.Event()
+
+    def on_ready(path):
+        released.append((path, path.stat().st_size))
+        ready.set()
+
+    debouncer = WriteDebouncer(on_ready, settle_seconds=0.3)
+    debouncer.start()
+    path = tmp_path / 'big.bin'
+    try:
+        with path.open('wb') as f:
+            for _ in range(8):
+                f.write(b'x' * 1024)
+                f.flush()
+                debouncer.touch(path)
+                time.sleep(0.1)
+        assert released == []
+
+        assert ready.wait(5)
+        time.sleep(0.5)
+    finally:
+        debouncer.stop()
+
+    assert released == [(path, 8 * 1024)]
+    assert len(debouncer) == 0
+
+
+def test_forgotten_and_vanished_paths_are_never_released(tmp_path):
+    released = []
+    debouncer = WriteDebouncer(released.append, settle_seconds=0.1)
+    moved = tmp_path / 'moved.txt'
+    moved.write_text('moved away\n')
+    deleted = tmp_path / 'deleted.txt'
+    deleted.write_text('deleted\n')
+
+    debouncer.start()
+    try:
+        debouncer.touch(moved)
+        debouncer.touch(deleted)
+        debouncer.forget(moved)
+        deleted.unlink()
+        time.sleep(0.5)
+    finally:
+        assert debouncer.stop() == 0
+
+    assert released == []
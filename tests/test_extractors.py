@@ -0,0 +1,37 @@
+"""Metadata extractor pool and profiler limit tests."""
+
+import pytest
+
+from FilesystemWatcher.extractors import ExtractorPool, load_plugins, profiler
+
+
+@pytest.fixture(scope='module')
+def pool():
+    assert load_plugins(['tests.slow_extractor']) == []
+    pool = ExtractorPool(workers=1, timeout=5)
+    yield pool
+    pool.close()
+
+
+def test_slow_extractor_times_out_and_the_pool_recovers(tmp_path, pool):
+    path = tmp_path / 'data.bin'
+    path.write_bytes(b'12345')
+
+    result = pool.extract(path, 'application/x-test-slow')
+    assert result['error'].startswith('timed out after 0.5s')
+
+    assert pool.extract(path, 'application/x-test-size') == {'bytes': 5}
+    assert pool.extract(path, 'application/x-unknown') is None
+
+
+def test_csv_profile_stops_at_its_deadline(tmp_path, monkeypatch):
+    path = tmp_path / 'big.csv'
+    path.write_text('id,amount\n' + ''.join(f'{i},{i * 1.5}\n' for i in range(25_000)))
+
+    monkeypatch.setattr(profiler, 'PROFILE_TIMEOUT', 0)
+    facts = profiler.delimited(str(path))
+
+    assert facts['partial_scan'] is True
+    assert facts['rows'] == profiler.BATCH_ROWS
+    assert [c['name'] for c in facts['columns']] == ['id', 'amount']
+
@@ -0,0 +1,29 @@
+"""FileHasher tests."""
+
+import hashlib
+import os
+
+from FilesystemWatcher.file_hasher import FileHasher
+
+
+def test_chunked_mmap_and_parallel_hashes_agree(tmp_path):
+    data = os.urandom(300_000)
+    path = tmp_path / 'data.bin'
+    path.write_bytes(data)
+    expected = hashlib.sha256(data).hexdigest()
+
+    assert FileHasher(chunk_size=4096).hash_file(path) == expected
+    assert FileHasher(mmap_threshold=1).hash_file(path) == expected
+
+    paths = [tmp_path / f'{i}.bin' for i in range(5)]
+    for i, other in enumerate(paths):
+        other.write_bytes(data[i:])
+    hasher = FileHasher(workers=3)
+    digests = hasher.hash_many(paths + [tmp_path / 'missing.bin'])
+    hasher.close()
+    assert digests == {other: hashlib.sha256(data[i:]).hexdigest() for i, other in enumerate(paths)}
+
+
+def test_other_algorithms_are_prefixed():
+    assert FileHasher('blake2b').format_digest('ab12') == 'blake2b:ab12'
+    assert FileHasher('sha256').format_digest('ab12') == 'ab12'
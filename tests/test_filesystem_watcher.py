@@ -0,0 +1,106 @@
+"""FilesystemWatcher ingestion tests (polling mode)."""
+
+import logging
+import os
+import time
+import zipfile
+
+
+def test_archive_members_ingested_in_move_mode(tmp_path, monkeypatch, make_fs_watcher):
+    monkeypatch.setenv('FILESYSTEM_INGEST_MODE', 'move')
+    monkeypatch.setenv('FILESYSTEM_ARCHIVE_EXTRACT', '.txt')
+    drop = tmp_path / 'drop'
+    drop.mkdir()
+    with zipfile.ZipFile(drop / 'bundle.zip', 'w') as archive:
+        archive.writestr('notes/a.txt', 'first member\n')
+        archive.writestr('b.txt', 'second member\n')
+
+    watcher = make_fs_watcher()
+    assert watcher.run_once() == 1
+
+    # The archive was moved into the blob store, members still came out
+    assert not (drop / 'bundle.zip').exists()
+    actions = {p.name: p.read_text(encoding='utf-8') for p in watcher.needs_action.glob('FILE_*.md')}
+    assert len(actions) == 3
+    parent = next(text for name, text in actions.items() if name.startswith('FILE_bundle_'))
+    assert '## Ingested Members' in parent
+    assert '`notes/a.txt`' in parent and '`b.txt`' in parent
+    children = [text for name, text in actions.items() if not name.startswith('FILE_bundle_')]
+    assert all('archive_member:' in text for text in children)
+
+
+def test_hidden_paths_are_not_candidates(tmp_path, make_fs_watcher):
+    from FilesystemWatcher.main import DropFolderHandler
+
+    watcher = make_fs_watcher()
+    handler = DropFolderHandler(watcher)
+    drop = tmp_path / 'drop'
+
+    assert handler._is_candidate(drop / 'invoice.pdf')
+    assert handler._is_candidate(drop / 'project' / 'invoice.pdf')
+    assert not handler._is_candidate(drop / '.invoice.pdf')
+    assert not handler._is_candidate(drop / 'invoice.pdf.tmp')
+    assert not handler._is_candidate(drop / '.extract-abc' / 'member.txt')
+    assert not handler._is_candidate(drop / 'project' / '.git' / 'config')
+    assert not handler._is_candidate(tmp_path / 'elsewhere.pdf')
+
+
+def test_archive_members_are_staged_outside_the_drop_folder(tmp_path, monkeypatch, make_fs_watcher):
+    monkeypatch.setenv('FILESYSTEM_ARCHIVE_EXTRACT', '.txt')
+    drop = tmp_path / 'drop'
+    drop.mkdir()
+    with zipfile.ZipFile(drop / 'bundle.zip', 'w') as archive:
+        archive.writestr('a.txt', 'member\n')
+
+    watcher = make_fs_watcher()
+    staged = []
+    process_file = watcher.process_file
+
+    def record(filepath, parent=None):
+        if parent:
+            staged.append(filepath)
+        return process_file(filepath, parent)
+
+    monkeypatch.setattr(watcher, 'process_file', record)
+    assert watcher.run_once() == 1
+
+    assert len(staged) == 1
+    assert drop not in staged[0].parents
+    assert watcher.blob_store.root in staged[0].parents
+    assert not any(drop.rglob('.extract-*'))
+
+
+def test_catch_up_waits_for_files_still_settling(tmp_path, make_fs_watcher):
+    drop = tmp_path / 'drop'
+    drop.mkdir()
+    (drop / 'old.txt').write_text('dropped while stopped\n')
+    os.utime(drop / 'old.txt', (time.time() - 60, time.time() - 60))
+    # Last written just before startup: no event will ever report it
+    (drop / 'fresh.txt').write_text('still settling at startup\n')
+
+    watcher = make_fs_watcher()
+    watcher.snapshot.settle_seconds = 0.3
+    watcher._catch_up()
+
+    assert drop / 'old.txt' in watcher.work_queue
+    assert drop / 'fresh.txt' in watcher.work_queue
+    assert not watcher.snapshot.unsettled()
+
+
+def test_each_drop_logs_one_created_action_file(tmp_path, make_fs_watcher, caplog):
+    drop = tmp_path / 'drop'
+    drop.mkdir()
+    (drop / 'ledger.csv').write_text('date,amount,note\n2024-01-02,10.5,a\n2024-01-03,,b\n2024-01-05,7,c\n')
+
+    watcher = make_fs_watcher()
+    watcher.logger.setLevel(logging.INFO)
+    assert watcher.run_once() == 1
+
+    created = [r.getMessage() for r in caplog.records if r.getMessage().startswith('Created action file')]
+    action = next(watcher.needs_action.glob('FILE_ledger_*.md'))
+    assert created == [f'Created action file: {action}']
+
+    # The streaming profile lands in the front matter
+    text = action.read_text(encoding='utf-8')
+    assert 'rows: 3' in text
+    assert 'name: "amount"' in text and 'nulls: 1' in text
@@ -0,0 +1,64 @@
+"""Batch fetch retry tests against benchmarks.fakes.FakeGmailService."""
+
+import pytest
+
+from benchmarks.fakes import FakeGmailService, FakeHttpError
+from GmailWatcher import gmail_api
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(gmail_api, 'BACKOFF_BASE', 0.0)
+
+
+def test_throttled_calls_are_retried_in_a_smaller_batch():
+    service = FakeGmailService(10)
+    ids = list(service.messages)
+    service.throttle(ids[:3], times=2)
+
+    messages = gmail_api.fetch_metadata(service, ids, max_retries=4)
+
+    assert [m['id'] for m in messages] == ids
+    # One full batch, then two retries of the three throttled calls only
+    assert service.api_calls == 3
+    assert gmail_api.headers_of(messages[0])['To'] == 'me@example.com'
+
+
+def test_missing_messages_are_left_out():
+    service = FakeGmailService(4)
+    ids = list(service.messages)
+
+    messages = gmail_api.fetch_metadata(service, [ids[0], 'gone', ids[1], ids[0]])
+
+    assert [m['id'] for m in messages] == ids[:2]
+    assert service.api_calls == 1
+
+
+def test_gives_up_after_max_retries():
+    service = FakeGmailService(5)
+    ids = list(service.messages)
+    service.throttle(ids[:1], times=10)
+
+    with pytest.raises(FakeHttpError) as raised:
+        gmail_api.fetch_metadata(service, ids, max_retries=2)
+
+    assert gmail_api.http_status(raised.value) == 429
+    assert service.api_calls == 3
+
+
+def test_batches_are_fetched_lazily():
+    service = FakeGmailService(25)
+    batches = gmail_api.iter_metadata_batches(service, iter(service.messages), batch_size=10)
+
+    assert [m['id'] for m in next(batches)] == list(service.messages)[:10]
+    assert service.api_calls == 1
+    assert [len(batch) for batch in batches] == [10, 5]
+    assert service.api_calls == 3
+
+
+def test_fields_mask_trims_the_response():
+    service = FakeGmailService(1)
+    message = gmail_api.fetch_metadata(service, list(service.messages))[0]
+
+    assert set(message) == {'id', 'threadId', 'snippet', 'payload'}
+    assert set(gmail_api.headers_of(message)) == set(gmail_api.METADATA_HEADERS)
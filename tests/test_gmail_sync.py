@@ -0,0 +1,127 @@
+"""GmailWatcher sync tests against benchmarks.fakes.FakeGmailService."""
+
+import re
+
+from benchmarks.fakes import FakeGmailService
+
+
+def action_ids(watcher):
+    """Message IDs that have an action file."""
+    return {
+        re.search(r'^message_id: (\S+)$', p.read_text(encoding='utf-8'), re.M).group(1)
+        for p in watcher.needs_action.glob('EMAIL_*.md')
+    }
+
+
+def test_dry_run_leaves_sync_state_untouched(make_gmail_watcher):
+    service = FakeGmailService(5)
+    dry = make_gmail_watcher(service, dry_run=True)
+    assert dry.run_once() == 5
+    assert not dry.sync_state.path.exists()
+
+    service.deliver(2)
+    live = make_gmail_watcher(service)
+    assert live.run_once() == 7
+    assert action_ids(live) == set(service.messages)
+
+
+def test_deferred_messages_survive_a_full_holding_queue_and_restart(make_gmail_watcher, monkeypatch):
+    monkeypatch.setenv('GMAIL_BACKLOG_THRESHOLD', '3')
+    monkeypatch.setenv('BACKLOG_ADMIT_PRIORITIES', 'critical')
+    monkeypatch.setenv('BACKLOG_HOLD_MAX', '2')
+    service = FakeGmailService(12)
+
+    watcher = make_gmail_watcher(service)
+    backlog = [watcher.needs_action / f'PENDING_{i}.md' for i in range(3)]
+    for path in backlog:
+        path.write_text('pending\n', encoding='utf-8')
+
+    watcher.run_once()
+    deferred = watcher.sync_state.get('deferred')
+    assert len(deferred) > len(watcher.holding) == 2
+    assert not set(deferred) & action_ids(watcher)
+
+    # Restart with room in the backlog: dropped and held messages come back
+    monkeypatch.setenv('GMAIL_BACKLOG_THRESHOLD', '100')
+    restarted = make_gmail_watcher(service)
+    restarted.run_once()
+    assert action_ids(restarted) == set(service.messages)
+
+    restarted.run_once()
+    assert restarted.sync_state.get('deferred') is None
+
+
+
+def test_expired_history_falls_back_to_a_full_sync(make_gmail_watcher):
+    service = FakeGmailService(5)
+    watcher = make_gmail_watcher(service)
+    assert watcher.run_once() == 5
+
+    service.deliver(3)
+    service.expire_history()
+    assert watcher.run_once() == 3
+    assert action_ids(watcher) == set(service.messages)
+    assert watcher.sync_state.get('history_id') == str(service.history_id)
+    assert watcher.sync_state.get('full_sync') is None
+
+    # The new cursor works: an idle mailbox costs one history request
+    calls = service.api_calls
+    assert watcher.run_once() == 0
+    assert service.api_calls == calls + 1
+
+
+def test_history_delta_skips_messages_read_before_the_sync(make_gmail_watcher):
+    service = FakeGmailService(3)
+    watcher = make_gmail_watcher(service)
+    assert watcher.run_once() == 3
+
+    added = service.deliver(4)
+    service.mark_read(added[:2])
+    assert watcher.run_once() == 2
+    assert action_ids(watcher) == set(service.unread)
+
+
+def test_full_sync_resumes_from_its_page_token_across_restarts(make_gmail_watcher):
+    service = FakeGmailService(25)
+
+    watcher = make_gmail_watcher(service, max_per_cycle=10)
+    assert watcher.run_once() == 10
+    assert watcher.sync_state.get('full_sync')['page_token']
+    assert watcher.sync_state.get('history_id') is None
+
+    written = []
+    for _ in range(3):
+        restarted = make_gmail_watcher(service, max_per_cycle=10)
+        written.append(restarted.run_once())
+    assert written == [10, 5, 0]
+    assert action_ids(restarted) == set(service.messages)
+    assert restarted.sync_state.get('full_sync') is None
+    assert restarted.sync_state.get('history_id')
+
+
+def test_history_delta_over_the_cap_stays_pending(make_gmail_watcher):
+    service = FakeGmailService(2)
+    watcher = make_gmail_watcher(service, max_per_cycle=10)
+    assert watcher.run_once() == 2
+
+    first = service.deliver(15)
+    assert watcher.run_once() == 10
+    assert watcher.sync_state.get('pending') == first[10:]
+
+    # Later arrivals queue behind the saved remainder
+    second = service.deliver(3)
+    restarted = make_gmail_watcher(service, max_per_cycle=10)
+    assert restarted.run_once() == 8
+    assert restarted.sync_state.get('pending') is None
+    assert action_ids(restarted) == set(service.messages)
+    assert set(first + second) <= action_ids(restarted)
+
+
+def test_default_cap_is_one_batch_per_cycle(make_gmail_watcher, monkeypatch):
+    monkeypatch.delenv('GMAIL_MAX_PER_CYCLE', raising=False)
+    service = FakeGmailService(150)
+
+    watcher = make_gmail_watcher(service)
+    assert watcher.max_per_cycle == 100
+    assert watcher.run_once() == 100
+    assert watcher.run_once() == 50
@@ -0,0 +1,46 @@
+"""HashCache tests."""
+
+import os
+
+from FilesystemWatcher.file_hasher import FileHasher
+from FilesystemWatcher.hash_cache import HashCache
+
+
+def test_cache_rehashes_only_changed_files_and_survives_a_restart(tmp_path):
+    cache_path = tmp_path / 'cache.json'
+    path = tmp_path / 'a.txt'
+    path.write_text('one\n')
+
+    cache = HashCache(cache_path, FileHasher())
+    first = cache.get(path)
+    assert cache.get(path) == first and (cache.hits, cache.misses) == (1, 1)
+    cache.save()
+
+    restarted = HashCache(cache_path, FileHasher())
+    assert restarted.get(path) == first and restarted.misses == 0
+
+    path.write_text('changed\n')
+    assert restarted.get(path) != first and restarted.misses == 1
+
+    # Another algorithm starts afresh
+    restarted.save()
+    other = HashCache(cache_path, FileHasher('blake2b'))
+    other.get(path)
+    assert other.misses == 1
+
+
+def test_get_many_skips_vanished_files_and_prune_forgets_them(tmp_path):
+    paths = [tmp_path / f'{i}.txt' for i in range(3)]
+    for i, path in enumerate(paths):
+        path.write_text(str(i))
+    files = [(path, os.stat(path)) for path in paths]
+    paths[2].unlink()
+
+    cache = HashCache(tmp_path / 'cache.json', FileHasher())
+    assert set(cache.get_many(files)) == set(paths[:2])
+    assert set(cache.get_many(files[:2])) == set(paths[:2])
+    assert (cache.hits, cache.misses) == (2, 3)
+
+    assert cache.prune(paths[1:2]) == 1
+    cache.get_many(files[:2])
+    assert cache.misses == 4
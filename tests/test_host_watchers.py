@@ -0,0 +1,41 @@
+"""Orchestrator host mode tests."""
+
+import logging
+
+from BaseWatcher import WatcherScheduler
+from Orchestrator.helpers import host_watchers
+from Orchestrator.main import Orchestrator
+
+
+def test_watchers_that_fail_to_load_are_skipped(tmp_path, monkeypatch, caplog):
+    monkeypatch.setattr(host_watchers, 'WATCHER_CLASSES', {
+        'counting': ('tests.test_scheduler', 'CountingWatcher'),
+        'broken': ('tests.no_such_watcher', 'BrokenWatcher'),
+    })
+    hosted = []
+
+    async def run(scheduler):
+        hosted.extend(scheduler.watchers)
+
+    monkeypatch.setattr(WatcherScheduler, 'run', run)
+
+    orchestrator = Orchestrator(vault_path=str(tmp_path), dry_run=True)
+    monkeypatch.setattr(orchestrator, 'update_dashboard', lambda: None)
+
+    with caplog.at_level(logging.ERROR, logger='Orchestrator'):
+        assert orchestrator.host_watchers(['broken', 'unknown', 'counting']) == 1
+
+    assert [type(watcher).__name__ for watcher in hosted] == ['CountingWatcher']
+    assert hosted[0].dry_run
+    errors = [record.getMessage() for record in caplog.records if record.levelno == logging.ERROR]
+    assert errors[0].startswith('Could not load broken watcher')
+    assert errors[1] == 'Unknown watcher: unknown'
+
+
+def test_nothing_is_hosted_when_no_watcher_loads(tmp_path, monkeypatch):
+    monkeypatch.setattr(host_watchers, 'WATCHER_CLASSES', {
+        'broken': ('tests.no_such_watcher', 'BrokenWatcher'),
+    })
+    orchestrator = Orchestrator(vault_path=str(tmp_path), dry_run=True)
+
+    assert orchestrator.host_watchers(['broken']) == 0
@@ -0,0 +1,39 @@
+"""Ingestion strategy tests."""
+
+import pytest
+
+from FilesystemWatcher.ingest import INGEST_MODES, ingest_file
+
+
+@pytest.mark.parametrize('mode', ['reflink', 'copy'])
+def test_copy_like_modes_leave_an_independent_copy(tmp_path, mode):
+    src = tmp_path / 'drop.txt'
+    src.write_bytes(b'original\n')
+    dest = tmp_path / 'blob'
+    dest.write_bytes(b'stale partial write')
+
+    assert ingest_file(src, dest, mode) in ('reflink', 'copy')
+    assert dest.read_bytes() == b'original\n'
+
+    # Editing the drop afterwards never reaches the stored copy
+    src.write_bytes(b'edited\n')
+    assert dest.read_bytes() == b'original\n'
+
+
+def test_move_empties_the_drop(tmp_path):
+    src = tmp_path / 'drop.txt'
+    src.write_bytes(b'data\n')
+    dest = tmp_path / 'blob'
+
+    assert ingest_file(src, dest, 'move') == 'move'
+    assert not src.exists() and dest.read_bytes() == b'data\n'
+
+
+def test_hardlink_is_not_a_mode(tmp_path):
+    src = tmp_path / 'drop.txt'
+    src.write_bytes(b'data\n')
+
+    assert 'hardlink' not in INGEST_MODES
+    with pytest.raises(ValueError):
+        ingest_file(src, tmp_path / 'blob', 'hardlink')
+    assert ingest_file(src, tmp_path / 'blob') == 'copy'
@@ -0,0 +1,57 @@
+"""InotifyObserver tests (Linux only)."""
+
+import os
+import queue
+
+import pytest
+
+from FilesystemWatcher.inotify import INOTIFY_AVAILABLE, InotifyObserver
+
+pytestmark = pytest.mark.skipif(not INOTIFY_AVAILABLE, reason='inotify is Linux only')
+
+
+@pytest.fixture
+def observe(tmp_path):
+    """Watch tmp_path/drop and collect the completed files it reports."""
+    root = tmp_path / 'drop'
+    root.mkdir()
+    files: 'queue.Queue' = queue.Queue()
+    observer = InotifyObserver(root, files.put)
+    observer.start()
+
+    def reported(count):
+        return sorted(files.get(timeout=5).relative_to(root).as_posix() for _ in range(count))
+
+    yield root, reported, files
+    observer.stop()
+    observer.join()
+
+
+def test_files_are_reported_once_complete(observe):
+    root, reported, files = observe
+
+    with (root / 'report.pdf').open('wb') as f:
+        f.write(b'%PDF')
+        f.flush()
+        with pytest.raises(queue.Empty):
+            files.get(timeout=0.2)
+    (root / 'upload.csv.tmp').write_text('a,b\n')
+    os.rename(root / 'upload.csv.tmp', root / 'upload.csv')
+    (root / '.partial').write_text('hidden\n')
+
+    assert reported(2) == ['report.pdf', 'upload.csv']
+
+
+def test_new_subdirectories_are_watched_and_their_files_reported(observe, tmp_path):
+    root, reported, files = observe
+
+    # A folder moved in already holds files; they raced the new watch
+    staged = tmp_path / 'project'
+    (staged / 'docs').mkdir(parents=True)
+    (staged / 'docs' / 'spec.md').write_text('# spec\n')
+    os.rename(staged, root / 'project')
+    assert reported(1) == ['project/docs/spec.md']
+
+    (root / 'project' / 'docs' / 'later.md').write_text('# later\n')
+    assert reported(1) == ['project/docs/later.md']
+    assert files.empty()
@@ -0,0 +1,32 @@
+"""Lazy import tests (timing budgets are left to scripts/import_budget.py)."""
+
+import subprocess
+import sys
+
+import pytest
+
+from scripts.import_budget import ENTRY_POINTS, REPO_ROOT, measure
+
+
+@pytest.mark.parametrize('name', list(ENTRY_POINTS))
+def test_entry_points_leave_heavy_stacks_unloaded(name):
+    statement, _, forbidden = ENTRY_POINTS[name]
+    _, modules, error = measure(statement)
+    if error:
+        pytest.skip(f"{name} cannot be imported here: {error.splitlines()[-1]}")
+
+    loaded = {module for _, module in modules}
+    assert [module for module in forbidden if module in loaded] == []
+
+
+def test_base_watcher_loads_asyncio_only_for_the_async_classes():
+    code = (
+        'import sys, BaseWatcher; '
+        'print("asyncio" in sys.modules, "http.server" in sys.modules); '
+        'BaseWatcher.WatcherScheduler; '
+        'print("asyncio" in sys.modules)'
+    )
+    proc = subprocess.run(
+        [sys.executable, '-c', code], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+    )
+    assert proc.stdout.split() == ['False', 'False', 'True']
@@ -0,0 +1,33 @@
+"""Prometheus exposition tests."""
+
+from BaseWatcher.metrics import COUNTERS, GAUGES, HISTOGRAMS, get_metrics, render_prometheus
+
+
+def test_each_family_is_contiguous_across_watchers():
+    # Host mode: several watchers share one registry and one endpoint
+    for name in ('metrics_test_a', 'metrics_test_b'):
+        metrics = get_metrics(name)
+        metrics.inc('cycles')
+        metrics.set_gauge('backlog', 3)
+        metrics.observe('write_duration_seconds', 0.02)
+
+    lines = render_prometheus().splitlines()
+    families = [line.split()[2] for line in lines if line.startswith('# HELP ')]
+    assert len(families) == len(COUNTERS) + len(GAUGES) + len(HISTOGRAMS)
+
+    family = None
+    seen = []
+    for line in lines:
+        if line.startswith('# HELP '):
+            family = line.split()[2]
+            assert family not in seen
+            seen.append(family)
+        elif line.startswith('# TYPE '):
+            assert line.split()[2] == family
+        else:
+            name = line.split('{')[0]
+            assert name in (family, f'{family}_bucket', f'{family}_sum', f'{family}_count')
+
+    assert 'watcher_cycles_total{watcher="metrics_test_a"} 1' in lines
+    assert 'watcher_backlog{watcher="metrics_test_b"} 3' in lines
+    assert 'watcher_write_duration_seconds_count{watcher="metrics_test_b"} 1' in lines
@@ -0,0 +1,29 @@
+"""PollSchedule bound tests."""
+
+import pytest
+
+from BaseWatcher.poll_schedule import PollSchedule
+
+
+def test_derived_min_is_clamped_to_an_explicit_max():
+    # --max-interval 10 with the default 120s interval
+    schedule = PollSchedule(120, max_interval=10, adaptive=True)
+    assert schedule.min_interval == 10 and schedule.max_interval == 10
+    assert schedule.current_interval == 10
+    assert schedule.next_delay(0) == 10
+
+
+def test_derived_max_is_raised_to_an_explicit_min():
+    schedule = PollSchedule(10, min_interval=200)
+    assert schedule.min_interval == 200 and schedule.max_interval == 200
+
+
+def test_conflicting_explicit_bounds_are_rejected():
+    with pytest.raises(ValueError):
+        PollSchedule(60, min_interval=30, max_interval=10)
+
+
+def test_env_bound_is_clamped_too(monkeypatch):
+    monkeypatch.setenv('TEST_MAX_INTERVAL', '10')
+    schedule = PollSchedule.from_env('TEST', 120)
+    assert schedule.min_interval == 10 and schedule.max_interval == 10
@@ -0,0 +1,46 @@
+"""PriorityClassifier matching tests."""
+
+import pytest
+
+from BaseWatcher.priority_classifier import DEFAULT_RULES, PriorityClassifier
+
+
+@pytest.fixture(scope='module')
+def classifier():
+    return PriorityClassifier(DEFAULT_RULES)
+
+
+@pytest.mark.parametrize('text, priority', [
+    # File names: underscores, digits and dots separate words
+    ('urgent_invoice.pdf', 'critical'),
+    ('Invoice_2024-03.pdf', 'high'),
+    ('report_final_v2.docx', 'normal'),
+    ('newsletter2024.html', 'low'),
+    # Plurals and compounds matched before the classifier was compiled
+    ('Two invoices attached', 'high'),
+    ('Payments received', 'high'),
+    ('Your account is overdue', 'high'),
+    ('Weekly newsletters', 'low'),
+    # Whole words only
+    ('A helpful reminder', 'normal'),
+    ('The procedure changed', 'normal'),
+    ('', 'normal'),
+])
+def test_classify(classifier, text, priority):
+    assert classifier.classify(text).priority == priority
+
+
+def test_matches_report_the_rule_term(classifier):
+    result = classifier.classify('URGENT: invoices and payment_due.txt')
+    assert result.priority == 'critical'
+    assert result.matches == ['urgent', 'invoice', 'payment', 'due']
+
+
+def test_batch_agrees_with_single_texts(classifier):
+    texts = ['urgent_invoice.pdf', 'nothing here', 'Invoice_2024-03.pdf', 'weekly newsletters', '']
+    assert classifier.classify_batch(texts) == [classifier.classify(text) for text in texts]
+
+
+def test_watch_terms_are_reported_without_priority(classifier):
+    result = classifier.with_terms(['project x']).classify('notes_for_project x.txt')
+    assert result == ('normal', ['project x'])
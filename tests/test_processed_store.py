@@ -0,0 +1,57 @@
+"""ProcessedStore crash recovery tests."""
+
+import json
+
+from BaseWatcher.processed_store import ProcessedStore
+
+
+def test_torn_final_line_is_cut_before_appending(tmp_path):
+    path = tmp_path / 'processed.log'
+    store = ProcessedStore(path)
+    store.mark_many(['a', 'b'])
+    store.close()
+
+    # A crash in the middle of appending 'b'
+    data = path.read_bytes()
+    path.write_bytes(data[:-6])
+
+    store = ProcessedStore(path)
+    assert store.seen('a') and not store.seen('b')
+    store.mark('c')
+    store.close()
+
+    lines = path.read_text(encoding='utf-8').splitlines()
+    assert [json.loads(line)[1] for line in lines] == ['a', 'c']
+    reloaded = ProcessedStore(path)
+    assert reloaded.seen('a') and reloaded.seen('c') and not reloaded.seen('b')
+    reloaded.close()
+
+
+def test_whole_record_missing_its_newline_is_kept(tmp_path):
+    path = tmp_path / 'processed.log'
+    store = ProcessedStore(path)
+    store.mark('a')
+    store.close()
+    path.write_bytes(path.read_bytes().rstrip(b'\n'))
+
+    store = ProcessedStore(path)
+    store.mark('b')
+    store.close()
+
+    reloaded = ProcessedStore(path)
+    assert reloaded.seen('a') and reloaded.seen('b')
+    reloaded.close()
+
+
+def test_log_with_only_a_torn_line_starts_empty(tmp_path):
+    path = tmp_path / 'processed.log'
+    path.write_text('[1792201441.6, "a', encoding='utf-8')
+
+    store = ProcessedStore(path)
+    assert len(store) == 0
+    store.mark('b')
+    store.close()
+
+    reloaded = ProcessedStore(path)
+    assert reloaded.seen('b')
+    reloaded.close()
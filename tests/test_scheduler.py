@@ -0,0 +1,103 @@
+"""WatcherScheduler tests."""
+
+import asyncio
+
+from BaseWatcher.async_base_watcher import AsyncBaseWatcher
+from BaseWatcher.base_watcher import BaseWatcher
+from BaseWatcher.scheduler import WatcherScheduler
+
+
+class FlakyWatcher(BaseWatcher):
+    """Blocking watcher whose first few setups fail."""
+
+    WATCHER_NAME = 'flaky'
+
+    def __init__(self, vault_path, failures):
+        super().__init__(vault_path, check_interval=0, adaptive=False)
+        self.failures = failures
+        self.setups = 0
+        self.cycles = 0
+
+    def setup(self):
+        self.setups += 1
+        if self.setups <= self.failures:
+            raise OSError('source unavailable')
+
+    def check_for_updates(self):
+        self.cycles += 1
+        return []
+
+    def create_action_file(self, item):
+        return None
+
+
+class CountingWatcher(AsyncBaseWatcher):
+    """Healthy async watcher that only counts its cycles."""
+
+    WATCHER_NAME = 'counting'
+
+    def __init__(self, vault_path):
+        super().__init__(vault_path, check_interval=0, adaptive=False)
+        self.cycles = 0
+
+    async def check_for_updates(self):
+        self.cycles += 1
+        return []
+
+    async def create_action_file(self, item):
+        return None
+
+
+def run_until(scheduler, done, timeout=10):
+    """Run the scheduler until done() holds, then cancel it."""
+    async def main():
+        task = asyncio.create_task(scheduler.run())
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while not done() and loop.time() < deadline:
+            await asyncio.sleep(0.01)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    asyncio.run(main())
+
+
+def test_crashing_watcher_restarts_with_backoff_while_others_run(tmp_path, monkeypatch, quiet):
+    delays = []
+    sleep = asyncio.sleep
+
+    async def record_sleep(delay, *args):
+        if delay >= WatcherScheduler.RESTART_BASE_DELAY:
+            delays.append(delay)
+        await sleep(0)
+
+    monkeypatch.setattr(asyncio, 'sleep', record_sleep)
+
+    flaky = quiet(FlakyWatcher(str(tmp_path), failures=3))
+    counting = quiet(CountingWatcher(str(tmp_path)))
+    scheduler = WatcherScheduler()
+    scheduler.logger.disabled = True
+    scheduler.add(flaky)
+    scheduler.add(counting)
+
+    run_until(scheduler, lambda: flaky.cycles >= 2)
+
+    assert flaky.setups == 4 and flaky.cycles >= 2
+    assert delays == [5.0, 10.0, 20.0]
+    assert scheduler.restarts == {'FlakyWatcher': 3}
+    assert counting.cycles > 0
+
+
+def test_repeated_failed_cycles_tear_the_watcher_down(tmp_path, monkeypatch, quiet):
+    watcher = quiet(FlakyWatcher(str(tmp_path), failures=0))
+    monkeypatch.setattr(watcher, 'check_for_updates', lambda: 1 / 0)
+    teardowns = []
+    monkeypatch.setattr(watcher, 'teardown', lambda: teardowns.append(True))
+
+    scheduler = WatcherScheduler(restart=False, max_consecutive_errors=3)
+    scheduler.logger.disabled = True
+    scheduler.add(watcher)
+    asyncio.run(asyncio.wait_for(scheduler.run(), 10))
+
+    assert watcher.metrics.counters['errors'] == 3
+    assert teardowns == [True]
@@ -0,0 +1,66 @@
+"""DirectorySnapshot tests."""
+
+import os
+import shutil
+import time
+
+from FilesystemWatcher.snapshot import DirectorySnapshot
+
+
+def test_scans_report_only_what_changed_below_the_root(tmp_path):
+    (tmp_path / 'a' / 'b').mkdir(parents=True)
+    (tmp_path / 'top.txt').write_text('top\n')
+    (tmp_path / 'a' / 'mid.txt').write_text('mid\n')
+    (tmp_path / 'a' / 'b' / 'deep.txt').write_text('deep\n')
+    (tmp_path / '.hidden').mkdir()
+    (tmp_path / '.hidden' / 'skip.txt').write_text('skip\n')
+
+    snapshot = DirectorySnapshot(tmp_path, settle_seconds=0, full_scan_interval=0)
+    changed, removed = snapshot.scan()
+    assert sorted(path.relative_to(tmp_path).as_posix() for path, _ in changed) == [
+        'a/b/deep.txt', 'a/mid.txt', 'top.txt'
+    ]
+    assert removed == [] and len(snapshot) == 3
+    assert snapshot.scan() == ([], [])
+
+    (tmp_path / 'a' / 'b' / 'new.txt').write_text('new\n')
+    (tmp_path / 'top.txt').unlink()
+    changed, removed = snapshot.scan()
+    assert [path for path, _ in changed] == [tmp_path / 'a' / 'b' / 'new.txt']
+    assert removed == [tmp_path / 'top.txt']
+
+    shutil.rmtree(tmp_path / 'a' / 'b')
+    changed, removed = snapshot.scan()
+    assert changed == []
+    assert sorted(removed) == [tmp_path / 'a' / 'b' / 'deep.txt', tmp_path / 'a' / 'b' / 'new.txt']
+    assert sorted(snapshot.paths()) == [tmp_path / 'a' / 'mid.txt']
+
+
+def test_files_still_being_written_are_held_until_they_settle(tmp_path):
+    path = tmp_path / 'upload.bin'
+    path.write_bytes(b'partial')
+
+    snapshot = DirectorySnapshot(tmp_path, settle_seconds=60, full_scan_interval=0)
+    assert snapshot.scan() == ([], [])
+    assert snapshot.unsettled() == [path]
+
+    # The upload finishes; appending does not touch the directory mtime
+    with path.open('ab') as f:
+        f.write(b' and the rest')
+    old = time.time() - 120
+    os.utime(path, (old, old))
+
+    changed, removed = snapshot.scan()
+    assert [(p, stat.st_size) for p, stat in changed] == [(path, len(b'partial and the rest'))]
+    assert removed == [] and snapshot.unsettled() == []
+
+
+def test_a_full_rescan_catches_in_place_edits(tmp_path):
+    path = tmp_path / 'notes.txt'
+    path.write_text('one\n')
+    snapshot = DirectorySnapshot(tmp_path, settle_seconds=0, full_scan_interval=1e-9)
+    snapshot.scan()
+
+    path.write_text('two, longer\n')
+    changed, _ = snapshot.scan()
+    assert [p for p, _ in changed] == [path]
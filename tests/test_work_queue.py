@@ -0,0 +1,44 @@
+"""WorkQueue tests."""
+
+import threading
+from pathlib import Path
+
+from FilesystemWatcher.work_queue import WorkQueue
+
+
+def test_urgent_and_small_files_run_first_and_are_queued_once():
+    processed = []
+    done = threading.Event()
+
+    def handler(path):
+        processed.append(path.name)
+        if len(processed) == 4:
+            done.set()
+
+    work = WorkQueue(handler, workers=1)
+    assert work.put(Path('big.csv'), 'normal', size=10_000_000)
+    assert work.put(Path('small.csv'), 'normal', size=10)
+    assert work.put(Path('tiny.log'), 'low', size=1)
+    assert work.put(Path('invoice.pdf'), 'critical', size=50_000_000)
+    assert not work.put(Path('small.csv'), 'critical', size=10)
+    assert Path('small.csv') in work and len(work) == 4
+
+    work.start()
+    try:
+        assert done.wait(5)
+    finally:
+        work.stop()
+
+    assert processed == ['invoice.pdf', 'small.csv', 'big.csv', 'tiny.log']
+    assert Path('small.csv') not in work
+
+
+def test_a_full_queue_refuses_paths_and_stop_reports_the_waiting_ones():
+    work = WorkQueue(lambda path: None, max_size=2)
+    assert work.put(Path('a'))
+    assert work.put(Path('b'))
+    assert not work.put(Path('c'), timeout=0.01)
+    assert Path('c') not in work
+
+    assert work.stop() == 2
+    assert work.put(Path('a'))